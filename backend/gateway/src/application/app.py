@@ -1,7 +1,7 @@
 from application.routes.account import profile_router
 from application.routes.auth import authentication_router
 from application.routes.customer import address_router
-from application.routes.driver import driver_status_router, driver_location_router, driver_vehicle_router
+from application.routes.driver import driver_status_router, driver_location_router, driver_location_history_router, driver_location_batch_router, driver_location_stream_router, driver_vehicle_router
 from application.routes.order import feedback_router, order_location_router
 from application.routes.restaurant import restaurant_router, menu_router
 from fastapi import APIRouter
@@ -13,6 +13,9 @@ def init_router() -> APIRouter:
     router.include_router(profile_router)
     router.include_router(address_router)
     router.include_router(driver_location_router)
+    router.include_router(driver_location_history_router)
+    router.include_router(driver_location_batch_router)
+    router.include_router(driver_location_stream_router)
     router.include_router(driver_status_router)
     router.include_router(driver_vehicle_router)
     router.include_router(restaurant_router)
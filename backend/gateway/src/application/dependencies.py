@@ -6,6 +6,10 @@ from ftgo_utils.errors import BaseError, ErrorCodes
 
 from application.schemas.user import UserStateSchema
 
+def public_route() -> None:
+    """Marker dependency: routes that declare it are served without authentication."""
+
+
 class AccessManager:
     def __init__(self, allowed_roles: List[Union[str, Enum]]) -> None:
         self.allowed_roles = [role.value if isinstance(role, Enum) else role for role in allowed_roles]
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Request, status, Depends
 
-from application.dependencies import AccessManager
+from application.dependencies import AccessManager, public_route
 from application.exceptions import handle_exception
 from application.schemas.auth.registration import (
         UserAuthCodeSchema, UserIdMixin, LoginSchema, RegistrationSchema, LoggedInUserSchema
@@ -18,7 +18,7 @@ router = APIRouter(
     dependencies=[Depends(AccessManager([Roles.CUSTOMER, Roles.ADMIN, Roles.DRIVER, Roles.RESTAURANT_ADMIN]))],
 )
 
-@router.post("/register", response_model=UserAuthCodeSchema, status_code=status.HTTP_201_CREATED)
+@router.post("/register", response_model=UserAuthCodeSchema, status_code=status.HTTP_201_CREATED, dependencies=[Depends(public_route)])
 async def register(request: Request, request_data: RegistrationSchema):
     try:
         data = request_data.dict()
@@ -39,7 +39,7 @@ async def register(request: Request, request_data: RegistrationSchema):
     except Exception as e:
         await handle_exception(request, e, default_failure_message="User registration failed")
 
-@router.post("/verify", response_model=SuccessResponse)
+@router.post("/verify", response_model=SuccessResponse, dependencies=[Depends(public_route)])
 async def verify_account(request: Request, request_data: UserAuthCodeSchema):
     try:
         data = request_data.dict()
@@ -57,7 +57,7 @@ async def verify_account(request: Request, request_data: UserAuthCodeSchema):
     except Exception as e:
         await handle_exception(request, e, default_failure_message="Account verification failed")
 
-@router.post("/resend_code", response_model=UserAuthCodeSchema)
+@router.post("/resend_code", response_model=UserAuthCodeSchema, dependencies=[Depends(public_route)])
 async def resend_auth_code(request: Request, request_data: UserIdMixin):
     try:
         data = request_data.dict()
@@ -75,7 +75,7 @@ async def resend_auth_code(request: Request, request_data: UserIdMixin):
     except Exception as e:
         await handle_exception(request, e, default_failure_message="Resending auth code failed")
 
-@router.post("/login", response_model=LoggedInUserSchema)
+@router.post("/login", response_model=LoggedInUserSchema, dependencies=[Depends(public_route)])
 async def login(request: Request, request_data: LoginSchema):
     try:
         data = request_data.dict()
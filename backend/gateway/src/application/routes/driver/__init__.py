@@ -1,3 +1,6 @@
 from application.routes.driver.location import router as driver_location_router
 from application.routes.driver.online_status import router as driver_status_router
 from application.routes.driver.vehicle import router as driver_vehicle_router
+from application.routes.driver.location_history import router as driver_location_history_router
+from application.routes.driver.location_batch import router as driver_location_batch_router
+from application.routes.driver.location_stream import router as driver_location_stream_router
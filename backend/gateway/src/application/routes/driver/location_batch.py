@@ -0,0 +1,33 @@
+from application.dependencies import AccessManager
+from application.exceptions import handle_exception
+from application.schemas.driver.location import LocationBatchSchema, LocationBatchResponse
+from fastapi import APIRouter, Request, Depends
+from ftgo_utils.enums import ResponseStatus, Roles
+from ftgo_utils.errors import BaseError, ErrorCodes
+from services.location import LocationService
+
+router = APIRouter(
+    prefix='/location',
+    tags=["driver_location_service"],
+    dependencies=[Depends(AccessManager([Roles.ADMIN]))],
+)
+
+@router.post("/submit/batch", response_model=LocationBatchResponse)
+async def submit_locations_batch(request: Request, request_data: LocationBatchSchema):
+    try:
+        data = request_data.dict()
+        response = await LocationService.submit_locations_batch(data=data)
+        status = response.get('status', ResponseStatus.ERROR.value)
+
+        if status == ResponseStatus.SUCCESS.value:
+            return LocationBatchResponse(results=response.get("results", []))
+
+        raise BaseError(
+            error_code=ErrorCodes.get_error_code(response.get('error_code')),
+            message="Submitting locations batch failed",
+            payload={"driver_ids": [submission.driver_id for submission in request_data.submissions]},
+        )
+    except Exception as e:
+        await handle_exception(
+            request, e, default_failure_message="Submitting locations batch failed"
+        )
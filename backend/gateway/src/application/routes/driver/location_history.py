@@ -0,0 +1,36 @@
+from application.dependencies import AccessManager
+from application.exceptions import handle_exception
+from application.schemas.driver.location import LocationHistoryRequest, LocationHistoryResponse
+from fastapi import APIRouter, Request, Depends
+from ftgo_utils.enums import ResponseStatus, Roles
+from ftgo_utils.errors import BaseError, ErrorCodes
+from services.location import LocationService
+
+router = APIRouter(
+    prefix='/location',
+    tags=["driver_location_service"],
+    dependencies=[Depends(AccessManager([Roles.ADMIN]))],
+)
+
+@router.post("/history", response_model=LocationHistoryResponse)
+async def get_location_history(request: Request, request_data: LocationHistoryRequest):
+    try:
+        data = request_data.dict()
+        response = await LocationService.get_location_history(data=data)
+        status = response.get('status', ResponseStatus.ERROR.value)
+
+        if status == ResponseStatus.SUCCESS.value:
+            return LocationHistoryResponse(
+                points=response.get("points", []),
+                next_cursor=response.get("next_cursor"),
+            )
+
+        raise BaseError(
+            error_code=ErrorCodes.get_error_code(response.get('error_code')),
+            message="Getting location history failed",
+            payload=data,
+        )
+    except Exception as e:
+        await handle_exception(
+            request, e, default_failure_message="Getting location history failed"
+        )
@@ -0,0 +1,103 @@
+import time
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+
+from application import get_logger
+from application.schemas.driver.location import LocationsSchema
+from config import AuthConfig, LocationStreamConfig
+from domain.location_stream import LocationStreamCoalescer
+from ftgo_utils.enums import Roles
+from ftgo_utils.errors import BaseError, ErrorCodes
+from middleware.authentication.auth_middleware import JWTAuthenticationMiddleware, authenticate_token
+
+# WebSocket scopes bypass the HTTP middleware stack, so this router authenticates on its own.
+router = APIRouter(
+    prefix='/location',
+    tags=["driver_location_service"],
+)
+
+def _extract_token(websocket: WebSocket) -> str:
+    if websocket.headers.get('Authorization'):
+        token = JWTAuthenticationMiddleware.extract_token_from_headers(websocket.headers)
+    else:
+        # Browsers cannot set headers on a WebSocket handshake.
+        token = websocket.query_params.get('token')
+    if not token:
+        raise BaseError(
+            error_code=ErrorCodes.MISSING_AUTHORIZATION_HEADER_ERROR,
+            message="Authorization header is missing.",
+        )
+    return token
+
+async def _authenticate_driver(token: str) -> str:
+    user = await authenticate_token(token, AuthConfig())
+    if user.role != Roles.DRIVER.value:
+        raise BaseError(
+            error_code=ErrorCodes.USER_PERMISSION_DENIED_ERROR,
+            message=f"Access forbidden: Only roles of [{Roles.DRIVER.value}] are allowed",
+        )
+    return user.user_id
+
+def _authentication_error_code(e: Exception) -> str:
+    return e.error_code.value if isinstance(e, BaseError) else ErrorCodes.INTERNAL_AUTHENTICATION_ERROR.value
+
+async def _close(websocket: WebSocket, code: int, reason: str = "") -> None:
+    try:
+        await websocket.close(code=code, reason=reason)
+    except RuntimeError:
+        # The socket was already closed by the client.
+        pass
+
+@router.websocket("/stream")
+async def stream_locations(websocket: WebSocket):
+    """Accepts ``{"locations": [...]}`` text frames from an authenticated driver.
+
+    Frames are acknowledged only when invalid; valid ones are coalesced and submitted
+    in batches by ``LocationStreamCoalescer``. The session is validated again every
+    ``session_recheck_interval_s`` while frames arrive, so a logout ends the stream.
+    Binary frames close the socket with 1003 and unexpected errors with 1011.
+    """
+    try:
+        token = _extract_token(websocket)
+        driver_id = await _authenticate_driver(token)
+    except Exception as e:
+        error_code = _authentication_error_code(e)
+        get_logger().error(error_code, payload={"path": websocket.url.path})
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=error_code)
+        return
+
+    await websocket.accept()
+    recheck_interval_s = LocationStreamConfig().session_recheck_interval_s
+    checked_at = time.monotonic()
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            frame = message.get("text")
+            if frame is None:
+                await _close(websocket, status.WS_1003_UNSUPPORTED_DATA, "Only text frames are accepted.")
+                return
+
+            if time.monotonic() - checked_at >= recheck_interval_s:
+                try:
+                    await _authenticate_driver(token)
+                except Exception as e:
+                    error_code = _authentication_error_code(e)
+                    get_logger().info(error_code, payload={"path": websocket.url.path, "driver_id": driver_id})
+                    await _close(websocket, status.WS_1008_POLICY_VIOLATION, error_code)
+                    return
+                checked_at = time.monotonic()
+
+            try:
+                locations = LocationsSchema.model_validate_json(frame)
+            except ValueError:
+                # Covers malformed JSON as well as schema errors.
+                await websocket.send_json({"error": ErrorCodes.INVALID_LOCATION_ERROR.value})
+                continue
+            LocationStreamCoalescer.add(driver_id, locations.dict().get('locations', []))
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        get_logger().exception("Location stream failed", payload={"driver_id": driver_id, "error": str(e)})
+        await _close(websocket, status.WS_1011_INTERNAL_ERROR)
@@ -1,8 +1,43 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 
 from pydantic import Field
 
-from ftgo_utils.schemas import LocationMixin, BaseSchema, LocationPointMixin
+from ftgo_utils.schemas import LocationMixin, BaseSchema, LocationPointMixin, uuid_field
 
 class LocationsSchema(BaseSchema):
     locations: List[LocationMixin] = Field(..., min_items=1)
+
+class LocationHistoryRequest(BaseSchema):
+    driver_id: str = uuid_field()
+    start: float = Field(..., description="Window start as a unix timestamp")
+    end: float = Field(..., description="Window end as a unix timestamp")
+    cursor: Optional[float] = Field(None, description="next_cursor of the previous page")
+    page_size: Optional[int] = Field(None, gt=0, le=5000)
+    simplification: Literal["none", "douglas_peucker", "time_bucket"] = Field("none")
+    tolerance_m: float = Field(10.0, gt=0)
+    bucket_s: float = Field(30.0, gt=0)
+
+class TrackPointSchema(BaseSchema):
+    timestamp: float
+    latitude: float
+    longitude: float
+    speed: Optional[float] = None
+    bearing: Optional[float] = None
+
+class LocationHistoryResponse(BaseSchema):
+    points: List[TrackPointSchema]
+    next_cursor: Optional[float] = None
+
+class DriverLocationsSchema(LocationsSchema):
+    driver_id: str = uuid_field()
+
+class LocationBatchSchema(BaseSchema):
+    submissions: List[DriverLocationsSchema] = Field(..., min_items=1, max_items=1000)
+
+class LocationBatchResultSchema(BaseSchema):
+    driver_id: str
+    success: bool
+    error_code: Optional[str] = None
+
+class LocationBatchResponse(BaseSchema):
+    results: List[LocationBatchResultSchema]
@@ -1,5 +1,6 @@
 from config.base import BaseConfig, env_var
 from config.auth import AuthConfig
-from config.cache import RedisConfig
+from config.cache import RedisConfig, ResponseCacheConfig
 from config.enums import LayerNames
 from config.service import ServiceConfig
+from config.streaming import LocationStreamConfig
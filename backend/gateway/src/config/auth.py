@@ -12,6 +12,9 @@ class AuthConfig(BaseConfig):
         excluded_urls: Optional[list[str]] = None,
         secret: Optional[str] = None,
         cache_key_prefix: Optional[str] = 'session_token_',
+        session_cache_size: Optional[int] = None,
+        session_cache_ttl_s: Optional[int] = None,
+        session_invalidation_channel: Optional[str] = None,
     ):
         self.algorithm = algorithm or env_var("AUTH_ALGORITHM", default="HS256")
         self.access_token_expire_minutes = access_token_expire_minutes or env_var("ACCESS_TOKEN_EXPIRE_MINUTES", default=30, cast_type=int)
@@ -19,3 +22,6 @@ class AuthConfig(BaseConfig):
         self.excluded_urls = excluded_urls if excluded_urls is not None else env_var("EXCLUDED_URLS", default="", cast_type=lambda s: s.split(","))
         self.secret = secret or env_var("TOKEN_SECRET_KEY", default="secret")
         self.cache_key_prefix = cache_key_prefix
+        self.session_cache_size = session_cache_size or env_var("SESSION_NEAR_CACHE_SIZE", default=10_000, cast_type=int)
+        self.session_cache_ttl_s = session_cache_ttl_s or env_var("SESSION_NEAR_CACHE_TTL_S", default=30, cast_type=int)
+        self.session_invalidation_channel = session_invalidation_channel or env_var("SESSION_INVALIDATION_CHANNEL", default="session_invalidations")
@@ -8,9 +8,21 @@ class BrokerConfig(BaseConfig):
         user: str = None,
         password: str = None,
         vhost: str = None,
+        one_way_events: list = None,
+        coalesced_events: list = None,
     ):
         self.host = host or env_var("RABBITMQ_HOST", default="localhost")
         self.port = port or env_var("RABBITMQ_PORT", default=5673, cast_type=int)
         self.user = user or env_var("RABBITMQ_USER", default="rabbitmq_user")
         self.password = password or env_var("RABBITMQ_PASS", default="rabbitmq_password")
         self.vhost = vhost or env_var("RABBITMQ_VHOST", default="/")
+        # Events published without waiting for a reply; their failures only show up in metrics.
+        self.one_way_events = one_way_events if one_way_events is not None else env_var(
+            "RABBITMQ_ONE_WAY_EVENTS", default="driver.location.submit", cast_type=lambda s: [event for event in s.split(",") if event]
+        )
+        # Read-only events whose identical concurrent calls share one in-flight request.
+        self.coalesced_events = coalesced_events if coalesced_events is not None else env_var(
+            "RABBITMQ_COALESCED_EVENTS",
+            default="restaurant.supplier.get_all_restaurant_info,restaurant.menu.get_all_menu_item,driver.status.get",
+            cast_type=lambda s: [event for event in s.split(",") if event],
+        )
@@ -14,3 +14,18 @@ class RedisConfig(BaseConfig):
         self.db = db or env_var("REDIS_DB", 0, int)
         self.default_ttl = default_ttl or env_var("REDIS_DEFAULT_TTL", 1200, int)
         self.password = password or env_var("REDIS_PASSWORD", "gateway_password")
+
+
+class ResponseCacheConfig(BaseConfig):
+    def __init__(
+        self,
+        enabled: bool = None,
+        local_size: int = None,
+        local_ttl_s: int = None,
+        invalidation_channel: str = None,
+    ):
+        self.enabled = enabled if enabled is not None else env_var("RESPONSE_CACHE_ENABLED", True, lambda s: str(s).lower() in ("1", "true", "yes"))
+        self.local_size = local_size or env_var("RESPONSE_CACHE_LOCAL_SIZE", 5000, int)
+        # The in-process tier never holds an entry longer than this, whatever the event's TTL.
+        self.local_ttl_s = local_ttl_s or env_var("RESPONSE_CACHE_LOCAL_TTL_S", 15, int)
+        self.invalidation_channel = invalidation_channel or env_var("RESPONSE_CACHE_INVALIDATION_CHANNEL", "response_cache_invalidations")
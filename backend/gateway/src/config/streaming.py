@@ -0,0 +1,14 @@
+from config.base import BaseConfig, env_var
+
+class LocationStreamConfig(BaseConfig):
+    def __init__(
+        self,
+        flush_interval_ms: int = None,
+        max_locations_per_driver: int = None,
+        max_drivers_per_batch: int = None,
+        session_recheck_interval_s: int = None,
+    ):
+        self.flush_interval_ms = flush_interval_ms or env_var("LOCATION_STREAM_FLUSH_INTERVAL_MS", default=1000, cast_type=int)
+        self.max_locations_per_driver = max_locations_per_driver or env_var("LOCATION_STREAM_MAX_LOCATIONS_PER_DRIVER", default=20, cast_type=int)
+        self.max_drivers_per_batch = max_drivers_per_batch or env_var("LOCATION_STREAM_MAX_DRIVERS_PER_BATCH", default=1000, cast_type=int)
+        self.session_recheck_interval_s = session_recheck_interval_s or env_var("LOCATION_STREAM_SESSION_RECHECK_INTERVAL_S", default=30, cast_type=int)
@@ -1,5 +1,5 @@
 import json
-from typing import List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Union
 
 from aredis_client import AsyncRedis
 from ftgo_utils.errors import ErrorCodes
@@ -11,6 +11,7 @@ from utils import handle_exception
 class CacheRepository():
     _data_access: Optional[AsyncRedis] = None
     _group: str = ""
+    _groups: Dict[str, type] = {}
 
     @classmethod
     async def initialize(cls):
@@ -29,8 +30,10 @@ class CacheRepository():
 
     @classmethod
     def get_cache(cls, group: str = ""):
-        cls._group = group
-        return cls
+        # One subclass per group, so callers using different groups do not overwrite each other's prefix.
+        if group not in CacheRepository._groups:
+            CacheRepository._groups[group] = type(f"{CacheRepository.__name__}[{group}]", (CacheRepository,), {"_group": group})
+        return CacheRepository._groups[group]
 
     @classmethod
     def _prefixed_key(cls, key: str) -> str:
@@ -93,6 +96,16 @@ class CacheRepository():
             get_logger().error(ErrorCodes.CACHE_EXPIRE_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.CACHE_EXPIRE_ERROR, payload=payload)
 
+    @classmethod
+    async def incr(cls, key: str) -> Optional[int]:
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                return await session.incr(cls._prefixed_key(key))
+        except Exception as e:
+            payload = dict(key=key)
+            get_logger().error(ErrorCodes.CACHE_INSERT_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.CACHE_INSERT_ERROR, payload=payload)
+
     @classmethod
     async def batch_delete(cls, keys: List[str]) -> None:
         try:
@@ -106,6 +119,31 @@ class CacheRepository():
             get_logger().error(ErrorCodes.CACHE_DELETE_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.CACHE_DELETE_ERROR, payload=payload)
 
+    @classmethod
+    async def publish(cls, channel: str, message: str) -> None:
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                await session.publish(cls._prefixed_key(channel), message)
+        except Exception as e:
+            payload = dict(channel=channel)
+            get_logger().error(ErrorCodes.CACHE_INSERT_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.CACHE_INSERT_ERROR, payload=payload)
+
+    @classmethod
+    async def subscribe(cls, channel: str) -> AsyncIterator[str]:
+        """Yields messages published on ``channel`` until the consumer stops iterating."""
+        prefixed_channel = cls._prefixed_key(channel)
+        async with cls._data_access.get_or_create_session() as session:
+            pubsub = session.pubsub()
+            await pubsub.subscribe(prefixed_channel)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        yield message["data"]
+            finally:
+                await pubsub.unsubscribe(prefixed_channel)
+                await pubsub.close()
+
     @classmethod
     async def flush(cls) -> None:
         try:
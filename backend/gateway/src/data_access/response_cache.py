@@ -0,0 +1,211 @@
+import asyncio
+import copy
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ftgo_utils.enums import ResponseStatus
+from prometheus_client import Counter
+
+from config import ResponseCacheConfig
+from data_access import get_logger
+from data_access.repository import CacheRepository
+from utils import TTLCache
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "gateway_response_cache_lookups_total",
+    "Response cache lookups for cacheable events, by the tier that answered.",
+    ["event", "tier"],
+)
+
+
+class CachePolicy:
+    """Marks an RPC event as cacheable: its responses are stored under ``namespace`` and
+    ``key``, a ``str.format`` template filled from the request payload, for ``ttl_s``."""
+
+    def __init__(self, namespace: str, key: str, ttl_s: int) -> None:
+        self.namespace = namespace
+        self.key = key
+        self.ttl_s = ttl_s
+
+
+class CacheInvalidation:
+    """Entries a write event makes stale; without a ``key`` template the whole namespace is dropped."""
+
+    def __init__(self, namespace: str, key: Optional[str] = None) -> None:
+        self.namespace = namespace
+        self.key = key
+
+
+class ResponseCache:
+    """Two-tier response cache: a per-process LRU in front of Redis.
+
+    Redis keys carry a per-namespace generation, so dropping a namespace is one INCR instead
+    of a key scan. Invalidations are broadcast over pub/sub to drop the in-process tier on
+    every replica; if the subscription breaks, that tier is cleared and bounded by
+    ``local_ttl_s``.
+
+    Every invalidation seen by this process bumps a per-namespace counter. Callers take a
+    ``version`` before the request and hand it to ``put``, which skips the store when the
+    namespace was invalidated in between, so a response read before a write is not cached
+    after it. Invalidations from other replicas count once their pub/sub message arrives.
+    """
+
+    _local: Dict[str, TTLCache] = {}
+    _generations: Dict[str, int] = {}
+    _invalidations: Dict[str, int] = {}
+    # Bumped whenever the in-process tier is cleared wholesale, which may hide invalidations.
+    _epoch: int = 0
+    _task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _render(template: str, data: Dict[str, Any]) -> Optional[str]:
+        try:
+            return template.format(**data)
+        except (KeyError, IndexError, AttributeError):
+            return None
+
+    @classmethod
+    def _get_cache(cls):
+        return CacheRepository.get_cache("response_cache")
+
+    @classmethod
+    def _local_tier(cls, namespace: str) -> TTLCache:
+        if namespace not in cls._local:
+            cls._local[namespace] = TTLCache(maxsize=ResponseCacheConfig().local_size)
+        return cls._local[namespace]
+
+    @classmethod
+    async def _generation(cls, namespace: str) -> int:
+        if namespace not in cls._generations:
+            generation = await cls._get_cache().get(f"{namespace}:generation")
+            cls._generations[namespace] = int(generation or 0)
+        return cls._generations[namespace]
+
+    @classmethod
+    def version(cls, policy: CachePolicy) -> Tuple[int, int]:
+        return cls._epoch, cls._invalidations.get(policy.namespace, 0)
+
+    @classmethod
+    def _bump(cls, namespace: str) -> None:
+        cls._invalidations[namespace] = cls._invalidations.get(namespace, 0) + 1
+
+    @classmethod
+    async def get(cls, event_name: str, policy: CachePolicy, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = cls._render(policy.key, data)
+        if key is None or not ResponseCacheConfig().enabled:
+            return None
+
+        response = cls._local_tier(policy.namespace).get(key)
+        if response is not None:
+            RESPONSE_CACHE_LOOKUPS.labels(event=event_name, tier="local").inc()
+            return copy.deepcopy(response)
+
+        try:
+            generation = await cls._generation(policy.namespace)
+            response = await cls._get_cache().get(f"{policy.namespace}:{generation}:{key}")
+        except Exception as e:
+            get_logger().error("Response cache lookup failed", payload={"event": event_name, "error": str(e)})
+            response = None
+        if not isinstance(response, dict):
+            RESPONSE_CACHE_LOOKUPS.labels(event=event_name, tier="miss").inc()
+            return None
+
+        RESPONSE_CACHE_LOOKUPS.labels(event=event_name, tier="redis").inc()
+        cls._local_tier(policy.namespace).put(key, response, min(policy.ttl_s, ResponseCacheConfig().local_ttl_s))
+        return copy.deepcopy(response)
+
+    @classmethod
+    async def put(
+        cls, policy: CachePolicy, data: Dict[str, Any], response: Dict[str, Any], version: Tuple[int, int],
+    ) -> None:
+        """Stores ``response`` unless ``policy.namespace`` was invalidated since ``version`` was taken."""
+        key = cls._render(policy.key, data)
+        if key is None or response.get("status") != ResponseStatus.SUCCESS.value or not ResponseCacheConfig().enabled:
+            return
+
+        response = copy.deepcopy(response)
+        cache = cls._get_cache()
+        try:
+            generation = await cls._generation(policy.namespace)
+            if cls.version(policy) != version:
+                return
+            redis_key = f"{policy.namespace}:{generation}:{key}"
+            await cache.set(redis_key, response, ttl=policy.ttl_s)
+            if cls.version(policy) != version:
+                # An invalidation ran while storing and may have reached Redis first.
+                await cache.delete(redis_key)
+                return
+        except Exception as e:
+            get_logger().error("Response cache store failed", payload={"namespace": policy.namespace, "error": str(e)})
+            return
+        cls._local_tier(policy.namespace).put(key, response, min(policy.ttl_s, ResponseCacheConfig().local_ttl_s))
+
+    @classmethod
+    async def invalidate(cls, invalidations: Iterable[CacheInvalidation], data: Dict[str, Any]) -> None:
+        cache = cls._get_cache()
+        for invalidation in invalidations:
+            key = cls._render(invalidation.key, data) if invalidation.key else None
+            # Before touching Redis, so a store racing this invalidation backs off.
+            cls._bump(invalidation.namespace)
+            try:
+                if key is None:
+                    cls._generations[invalidation.namespace] = await cache.incr(f"{invalidation.namespace}:generation")
+                else:
+                    generation = await cls._generation(invalidation.namespace)
+                    await cache.delete(f"{invalidation.namespace}:{generation}:{key}")
+                cls._drop_local(invalidation.namespace, key)
+                await cache.publish(
+                    ResponseCacheConfig().invalidation_channel,
+                    json.dumps({"namespace": invalidation.namespace, "key": key}),
+                )
+            except Exception as e:
+                cls._drop_local(invalidation.namespace, key)
+                get_logger().error("Response cache invalidation failed", payload={"namespace": invalidation.namespace, "error": str(e)})
+
+    @classmethod
+    def _drop_local(cls, namespace: str, key: Optional[str]) -> None:
+        cls._bump(namespace)
+        if key is None:
+            cls._generations.pop(namespace, None)
+            cls._local_tier(namespace).clear()
+        else:
+            cls._local_tier(namespace).pop(key)
+
+    @classmethod
+    def _clear_local(cls) -> None:
+        cls._epoch += 1
+        cls._generations.clear()
+        for local in cls._local.values():
+            local.clear()
+
+    @classmethod
+    async def _listen(cls) -> None:
+        channel = ResponseCacheConfig().invalidation_channel
+        while True:
+            try:
+                async for message in cls._get_cache().subscribe(channel):
+                    invalidation = json.loads(message)
+                    cls._drop_local(invalidation["namespace"], invalidation.get("key"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                get_logger().error("Response cache invalidation subscription failed", payload={"error": str(e)})
+            # Invalidations may have been missed while disconnected.
+            cls._clear_local()
+            await asyncio.sleep(1)
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is None and ResponseCacheConfig().enabled:
+            cls._task = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        cls._clear_local()
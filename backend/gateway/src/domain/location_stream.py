@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from prometheus_client import Counter
+
+from config import LocationStreamConfig
+from domain import get_logger
+from ftgo_utils.enums import ResponseStatus
+from services.location import LocationService
+
+STREAMED_LOCATIONS = Counter(
+    "gateway_streamed_locations_total",
+    "Location points received over driver WebSocket streams.",
+)
+STREAM_BATCHES = Counter(
+    "gateway_location_stream_batches_total",
+    "Batched submits sent to the location service, by outcome.",
+    ["outcome"],
+)
+
+class LocationStreamCoalescer:
+    """Buffers streamed locations per driver and submits them in periodic batches.
+
+    Every connected driver appends to its own buffer, keeping only the most recent
+    ``max_locations_per_driver`` points; every ``flush_interval_ms`` all buffers are
+    sent as one ``driver.location.submit_batch`` call.
+    """
+
+    _buffers: Dict[str, List[Dict[str, Any]]] = {}
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def add(cls, driver_id: str, locations: List[Dict[str, Any]]) -> None:
+        config = LocationStreamConfig()
+        buffer = cls._buffers.setdefault(driver_id, [])
+        buffer.extend(locations)
+        del buffer[:-config.max_locations_per_driver]
+        STREAMED_LOCATIONS.inc(len(locations))
+
+    @classmethod
+    async def flush(cls) -> None:
+        if not cls._buffers:
+            return
+        buffers, cls._buffers = cls._buffers, {}
+        submissions = [{"driver_id": driver_id, "locations": locations} for driver_id, locations in buffers.items()]
+        batch_size = LocationStreamConfig().max_drivers_per_batch
+        for start in range(0, len(submissions), batch_size):
+            batch = submissions[start:start + batch_size]
+            try:
+                response = await LocationService.submit_locations_batch(data={"submissions": batch})
+            except Exception as e:
+                STREAM_BATCHES.labels(outcome="error").inc()
+                get_logger().exception("Streamed location batch failed", payload={"drivers": len(batch), "error": str(e)})
+                continue
+            if response.get("status") != ResponseStatus.SUCCESS.value:
+                STREAM_BATCHES.labels(outcome="error").inc()
+                get_logger().error("Streamed location batch failed", payload={"drivers": len(batch), "error_code": response.get("error_code")})
+                continue
+            failed = [result["driver_id"] for result in response.get("results", []) if not result.get("success")]
+            STREAM_BATCHES.labels(outcome="partial" if failed else "success").inc()
+            if failed:
+                get_logger().warning("Streamed locations rejected for some drivers", payload={"driver_ids": failed})
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            await asyncio.sleep(LocationStreamConfig().flush_interval_ms / 1000)
+            try:
+                await cls.flush()
+            except Exception as e:
+                get_logger().exception("Flushing streamed locations failed", payload={"error": str(e)})
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        try:
+            await cls.flush()
+        except Exception as e:
+            get_logger().exception("Final flush of streamed locations failed", payload={"error": str(e)})
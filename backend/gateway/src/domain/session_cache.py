@@ -0,0 +1,101 @@
+import asyncio
+import hashlib
+import time
+from typing import Optional
+
+from application.schemas.user import UserStateSchema
+from config import AuthConfig
+from data_access.repository import CacheRepository
+from domain import get_logger
+from utils import TTLCache
+
+
+class SessionNearCache:
+    """Per-process cache of validated sessions, keyed by the SHA-256 of the token.
+
+    Entries live for ``session_cache_ttl_s`` but never past the token's ``exp``.
+    Logouts are broadcast over Redis pub/sub so every replica drops the session;
+    if the subscription breaks the cache is cleared, so the TTL bounds staleness.
+    Dropped sessions are tombstoned for one TTL so that a validation which raced the
+    logout cannot put them back.
+    """
+
+    _cache: Optional[TTLCache] = None
+    _tombstones: Optional[TTLCache] = None
+    _task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def _get_cache(cls) -> TTLCache:
+        if cls._cache is None:
+            cls._cache = TTLCache(maxsize=AuthConfig().session_cache_size)
+        return cls._cache
+
+    @classmethod
+    def _get_tombstones(cls) -> TTLCache:
+        if cls._tombstones is None:
+            cls._tombstones = TTLCache(maxsize=AuthConfig().session_cache_size)
+        return cls._tombstones
+
+    @classmethod
+    def get(cls, token: str) -> Optional[UserStateSchema]:
+        return cls._get_cache().get(cls.token_hash(token))
+
+    @classmethod
+    def put(cls, token: str, user: UserStateSchema, expires_at: Optional[float] = None) -> None:
+        token_hash = cls.token_hash(token)
+        if cls._get_tombstones().get(token_hash) is not None:
+            return
+        ttl_s = AuthConfig().session_cache_ttl_s
+        if expires_at is not None:
+            ttl_s = min(ttl_s, expires_at - time.time())
+        cls._get_cache().put(token_hash, user, ttl_s)
+
+    @classmethod
+    def discard(cls, token_hash: str) -> None:
+        cls._get_tombstones().put(token_hash, True, AuthConfig().session_cache_ttl_s)
+        cls._get_cache().pop(token_hash)
+
+    @classmethod
+    async def invalidate(cls, token: str) -> None:
+        """Drops a session here and, through pub/sub, on every other replica."""
+        token_hash = cls.token_hash(token)
+        cls.discard(token_hash)
+        config = AuthConfig()
+        await CacheRepository.get_cache(config.cache_key_prefix).publish(config.session_invalidation_channel, token_hash)
+
+    @classmethod
+    async def _listen(cls) -> None:
+        config = AuthConfig()
+        while True:
+            try:
+                cache = CacheRepository.get_cache(config.cache_key_prefix)
+                async for token_hash in cache.subscribe(config.session_invalidation_channel):
+                    cls.discard(token_hash.decode() if isinstance(token_hash, bytes) else token_hash)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                get_logger().error("Session invalidation subscription failed", payload={"error": str(e)})
+            # Invalidations may have been missed while disconnected.
+            cls._get_cache().clear()
+            await asyncio.sleep(1)
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        cls._get_cache().clear()
+        cls._get_tombstones().clear()
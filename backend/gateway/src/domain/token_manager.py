@@ -5,6 +5,7 @@ from application.schemas.user import UserStateSchema
 from config import AuthConfig
 from data_access.repository import CacheRepository
 from domain import get_logger
+from domain.session_cache import SessionNearCache
 from ftgo_utils.errors import ErrorCodes
 from ftgo_utils.jwt_auth import encode
 from utils.exception import handle_exception
@@ -53,6 +54,11 @@ class TokenManager:
         token: str,
     ) -> None:
         await self.cache.delete(token)
+        try:
+            await SessionNearCache.invalidate(token)
+        except Exception as e:
+            # The Redis session is gone; other replicas drop theirs within the near-cache TTL.
+            get_logger().error("Session invalidation broadcast failed", payload={"error": str(e)})
         get_logger().info("Deleted the session token")
 
     async def fetch_user(
@@ -7,6 +7,9 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from application.app import init_router
 from config import ServiceConfig
 from data_access.events.lifecycle import setup, teardown
+from data_access.response_cache import ResponseCache
+from domain.location_stream import LocationStreamCoalescer
+from domain.session_cache import SessionNearCache
 from middleware.builder import MiddlewareBuilder
 
 load_dotenv()
@@ -16,9 +19,15 @@ init_logging(level=service_config.log_level)
 
 async def lifespan(app: FastAPI):
     await setup()
+    await LocationStreamCoalescer.start()
+    await SessionNearCache.start()
+    await ResponseCache.start()
 
     yield
 
+    await ResponseCache.stop()
+    await SessionNearCache.stop()
+    await LocationStreamCoalescer.stop()
     await teardown()
 
 app = FastAPI(
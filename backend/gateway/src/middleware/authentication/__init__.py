@@ -2,4 +2,4 @@ from fastapi import FastAPI
 from middleware.authentication.auth_middleware import JWTAuthenticationMiddleware
 
 def mount_middleware(app: FastAPI):
-    app.add_middleware(JWTAuthenticationMiddleware)
+    app.add_middleware(JWTAuthenticationMiddleware, root_app=app)
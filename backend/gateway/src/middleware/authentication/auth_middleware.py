@@ -1,35 +1,81 @@
 import time
-from typing import Callable, Coroutine, Any
 
 import jwt.exceptions as jwt_errors
 from application.schemas.user import UserStateSchema
 from config.auth import AuthConfig
 from data_access.repository.cache_repository import CacheRepository
+from domain.session_cache import SessionNearCache
 from domain.token_manager import TokenManager
-from fastapi import Request
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from ftgo_utils.errors import BaseError, ErrorCodes
 from ftgo_utils.jwt_auth import decode
 from middleware import get_logger
+from middleware.authentication.public_routes import PublicRouteMatcher
 from starlette.datastructures import Headers
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class JWTAuthenticationMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
+async def authenticate_token(token: str, config: AuthConfig) -> UserStateSchema:
+    """Validates a bearer token against its cached session; shared by HTTP and WebSocket entry points.
+
+    Sessions validated before are served from ``SessionNearCache`` without touching Redis.
+    """
+    cached_user = SessionNearCache.get(token)
+    if cached_user is not None:
+        return cached_user
+    try:
+        payload = decode(token, config.secret, algorithms=[config.algorithm])
+        if not payload:
+            raise BaseError(
+                error_code=ErrorCodes.INVALID_TOKEN_ERROR,
+                message="The provided token is not correct."
+            )
+
+        try:
+            request_token_user = UserStateSchema.model_validate(payload)
+        except Exception as e:
+            raise BaseError(
+                error_code=ErrorCodes.INTERNAL_AUTHENTICATION_ERROR,
+                message="There was an error validating your session."
+            )    
+        try:
+            user = await TokenManager().fetch_user(token)
+        except Exception as e:
+            raise BaseError(
+                error_code=ErrorCodes.INTERNAL_AUTHENTICATION_ERROR,
+                message="There was an error validating your token."
+            )
+
+        if user.user_id != request_token_user.user_id:
+            raise BaseError(
+                error_code=ErrorCodes.IDENTITY_MISMATCH_ERROR,
+                message="User identity mismatch."
+            )
+
+        SessionNearCache.put(token, user, expires_at=payload.get("exp"))
+        return user
+    except jwt_errors.InvalidTokenError as e:
+        raise BaseError(
+            error_code=ErrorCodes.INVALID_TOKEN_ERROR,
+            message="The provided token is invalid."
+        )
+    except jwt_errors.ExpiredSignatureError as e:
+        raise BaseError(
+            error_code=ErrorCodes.USER_SESSION_EXPIRED_ERROR,
+            message="The provided token is expired."
+        )
+    except Exception as e:
+        raise e
+
+
+class JWTAuthenticationMiddleware:
+    def __init__(self, app: ASGIApp, root_app: FastAPI):
+        self.app = app
         self.config = AuthConfig()
         self.cache = CacheRepository.get_cache(self.config.cache_key_prefix)
-        self.no_auth_urls = [
-            "/auth/register",
-            "/auth/verify",
-            "/auth/login",
-            "/auth/resend_code",
-            "/docs",
-            "/openapi.json",
-        ]
+        # The middleware stack is built on the first request, once every router is included.
+        self.public_routes = PublicRouteMatcher.from_app(root_app, self.config.excluded_urls)
 
     @classmethod
     def extract_token_from_headers(cls, headers: Headers) -> str:
@@ -53,75 +99,40 @@ class JWTAuthenticationMiddleware(BaseHTTPMiddleware):
             )
         return token
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Coroutine[Any, Any, Response]],
-    ) -> Response:
-        request_url_path = request.url.path
-        if any(url in request_url_path for url in self.no_auth_urls):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.public_routes.is_public(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
 
         try:
             token = self.extract_token_from_headers(request.headers)
             user = await self._authenticate(token)
             request.state.user = UserStateSchema.model_validate(user.dict())
         except BaseError as e:
-            return self._handle_authentication_exception(request, e)
+            response = self._handle_authentication_exception(request, e)
+            await response(scope, receive, send)
+            return
         except Exception as e:
             error = BaseError(
                 error_code=ErrorCodes.INTERNAL_AUTHENTICATION_ERROR,
                 message="An unexpected error occurred while processing the authentication token."
             )
-            return self._handle_authentication_exception(request, error)
+            response = self._handle_authentication_exception(request, error)
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     async def _authenticate(self, token: str) -> UserStateSchema:
-        try:
-            payload = decode(token, self.config.secret, algorithms=[self.config.algorithm])
-            if not payload:
-                raise BaseError(
-                    error_code=ErrorCodes.INVALID_TOKEN_ERROR,
-                    message="The provided token is not correct."
-                )
-
-            try:
-                request_token_user = UserStateSchema.model_validate(payload)
-            except Exception as e:
-                raise BaseError(
-                    error_code=ErrorCodes.INTERNAL_AUTHENTICATION_ERROR,
-                    message="There was an error validating your session."
-                )    
-            try:
-                user = await TokenManager().fetch_user(token)
-            except Exception as e:
-                raise BaseError(
-                    error_code=ErrorCodes.INTERNAL_AUTHENTICATION_ERROR,
-                    message="There was an error validating your token."
-                )
-
-            if user.user_id != request_token_user.user_id:
-                raise BaseError(
-                    error_code=ErrorCodes.IDENTITY_MISMATCH_ERROR,
-                    message="User identity mismatch."
-                )
-
-            return user
-        except jwt_errors.InvalidTokenError as e:
-            raise BaseError(
-                error_code=ErrorCodes.INVALID_TOKEN_ERROR,
-                message="The provided token is invalid."
-            )
-        except jwt_errors.ExpiredSignatureError as e:
-            raise BaseError(
-                error_code=ErrorCodes.USER_SESSION_EXPIRED_ERROR,
-                message="The provided token is expired."
-            )
-        except Exception as e:
-            raise e
+        return await authenticate_token(token, self.config)
 
-    def _handle_authentication_exception(self, request: Request, error: BaseError) -> None:
+    def _handle_authentication_exception(self, request: Request, error: BaseError) -> JSONResponse:
         get_logger().error(
             error.error_code.value,
             payload={
@@ -0,0 +1,83 @@
+from typing import FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from application.dependencies import public_route
+
+ANY_METHOD = "*"
+
+
+class PublicRouteMatcher:
+    """Table of the ``(method, path)`` pairs exempt from authentication.
+
+    Built once from the application's routes. Static paths are a set lookup and prefix
+    exemptions one lookup per path segment; routes with path parameters are matched by a
+    linear scan over their regexes, so ``is_public`` is only O(1) for static paths.
+    A route marked public is exempt only for the methods it declares; the docs routes and
+    ``excluded_urls`` are exempt for every method.
+    """
+
+    def __init__(
+        self,
+        exact: Iterable[Tuple[str, str]] = (),
+        prefixes: Iterable[str] = (),
+        patterns: Iterable[Tuple[FrozenSet[str], Pattern]] = (),
+    ):
+        self.exact: Set[Tuple[str, str]] = set(exact)
+        self.prefixes: Set[str] = {prefix.rstrip("/") for prefix in prefixes}
+        self.patterns: List[Tuple[FrozenSet[str], Pattern]] = list(patterns)
+
+    @classmethod
+    def from_app(cls, app: FastAPI, excluded_urls: Optional[Iterable[str]] = None) -> "PublicRouteMatcher":
+        """Collects routes marked with the ``public_route`` dependency, the docs routes and
+        ``excluded_urls``, where an entry ending in ``*`` exempts everything below it."""
+        exact, prefixes, patterns = set(), set(), []
+
+        for route in app.routes:
+            if not isinstance(route, APIRoute) or not cls._is_marked_public(route):
+                continue
+            methods = frozenset(route.methods or (ANY_METHOD,))
+            if route.param_convertors:
+                patterns.append((methods, route.path_regex))
+            else:
+                exact.update((method, route.path) for method in methods)
+
+        for url in (app.openapi_url, app.docs_url, app.redoc_url):
+            if url:
+                exact.add((ANY_METHOD, url))
+        if app.docs_url and app.swagger_ui_oauth2_redirect_url:
+            exact.add((ANY_METHOD, app.swagger_ui_oauth2_redirect_url))
+
+        for url in excluded_urls or ():
+            url = url.strip()
+            if not url:
+                continue
+            if url.endswith("*"):
+                prefixes.add(url[:-1])
+            else:
+                exact.add((ANY_METHOD, url))
+
+        return cls(exact=exact, prefixes=prefixes, patterns=patterns)
+
+    @staticmethod
+    def _is_marked_public(route: APIRoute) -> bool:
+        return any(dependency.call is public_route for dependency in route.dependant.dependencies)
+
+    def is_public(self, method: str, path: str) -> bool:
+        if (method, path) in self.exact or (ANY_METHOD, path) in self.exact:
+            return True
+        if self.prefixes:
+            if "" in self.prefixes:
+                return True
+            index = path.find("/", 1)
+            while index != -1:
+                if path[:index] in self.prefixes:
+                    return True
+                index = path.find("/", index + 1)
+            if path.rstrip("/") in self.prefixes:
+                return True
+        return any(
+            (method in methods or ANY_METHOD in methods) and pattern.match(path)
+            for methods, pattern in self.patterns
+        )
@@ -1,9 +1,14 @@
 from fastapi import Request
 from middleware import get_logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        get_logger().info(f"API {request.url} with request_id {request.state.request_id} was called")
-        return await call_next(request)
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            request = Request(scope)
+            get_logger().info(f"API {request.url} with request_id {request.state.request_id} was called")
+        await self.app(scope, receive, send)
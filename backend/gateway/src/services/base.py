@@ -1,18 +1,86 @@
-from typing import Dict, Any
+import asyncio
+import copy
+import json
+from typing import Dict, Any, List, Tuple
+
+from prometheus_client import Counter
 
 from config import LayerNames, BaseConfig
+from config.broker import BrokerConfig
 from data_access.broker import RPCBroker
+from data_access.response_cache import CacheInvalidation, CachePolicy, ResponseCache
 from ftgo_utils.enums import ResponseStatus
 from ftgo_utils.errors import ErrorCodes
 from ftgo_utils.logger import get_logger
 
 logger = get_logger(layer=LayerNames.MESSAGE_BROKER.value, environment=BaseConfig.load_environment())
 
+ONE_WAY_PUBLISHES = Counter(
+    "gateway_rpc_one_way_publishes_total",
+    "Events published without waiting for a reply, by outcome.",
+    ["service", "event", "outcome"],
+)
+
+COALESCED_CALLS = Counter(
+    "gateway_rpc_coalesced_calls_total",
+    "Calls to coalesced events; role=follower calls shared an in-flight request instead of sending one.",
+    ["service", "event", "role"],
+)
+
 class Microservice:
     _service_name = ''
+    _one_way_events = frozenset(BrokerConfig().one_way_events)
+    _coalesced_events = frozenset(BrokerConfig().coalesced_events)
+    _in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+    # Read-only events whose responses are cached, and the cached entries each write event makes stale.
+    _cached_events: Dict[str, CachePolicy] = {}
+    _invalidated_by: Dict[str, List[CacheInvalidation]] = {}
 
     @classmethod
     async def _call_rpc(cls, event_name: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        if event_name in cls._one_way_events:
+            return await cls._publish(event_name, data=data, **kwargs)
+
+        policy = cls._cached_events.get(event_name)
+        if policy is not None:
+            # Taken before the read so a write that lands during it keeps the response out of the cache.
+            cache_version = ResponseCache.version(policy)
+            response = await ResponseCache.get(event_name, policy, data)
+            if response is not None:
+                return response
+
+        if event_name in cls._coalesced_events:
+            response = await cls._call_coalesced(event_name, data=data, **kwargs)
+        else:
+            response = await cls._request(event_name, data=data, **kwargs)
+
+        if policy is not None:
+            await ResponseCache.put(policy, data, response, cache_version)
+        if event_name in cls._invalidated_by:
+            # Invalidate even on error responses: a timed-out write may still have been applied.
+            await ResponseCache.invalidate(cls._invalidated_by[event_name], data)
+        return response
+
+    @classmethod
+    async def _call_coalesced(cls, event_name: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Single-flight: concurrent calls with the same event and canonical payload share one request.
+
+        The request runs in its own task so a caller that goes away does not cancel it for the
+        others; every caller gets its own copy of the response since route handlers mutate it.
+        """
+        key = (event_name, json.dumps({"data": data, "kwargs": kwargs}, sort_keys=True, separators=(",", ":"), default=str))
+        task = Microservice._in_flight.get(key)
+        if task is None:
+            COALESCED_CALLS.labels(service=cls._service_name, event=event_name, role="leader").inc()
+            task = asyncio.ensure_future(cls._request(event_name, data=data, **kwargs))
+            Microservice._in_flight[key] = task
+            task.add_done_callback(lambda _: Microservice._in_flight.pop(key, None))
+        else:
+            COALESCED_CALLS.labels(service=cls._service_name, event=event_name, role="follower").inc()
+        return copy.deepcopy(await asyncio.shield(task))
+
+    @classmethod
+    async def _request(cls, event_name: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         try:
             rpc_client = RPCBroker.get_client()
             response = await rpc_client.call(event_name, data=data, **kwargs)
@@ -25,3 +93,19 @@ class Microservice:
                 "response": ResponseStatus.ERROR.value,
                 "error_code": ErrorCodes.UNKNOWN_ERROR.value,
             }
+
+    @classmethod
+    async def _publish(cls, event_name: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Publishes an event without a reply queue; success only means the broker took the message."""
+        try:
+            rpc_client = RPCBroker.get_client()
+            await rpc_client.send(event_name, data=data, **kwargs)
+            ONE_WAY_PUBLISHES.labels(service=cls._service_name, event=event_name, outcome="published").inc()
+            return {"status": ResponseStatus.SUCCESS.value}
+        except Exception as e:
+            ONE_WAY_PUBLISHES.labels(service=cls._service_name, event=event_name, outcome="failed").inc()
+            logger.error(f"Exception at publishing event: {event_name} in service: {cls._service_name}: {e}")
+            return {
+                "status": ResponseStatus.ERROR.value,
+                "error_code": ErrorCodes.UNKNOWN_ERROR.value,
+            }
@@ -10,6 +10,10 @@ class LocationService(Microservice):
     async def submit_location(cls, data: Dict) -> Dict:
         return await cls._call_rpc('driver.location.submit', data=data)
 
+    @classmethod
+    async def submit_locations_batch(cls, data: Dict) -> Dict:
+        return await cls._call_rpc('driver.location.submit_batch', data=data)
+
     @classmethod
     async def change_status_online(cls, data: Dict) -> Dict:
         return await cls._call_rpc('driver.status.online', data=data)
@@ -26,6 +30,10 @@ class LocationService(Microservice):
     async def get_last_location(cls, data: Dict) -> Dict:
         return await cls._call_rpc('driver.location.get', data=data)
 
+    @classmethod
+    async def get_location_history(cls, data: Dict) -> Dict:
+        return await cls._call_rpc('driver.location.history', data=data)
+
     @classmethod
     async def get_driver_status(cls, data: Dict) -> Dict:
         return await cls._call_rpc('driver.status.get', data=data)
@@ -1,10 +1,21 @@
 from typing import Dict
 
+from data_access.response_cache import CacheInvalidation, CachePolicy
 from services.base import Microservice
 
 
 class MenuService(Microservice):
     _service_name = 'menu'
+    _cached_events = {
+        'restaurant.menu.get_item_info': CachePolicy(namespace='menu_item', key='{item_id}', ttl_s=300),
+        'restaurant.menu.get_all_menu_item': CachePolicy(namespace='menu', key='{restaurant_id}', ttl_s=300),
+    }
+    # Updates and deletes only carry the item id, so every cached menu listing is dropped.
+    _invalidated_by = {
+        'restaurant.menu.add_item': [CacheInvalidation('menu', key='{restaurant_id}')],
+        'restaurant.menu.update_item': [CacheInvalidation('menu_item', key='{item_id}'), CacheInvalidation('menu')],
+        'restaurant.menu.delete_item': [CacheInvalidation('menu_item', key='{item_id}'), CacheInvalidation('menu')],
+    }
 
     @classmethod
     async def add_item(cls, data: Dict) -> Dict:
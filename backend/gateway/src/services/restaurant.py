@@ -1,10 +1,19 @@
 from typing import Dict
 
+from data_access.response_cache import CacheInvalidation, CachePolicy
 from services.base import Microservice
 
 
 class RestaurantService(Microservice):
     _service_name = 'restaurant'
+    _cached_events = {
+        'restaurant.supplier.get_all_restaurant_info': CachePolicy(namespace='restaurants', key='all', ttl_s=60),
+    }
+    _invalidated_by = {
+        'restaurant.supplier.register': [CacheInvalidation('restaurants')],
+        'restaurant.supplier.update_information': [CacheInvalidation('restaurants')],
+        'restaurant.supplier.delete_restaurant': [CacheInvalidation('restaurants'), CacheInvalidation('menu', key='{restaurant_id}')],
+    }
 
     @classmethod
     async def register(cls, data: Dict) -> Dict:
@@ -1 +1,2 @@
 from utils.exception import handle_exception
+from utils.ttl_cache import TTLCache
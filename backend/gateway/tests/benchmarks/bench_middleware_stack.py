@@ -0,0 +1,140 @@
+"""Requests/sec through the gateway middleware stack, BaseHTTPMiddleware vs pure ASGI.
+
+Both stacks mount authentication, logging, request id, timing and CORS in
+the order ``main.py`` uses, in front of a trivial authenticated route. The
+legacy stack reproduces the previous ``BaseHTTPMiddleware`` implementations;
+the other mounts the current middleware. The session is seeded into
+``SessionNearCache`` so authentication never leaves the process. Rate
+limiting and HTTPS redirect are left out: they would throttle or redirect
+the benchmark client.
+
+Run from the gateway root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_middleware_stack
+"""
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from ftgo_utils.errors import BaseError
+from ftgo_utils.uuid_gen import uuid4
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from application.schemas.user import UserStateSchema
+from domain.session_cache import SessionNearCache
+from middleware import get_logger
+from middleware.authentication.auth_middleware import JWTAuthenticationMiddleware
+from middleware.logger.handler import LoggingMiddleware
+from middleware.request_id.handler import RequestUUIDMiddleware
+from middleware.timing.handler import ProcessTimeMiddleware
+
+REQUESTS = 5_000
+CONCURRENCY = 50
+TOKEN = "benchmark-token"
+
+
+class LegacyJWTAuthenticationMiddleware(BaseHTTPMiddleware):
+    no_auth_urls = ["/auth/register", "/auth/verify", "/auth/login", "/auth/resend_code", "/docs", "/openapi.json"]
+
+    def __init__(self, app, root_app: FastAPI):
+        super().__init__(app)
+        self.auth = JWTAuthenticationMiddleware(app, root_app=root_app)
+
+    async def dispatch(self, request: Request, call_next):
+        if any(url in request.url.path for url in self.no_auth_urls):
+            return await call_next(request)
+        try:
+            token = self.auth.extract_token_from_headers(request.headers)
+            user = await self.auth._authenticate(token)
+            request.state.user = UserStateSchema.model_validate(user.dict())
+        except BaseError as e:
+            return self.auth._handle_authentication_exception(request, e)
+        return await call_next(request)
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        get_logger().info(f"API {request.url} with request_id {request.state.request_id} was called")
+        return await call_next(request)
+
+
+class LegacyRequestUUIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request_id = str(uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyProcessTimeMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+
+STACKS = {
+    "base_http": (
+        LegacyJWTAuthenticationMiddleware,
+        LegacyLoggingMiddleware,
+        LegacyRequestUUIDMiddleware,
+        LegacyProcessTimeMiddleware,
+    ),
+    "pure_asgi": (
+        JWTAuthenticationMiddleware,
+        LoggingMiddleware,
+        RequestUUIDMiddleware,
+        ProcessTimeMiddleware,
+    ),
+}
+
+
+def build_app(middlewares) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"user_id": str(request.state.user.user_id)}
+
+    auth_middleware, *middlewares = middlewares
+    app.add_middleware(auth_middleware, root_app=app)
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+    return app
+
+
+async def measure(app: FastAPI) -> float:
+    headers = {"Authorization": f"Bearer {TOKEN}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.get("/ping", headers=headers)
+                assert response.status_code == 200, response.text
+                assert "X-Request-ID" in response.headers
+
+        await worker(CONCURRENCY)
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)))
+        return REQUESTS / (time.perf_counter() - started_at)
+
+
+async def main() -> None:
+    user = UserStateSchema(
+        user_id=str(uuid4()),
+        phone_number="1234567890",
+        role="customer",
+        hashed_password="hashed",
+    )
+    SessionNearCache.put(TOKEN, user, expires_at=time.time() + 3600)
+    for name, middlewares in STACKS.items():
+        print(name, {"requests_per_s": round(await measure(build_app(middlewares)), 1)})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,18 @@
+import pytest_asyncio
+
+from test_doubles.redis import FakeAsyncRedis
+from data_access.repository import CacheRepository
+from data_access.response_cache import ResponseCache
+
+@pytest_asyncio.fixture(scope='function')
+async def cache_repository():
+    CacheRepository._data_access = FakeAsyncRedis()
+    yield CacheRepository
+    await CacheRepository.terminate()
+
+@pytest_asyncio.fixture(scope='function')
+async def response_cache(cache_repository):
+    yield ResponseCache
+    await ResponseCache.stop()
+    ResponseCache._local.clear()
+    ResponseCache._invalidations.clear()
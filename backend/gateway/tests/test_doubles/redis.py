@@ -0,0 +1,17 @@
+from contextlib import asynccontextmanager
+
+import fakeredis
+
+
+class FakeAsyncRedis:
+    """Stands in for ``aredis_client.AsyncRedis`` with an in-memory fakeredis session."""
+
+    def __init__(self) -> None:
+        self.session = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    @asynccontextmanager
+    async def get_or_create_session(self):
+        yield self.session
+
+    async def disconnect(self) -> None:
+        await self.session.flushall()
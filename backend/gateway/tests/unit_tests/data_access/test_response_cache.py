@@ -0,0 +1,104 @@
+import pytest
+
+from ftgo_utils.enums import ResponseStatus
+
+from data_access.response_cache import CacheInvalidation, CachePolicy
+
+POLICY = CachePolicy(namespace="vehicles", key="{driver_id}", ttl_s=60)
+DATA = {"driver_id": "driver-1"}
+RESPONSE = {"status": ResponseStatus.SUCCESS.value, "vehicle": {"plate": "11A111"}}
+
+
+async def put(response_cache, data=DATA, response=RESPONSE):
+    await response_cache.put(POLICY, data, response, response_cache.version(POLICY))
+
+@pytest.mark.asyncio
+async def test_get_is_served_from_redis_once_the_local_tier_is_cleared(response_cache):
+    await put(response_cache)
+    assert await response_cache.get("get_vehicle", POLICY, DATA) == RESPONSE
+
+    response_cache._clear_local()
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) == RESPONSE
+
+@pytest.mark.asyncio
+async def test_get_returns_a_copy(response_cache):
+    await put(response_cache)
+
+    (await response_cache.get("get_vehicle", POLICY, DATA))["vehicle"]["plate"] = "changed"
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) == RESPONSE
+
+@pytest.mark.asyncio
+async def test_error_responses_are_not_stored(response_cache):
+    await put(response_cache, response={"status": ResponseStatus.ERROR.value})
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
+
+@pytest.mark.asyncio
+async def test_invalidating_a_key_drops_only_that_entry(response_cache):
+    other = {"driver_id": "driver-2"}
+    await put(response_cache)
+    await put(response_cache, data=other)
+
+    await response_cache.invalidate([CacheInvalidation("vehicles", "{driver_id}")], DATA)
+    response_cache._clear_local()
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
+    assert await response_cache.get("get_vehicle", POLICY, other) == RESPONSE
+
+@pytest.mark.asyncio
+async def test_invalidating_a_namespace_drops_every_entry(response_cache):
+    other = {"driver_id": "driver-2"}
+    await put(response_cache)
+    await put(response_cache, data=other)
+
+    await response_cache.invalidate([CacheInvalidation("vehicles")], DATA)
+    response_cache._clear_local()
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
+    assert await response_cache.get("get_vehicle", POLICY, other) is None
+
+@pytest.mark.asyncio
+async def test_put_skips_a_response_read_before_an_invalidation(response_cache):
+    version = response_cache.version(POLICY)
+
+    await response_cache.invalidate([CacheInvalidation("vehicles", "{driver_id}")], DATA)
+    await response_cache.put(POLICY, DATA, RESPONSE, version)
+    response_cache._clear_local()
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
+
+@pytest.mark.asyncio
+async def test_put_skips_a_response_read_before_another_replica_invalidated(response_cache):
+    version = response_cache.version(POLICY)
+
+    # What the pub/sub listener does for another replica's invalidation.
+    response_cache._drop_local("vehicles", "driver-1")
+    await response_cache.put(POLICY, DATA, RESPONSE, version)
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
+
+@pytest.mark.asyncio
+async def test_put_removes_its_entry_when_an_invalidation_lands_during_the_store(response_cache, monkeypatch):
+    cache = response_cache._get_cache()
+    store = cache.set
+
+    async def set_after_invalidation(key, value, ttl=None):
+        await response_cache.invalidate([CacheInvalidation("vehicles", "{driver_id}")], DATA)
+        await store(key, value, ttl=ttl)
+
+    monkeypatch.setattr(cache, "set", set_after_invalidation)
+    await put(response_cache)
+    response_cache._clear_local()
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
+
+@pytest.mark.asyncio
+async def test_lost_subscription_makes_pending_stores_skip(response_cache):
+    version = response_cache.version(POLICY)
+
+    response_cache._clear_local()
+    await response_cache.put(POLICY, DATA, RESPONSE, version)
+
+    assert await response_cache.get("get_vehicle", POLICY, DATA) is None
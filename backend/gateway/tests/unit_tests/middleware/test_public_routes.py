@@ -0,0 +1,60 @@
+import pytest
+from fastapi import Depends, FastAPI
+
+from application.dependencies import public_route
+from middleware.authentication.public_routes import PublicRouteMatcher
+
+
+def handler() -> None:
+    return None
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_api_route("/auth/login", handler, methods=["POST"], dependencies=[Depends(public_route)])
+    app.add_api_route("/auth/login", handler, methods=["DELETE"])
+    app.add_api_route("/restaurants/{restaurant_id}/menu", handler, methods=["GET"], dependencies=[Depends(public_route)])
+    app.add_api_route("/profile", handler, methods=["GET"])
+    return app
+
+def test_public_route_is_exempt_only_for_its_declared_methods(app):
+    matcher = PublicRouteMatcher.from_app(app)
+
+    assert matcher.is_public("POST", "/auth/login")
+    assert not matcher.is_public("DELETE", "/auth/login")
+    assert not matcher.is_public("GET", "/profile")
+
+def test_public_route_with_path_parameters_is_matched_by_pattern(app):
+    matcher = PublicRouteMatcher.from_app(app)
+
+    assert matcher.is_public("GET", "/restaurants/42/menu")
+    assert not matcher.is_public("POST", "/restaurants/42/menu")
+    assert not matcher.is_public("GET", "/restaurants/42/orders")
+
+def test_docs_routes_are_exempt_for_every_method(app):
+    matcher = PublicRouteMatcher.from_app(app)
+
+    for path in (app.openapi_url, app.docs_url, app.redoc_url, app.swagger_ui_oauth2_redirect_url):
+        assert matcher.is_public("GET", path)
+        assert matcher.is_public("HEAD", path)
+
+def test_disabled_docs_routes_are_not_exempt():
+    matcher = PublicRouteMatcher.from_app(FastAPI(docs_url=None, redoc_url=None))
+
+    assert not matcher.is_public("GET", "/docs")
+    assert not matcher.is_public("GET", "/docs/oauth2-redirect")
+
+def test_excluded_url_prefix_exempts_whole_segments_only(app):
+    matcher = PublicRouteMatcher.from_app(app, excluded_urls=["/health*", " /metrics ", ""])
+
+    assert matcher.is_public("GET", "/health")
+    assert matcher.is_public("GET", "/health/")
+    assert matcher.is_public("POST", "/health/live")
+    assert not matcher.is_public("GET", "/healthz")
+    assert matcher.is_public("GET", "/metrics")
+    assert not matcher.is_public("GET", "/metrics/extra")
+
+def test_catch_all_excluded_url_exempts_everything(app):
+    matcher = PublicRouteMatcher.from_app(app, excluded_urls=["*"])
+
+    assert matcher.is_public("GET", "/profile")
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from ftgo_utils.enums import ResponseStatus
+
+from data_access.response_cache import CacheInvalidation, CachePolicy
+from services.base import Microservice
+
+
+class FakeService(Microservice):
+    _service_name = "fake"
+    _coalesced_events = frozenset({"get_vehicle"})
+    _cached_events = {"get_vehicle": CachePolicy(namespace="vehicles", key="{driver_id}", ttl_s=60)}
+    _invalidated_by = {"update_vehicle": [CacheInvalidation("vehicles", "{driver_id}")]}
+    requests = []
+    release = None
+
+    @classmethod
+    async def _request(cls, event_name, data, **kwargs):
+        cls.requests.append((event_name, data))
+        if event_name == "get_vehicle":
+            await cls.release.wait()
+        return {"status": ResponseStatus.SUCCESS.value, "vehicle": {"plate": "11A111"}}
+
+
+@pytest.fixture
+def service():
+    FakeService.requests = []
+    FakeService.release = asyncio.Event()
+    yield FakeService
+    assert Microservice._in_flight == {}
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request(service):
+    calls = [asyncio.create_task(service._call_coalesced("get_vehicle", {"driver_id": "driver-1"})) for _ in range(3)]
+    await settle()
+    service.release.set()
+    responses = await asyncio.gather(*calls)
+
+    assert len(service.requests) == 1
+    responses[0]["vehicle"]["plate"] = "changed"
+    assert responses[1]["vehicle"]["plate"] == "11A111"
+
+@pytest.mark.asyncio
+async def test_calls_with_different_payloads_are_not_coalesced(service):
+    calls = [
+        asyncio.create_task(service._call_coalesced("get_vehicle", {"driver_id": driver_id}))
+        for driver_id in ("driver-1", "driver-2")
+    ]
+    await settle()
+    service.release.set()
+    await asyncio.gather(*calls)
+
+    assert len(service.requests) == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_request(service):
+    leader = asyncio.create_task(service._call_coalesced("get_vehicle", {"driver_id": "driver-1"}))
+    follower = asyncio.create_task(service._call_coalesced("get_vehicle", {"driver_id": "driver-1"}))
+    await settle()
+
+    leader.cancel()
+    service.release.set()
+
+    assert (await follower)["status"] == ResponseStatus.SUCCESS.value
+    assert len(service.requests) == 1
+
+@pytest.mark.asyncio
+async def test_write_during_a_cached_read_keeps_the_response_out_of_the_cache(service, response_cache):
+    read = asyncio.create_task(service._call_rpc("get_vehicle", {"driver_id": "driver-1"}))
+    await settle()
+
+    await service._call_rpc("update_vehicle", {"driver_id": "driver-1"})
+    service.release.set()
+    await read
+
+    assert await response_cache.get("get_vehicle", service._cached_events["get_vehicle"], {"driver_id": "driver-1"}) is None
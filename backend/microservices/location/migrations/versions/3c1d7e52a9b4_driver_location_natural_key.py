@@ -0,0 +1,46 @@
+"""driver_location natural key
+
+Revision ID: 3c1d7e52a9b4
+Revises: 9fafa9afc18d
+Create Date: 2026-10-18 10:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1d7e52a9b4'
+down_revision = '9fafa9afc18d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Drop the duplicates left behind by re-persisting the cached last location.
+    op.execute(
+        """
+        DELETE FROM driver_location a
+        USING driver_location b
+        WHERE a.driver_id = b.driver_id
+          AND a.timestamp = b.timestamp
+          AND a.created_at > b.created_at
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM driver_location a
+        USING driver_location b
+        WHERE a.driver_id = b.driver_id
+          AND a.timestamp = b.timestamp
+          AND a.created_at = b.created_at
+          AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_driver_location_driver_id_timestamp', 'driver_location', ['driver_id', 'timestamp']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_driver_location_driver_id_timestamp', 'driver_location', type_='unique')
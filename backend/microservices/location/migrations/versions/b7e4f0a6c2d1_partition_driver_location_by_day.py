@@ -0,0 +1,130 @@
+"""partition driver_location by day
+
+Revision ID: b7e4f0a6c2d1
+Revises: 3c1d7e52a9b4
+Create Date: 2026-10-18 11:03:52.460871
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4f0a6c2d1'
+down_revision = '3c1d7e52a9b4'
+branch_labels = None
+depends_on = None
+
+# Days created ahead of today; LocationPartitionMaintainer keeps the window moving afterwards.
+PREMAKE_DAYS = 3
+
+
+def _create_columns_sql() -> str:
+    return """
+        driver_id VARCHAR NOT NULL,
+        latitude FLOAT(32) NOT NULL,
+        longitude FLOAT(32) NOT NULL,
+        accuracy FLOAT(32),
+        speed FLOAT(32),
+        bearing FLOAT(32),
+        timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+        id VARCHAR NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL
+    """
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE driver_location RENAME TO driver_location_unpartitioned")
+    op.execute("ALTER TABLE driver_location_unpartitioned RENAME CONSTRAINT driver_location_pkey TO driver_location_unpartitioned_pkey")
+    op.execute(
+        "ALTER TABLE driver_location_unpartitioned RENAME CONSTRAINT uq_driver_location_driver_id_timestamp "
+        "TO uq_driver_location_unpartitioned_driver_id_timestamp"
+    )
+
+    op.execute(
+        f"""
+        CREATE TABLE driver_location (
+            {_create_columns_sql()},
+            CONSTRAINT driver_location_pkey PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX uq_driver_location_driver_id_timestamp "
+        "ON driver_location (driver_id, timestamp DESC)"
+    )
+
+    # One partition per UTC day, from the oldest stored point up to the premake window.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            first_day DATE;
+            day DATE;
+        BEGIN
+            SELECT COALESCE(MIN((timestamp AT TIME ZONE 'UTC')::date), (now() AT TIME ZONE 'UTC')::date)
+            INTO first_day FROM driver_location_unpartitioned;
+            FOR day IN
+                SELECT generate_series(first_day, (now() AT TIME ZONE 'UTC')::date + {PREMAKE_DAYS}, interval '1 day')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF driver_location FOR VALUES FROM (%L) TO (%L)',
+                    'driver_location_p' || to_char(day, 'YYYYMMDD'),
+                    day::text || ' 00:00:00+00',
+                    (day + 1)::text || ' 00:00:00+00'
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+
+    # Catches points stamped outside the pre-made days; LocationPartitionMaintainer moves them
+    # into their day partition once it is created.
+    op.execute("CREATE TABLE driver_location_default PARTITION OF driver_location DEFAULT")
+
+    # The partition key cannot be NULL, so such rows cannot be carried over.
+    skipped = op.get_bind().execute(
+        sa.text("SELECT count(*) FROM driver_location_unpartitioned WHERE timestamp IS NULL")
+    ).scalar()
+    if skipped:
+        logger.warning(f"Discarding {skipped} driver_location rows with a NULL timestamp")
+    op.execute(
+        """
+        INSERT INTO driver_location
+            (driver_id, latitude, longitude, accuracy, speed, bearing, timestamp, id, created_at, updated_at)
+        SELECT driver_id, latitude, longitude, accuracy, speed, bearing, timestamp, id, created_at, updated_at
+        FROM driver_location_unpartitioned
+        WHERE timestamp IS NOT NULL
+        """
+    )
+    op.drop_table('driver_location_unpartitioned')
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE driver_location RENAME TO driver_location_partitioned")
+    op.execute("ALTER TABLE driver_location_partitioned RENAME CONSTRAINT driver_location_pkey TO driver_location_partitioned_pkey")
+    op.execute("ALTER INDEX uq_driver_location_driver_id_timestamp RENAME TO uq_driver_location_partitioned_driver_id_timestamp")
+
+    op.execute(
+        f"""
+        CREATE TABLE driver_location (
+            {_create_columns_sql()},
+            CONSTRAINT driver_location_pkey PRIMARY KEY (id),
+            CONSTRAINT uq_driver_location_driver_id_timestamp UNIQUE (driver_id, timestamp)
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO driver_location
+            (driver_id, latitude, longitude, accuracy, speed, bearing, timestamp, id, created_at, updated_at)
+        SELECT driver_id, latitude, longitude, accuracy, speed, bearing, timestamp, id, created_at, updated_at
+        FROM driver_location_partitioned
+        """
+    )
+    op.execute("DROP TABLE driver_location_partitioned CASCADE")
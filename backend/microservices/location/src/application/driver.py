@@ -1,8 +1,9 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from application import get_logger
 from ftgo_utils.enums import DriverStatus, DriverAvailabilityStatus
 
 from domain.driver import Driver
+from domain.trajectory import DriverTrajectory
 
 class DriverService:
     @staticmethod
@@ -17,6 +18,11 @@ class DriverService:
         )
         return {}
 
+    @staticmethod
+    async def submit_locations_batch(submissions: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        results = await Driver.submit_locations_batch(submissions)
+        return {"results": results}
+
     @staticmethod
     async def change_status_online(driver_id: str, **kwargs) -> Dict[str, Any]:
         driver = await Driver.load(driver_id)
@@ -50,6 +56,29 @@ class DriverService:
             "longitude": location["longitude"],
         }
     
+    @staticmethod
+    async def get_location_history(
+        driver_id: str,
+        start: float,
+        end: float,
+        cursor: Optional[float] = None,
+        page_size: Optional[int] = None,
+        simplification: str = "none",
+        tolerance_m: float = 10.0,
+        bucket_s: float = 30.0,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        trajectory = DriverTrajectory(driver_id)
+        return await trajectory.load_page(
+            start=start,
+            end=end,
+            cursor=cursor,
+            page_size=page_size,
+            simplification=simplification,
+            tolerance_m=tolerance_m,
+            bucket_s=bucket_s,
+        )
+
     @staticmethod
     async def get_driver_status(driver_id: str, **kwargs) -> Dict[str, bool]:
         driver = await Driver.load(driver_id)
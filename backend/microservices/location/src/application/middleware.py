@@ -1,6 +1,8 @@
 from typing import Callable, Any, Dict
 from functools import wraps
 
+from prometheus_client import Counter
+
 from config import LayerNames, BaseConfig
 from application import get_logger
 
@@ -9,7 +11,13 @@ from ftgo_utils.errors import ErrorCodes, BaseError, ErrorCategories
 
 logger = get_logger()
 
-def event_middleware(event_name: str, func: Callable) -> Callable:
+ONE_WAY_EVENTS = Counter(
+    "location_one_way_events_total",
+    "Events received without a reply queue, by outcome; the caller never sees these failures.",
+    ["event", "outcome"],
+)
+
+def event_middleware(event_name: str, func: Callable, one_way: bool = False) -> Callable:
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Dict[str, Any]:
         try:
@@ -20,9 +28,13 @@ def event_middleware(event_name: str, func: Callable) -> Callable:
                 result = {}
 
             result['status'] = ResponseStatus.SUCCESS.value
+            if one_way:
+                ONE_WAY_EVENTS.labels(event=event_name, outcome=ResponseStatus.SUCCESS.value).inc()
             return result
 
         except BaseError as e:
+            if one_way:
+                ONE_WAY_EVENTS.labels(event=event_name, outcome=ResponseStatus.FAILURE.value).inc()
             logger.exception(f"Error in {event_name}: {e.error_code.value}", payload=e.to_dict())
             error_code = e.error_code
             if error_code.category != ErrorCategories.BUSINESS_LOGIC_ERROR:
@@ -33,6 +45,8 @@ def event_middleware(event_name: str, func: Callable) -> Callable:
             }
 
         except Exception as e:
+            if one_way:
+                ONE_WAY_EVENTS.labels(event=event_name, outcome=ResponseStatus.ERROR.value).inc()
             logger.exception(f"Error in {event_name}: {ErrorCodes.UNKNOWN_ERROR.value}", payload={"error": str(e)})
             return {
                 "status": ResponseStatus.ERROR.value,
@@ -0,0 +1,53 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from application import get_logger
+from config import LocationConfig
+from data_access.repository import DatabaseRepository
+from dto import DriverLocationDTO
+
+class LocationPartitionMaintainer:
+    """Keeps ``driver_location`` day partitions ahead of ingestion and within retention."""
+
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def maintain_once(cls) -> None:
+        config = LocationConfig.snapshot()
+        today = datetime.now(timezone.utc).date()
+        days = [today + timedelta(days=offset) for offset in range(config.history_partition_premake_days + 1)]
+        created = await DatabaseRepository.create_daily_partitions(DriverLocationDTO, days)
+        if created:
+            get_logger().info(f"Created {len(created)} location partitions", payload={"partitions": created})
+        cutoff = today - timedelta(days=config.history_retention_days)
+        dropped = await DatabaseRepository.drop_daily_partitions_before(DriverLocationDTO, cutoff)
+        if dropped:
+            get_logger().info(f"Dropped {len(dropped)} expired location partitions", payload={"partitions": dropped})
+
+    @classmethod
+    async def _run(cls) -> None:
+        logger = get_logger()
+        while True:
+            await asyncio.sleep(LocationConfig.snapshot().history_partition_maintenance_interval_s)
+            try:
+                await cls.maintain_once()
+            except Exception as e:
+                logger.exception("Location partition maintenance failed", payload={"error": str(e)})
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is None:
+            # The first run is awaited so today's partition exists before any submit is handled.
+            await cls.maintain_once()
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
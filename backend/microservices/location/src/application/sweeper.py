@@ -0,0 +1,57 @@
+import asyncio
+from typing import Optional
+
+from prometheus_client import Counter
+
+from application import get_logger
+from config import HexagonConfig
+from domain.spatial_index import get_spatial_index
+
+STALE_DRIVERS_EVICTED = Counter(
+    "location_stale_drivers_evicted_total",
+    "Drivers removed from the spatial index after going silent.",
+    ["engine"],
+)
+
+class StaleDriverSweeper:
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def sweep_once(cls) -> int:
+        config = HexagonConfig.snapshot()
+        spatial_index = get_spatial_index()
+        evicted_count = 0
+        while True:
+            evicted = await spatial_index.evict_stale_drivers()
+            evicted_count += len(evicted)
+            if len(evicted) < config.eviction_batch_size:
+                break
+        if evicted_count:
+            STALE_DRIVERS_EVICTED.labels(engine=config.spatial_engine).inc(evicted_count)
+            get_logger().info(f"Evicted {evicted_count} stale drivers", payload={"engine": config.spatial_engine})
+        return evicted_count
+
+    @classmethod
+    async def _run(cls) -> None:
+        logger = get_logger()
+        while True:
+            try:
+                await cls.sweep_once()
+            except Exception as e:
+                logger.exception("Stale driver sweep failed", payload={"error": str(e)})
+            await asyncio.sleep(HexagonConfig.snapshot().eviction_interval_s)
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
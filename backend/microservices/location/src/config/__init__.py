@@ -2,7 +2,8 @@ from config.base import BaseConfig, env_var
 from config.service import ServiceConfig
 from config.cache import RedisConfig
 from config.db import PostgresConfig
-from config.enums import LayerNames
+from config.enums import LayerNames, SpatialEngines, TrackSimplifications
 from config.status import DriverStatusConfig
 from config.hexagon import HexagonConfig
 from config.location import LocationConfig
+from config.metrics import MetricsConfig
@@ -1,9 +1,10 @@
 import os
-from typing import Any, Type, TypeVar, Callable
+from typing import Any, Dict, Type, TypeVar, Callable
 from pydantic import BaseModel, Field
 from decouple import config, UndefinedValueError
 
 T = TypeVar('T')
+C = TypeVar('C', bound='BaseConfig')
 
 def env_var(field_name: str, default: Any = None, cast_type: Callable[[str], T] = str) -> T:
     try:
@@ -20,16 +21,44 @@ def env_var(field_name: str, default: Any = None, cast_type: Callable[[str], T]
             raise ValueError(f"Failed to cast environment variable {field_name} to {cast_type.__name__}") from e
 
 class BaseConfig():
-    
+    _snapshots: Dict[type, 'BaseConfig'] = {}
+    _frozen: bool = False
+
     @classmethod
     def load_environment(cls):
         env = config("ENVIRONMENT", default='test')
         return env
-    
+
+    @classmethod
+    def snapshot(cls: Type[C]) -> C:
+        """Read-only instance built from the environment on first use and shared process-wide."""
+        instance = BaseConfig._snapshots.get(cls)
+        if instance is None:
+            instance = cls()
+            object.__setattr__(instance, "_frozen", True)
+            BaseConfig._snapshots[cls] = instance
+        return instance
+
+    @classmethod
+    def reload(cls) -> None:
+        """Drops the cached snapshot so the next ``snapshot()`` re-reads the environment.
+
+        Called on ``BaseConfig`` itself it drops the snapshots of every config class.
+        """
+        if cls is BaseConfig:
+            BaseConfig._snapshots.clear()
+        else:
+            BaseConfig._snapshots.pop(cls, None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"{self.__class__.__name__} snapshot is read-only; call reload() instead")
+        super().__setattr__(name, value)
+
     def __repr__(self):
         class_name = self.__class__.__name__
-        attributes = ', '.join(f'{key}={value!r}' for key, value in self.__dict__.items())
+        attributes = ', '.join(f'{key}={value!r}' for key, value in self.dict().items())
         return f'{class_name}({attributes})'
-    
+
     def dict(self):
-        return self.__dict__
+        return {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
@@ -8,9 +8,13 @@ class RedisConfig(BaseConfig):
         db: int = None,
         default_ttl: int = None,
         password: str = None,
+        codec: str = None,
     ):
         self.host = host or env_var("REDIS_HOST", "localhost")
         self.port = port or env_var("REDIS_PORT", 6300, int)
         self.db = db or env_var("REDIS_DB", 0, int)
         self.default_ttl = default_ttl or env_var("REDIS_DEFAULT_TTL", 600, int)
         self.password = password or env_var("REDIS_PASSWORD", "location_password")
+        # "json" or "packed_location". Builds older than the packed codec only read JSON, so set
+        # "packed_location" explicitly once every pod runs a build that can read it.
+        self.codec = codec or env_var("REDIS_CACHE_CODEC", "json")
@@ -5,3 +5,12 @@ class LayerNames(str, enum.Enum):
     DOMAIN = "domain"
     DATA_ACCESS = "data_access"
     MESSAGE_BROKER = "message_broker"
+
+class SpatialEngines(str, enum.Enum):
+    HEXAGON = "hexagon"
+    GEO = "geo"
+
+class TrackSimplifications(str, enum.Enum):
+    NONE = "none"
+    DOUGLAS_PEUCKER = "douglas_peucker"
+    TIME_BUCKET = "time_bucket"
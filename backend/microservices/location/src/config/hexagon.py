@@ -1,4 +1,5 @@
 from config.base import BaseConfig, env_var
+from config.enums import SpatialEngines
 
 class HexagonConfig(BaseConfig):
     def __init__(
@@ -9,6 +10,14 @@ class HexagonConfig(BaseConfig):
         driver_hexagon_cache_ttl: int = None,
         hexagon_resolution: int = None,
         k_ring_radius: int = None,
+        max_k_ring_radius: int = None,
+        spatial_engine: str = None,
+        geo_index_key: str = None,
+        available_cache_key: str = None,
+        last_seen_cache_key: str = None,
+        stale_driver_threshold_s: int = None,
+        eviction_interval_s: int = None,
+        eviction_batch_size: int = None,
     ):
         self.cache_key = cache_key or env_var("HEXAGONS_CACHE_KEY", default="hexagons_cache", cast_type=str)
         self.cache_ttl = cache_ttl or env_var("HEXAGONS_CACHE_TTL", default=10 * 60, cast_type=int)
@@ -16,3 +25,18 @@ class HexagonConfig(BaseConfig):
         self.driver_hexagon_cache_ttl = driver_hexagon_cache_ttl or env_var("DRIVER_HEXAGON_CACHE_TTL", default=10 * 60, cast_type=int)
         self.hexagon_resolution = hexagon_resolution or env_var("HEXAGON_RESOLUTION", default=8, cast_type=int)
         self.k_ring_radius = k_ring_radius or env_var("K_RING_RADIUS", default=1, cast_type=int)
+        self.max_k_ring_radius = max_k_ring_radius or env_var("MAX_K_RING_RADIUS", default=10, cast_type=int)
+        self.spatial_engine = spatial_engine or env_var("DRIVER_SPATIAL_ENGINE", default=SpatialEngines.HEXAGON.value, cast_type=str)
+        self.geo_index_key = geo_index_key or env_var("DRIVERS_GEO_INDEX_KEY", default="drivers_geo_index", cast_type=str)
+        self.available_cache_key = available_cache_key or env_var("AVAILABLE_HEXAGONS_CACHE_KEY", default="available_hexagons_cache", cast_type=str)
+        self.last_seen_cache_key = last_seen_cache_key or env_var("DRIVERS_LAST_SEEN_CACHE_KEY", default="drivers_last_seen", cast_type=str)
+        self.stale_driver_threshold_s = stale_driver_threshold_s or env_var("STALE_DRIVER_THRESHOLD_S", default=2 * 60, cast_type=int)
+        self.eviction_interval_s = eviction_interval_s or env_var("STALE_DRIVER_EVICTION_INTERVAL_S", default=30, cast_type=int)
+        self.eviction_batch_size = eviction_batch_size or env_var("STALE_DRIVER_EVICTION_BATCH_SIZE", default=500, cast_type=int)
+        # Eviction finds a driver's cell through the driver -> hexagon key; if that key expired
+        # first, the driver's entry in the cell hash could never be removed.
+        if self.stale_driver_threshold_s >= self.driver_hexagon_cache_ttl:
+            raise ValueError(
+                f"STALE_DRIVER_THRESHOLD_S ({self.stale_driver_threshold_s}) must be lower than "
+                f"DRIVER_HEXAGON_CACHE_TTL ({self.driver_hexagon_cache_ttl})"
+            )
@@ -10,6 +10,19 @@ class LocationConfig(BaseConfig):
         maximum_speed_threshold_m: int = None,
         keep_last_locations_count: int = None,
         maximum_location_to_store_per_driver: int = None,
+        region_cache_resolution: int = None,
+        region_cache_size: int = None,
+        history_flush_interval_ms: int = None,
+        history_flush_batch_size: int = None,
+        history_buffer_size: int = None,
+        history_flush_max_retries: int = None,
+        history_flush_retry_backoff_ms: int = None,
+        history_flush_max_retry_backoff_ms: int = None,
+        history_retention_days: int = None,
+        history_partition_premake_days: int = None,
+        history_partition_maintenance_interval_s: int = None,
+        history_page_size: int = None,
+        history_max_page_size: int = None,
     ):
         self.cache_key = cache_key or env_var("LOCATIONS_CACHE_KEY", default="locations_cache", cast_type=str)
         self.cache_ttl = cache_ttl or env_var("LOCATIONS_CACHE_TTL", default=10 * 60, cast_type=int)
@@ -18,3 +31,16 @@ class LocationConfig(BaseConfig):
         self.maximum_speed_threshold_m = maximum_speed_threshold_m or env_var("MAXIMUM_SPEED_THRESHOLD_M", default=150, cast_type=int)
         self.keep_last_locations_count = keep_last_locations_count or env_var("KEEP_LAST_LOCATIONS_COUNT", default=5, cast_type=int)
         self.maximum_location_to_store_per_driver = maximum_location_to_store_per_driver or env_var("MAXIMUM_LOCATION_TO_STORE_PER_DRIVER", default=20, cast_type=int)
+        self.region_cache_resolution = region_cache_resolution or env_var("REGION_CACHE_RESOLUTION", default=7, cast_type=int)
+        self.region_cache_size = region_cache_size or env_var("REGION_CACHE_SIZE", default=4096, cast_type=int)
+        self.history_flush_interval_ms = history_flush_interval_ms or env_var("HISTORY_FLUSH_INTERVAL_MS", default=200, cast_type=int)
+        self.history_flush_batch_size = history_flush_batch_size or env_var("HISTORY_FLUSH_BATCH_SIZE", default=500, cast_type=int)
+        self.history_buffer_size = history_buffer_size or env_var("HISTORY_BUFFER_SIZE", default=10_000, cast_type=int)
+        self.history_flush_max_retries = history_flush_max_retries or env_var("HISTORY_FLUSH_MAX_RETRIES", default=5, cast_type=int)
+        self.history_flush_retry_backoff_ms = history_flush_retry_backoff_ms or env_var("HISTORY_FLUSH_RETRY_BACKOFF_MS", default=200, cast_type=int)
+        self.history_flush_max_retry_backoff_ms = history_flush_max_retry_backoff_ms or env_var("HISTORY_FLUSH_MAX_RETRY_BACKOFF_MS", default=5000, cast_type=int)
+        self.history_retention_days = history_retention_days or env_var("HISTORY_RETENTION_DAYS", default=30, cast_type=int)
+        self.history_partition_premake_days = history_partition_premake_days or env_var("HISTORY_PARTITION_PREMAKE_DAYS", default=3, cast_type=int)
+        self.history_partition_maintenance_interval_s = history_partition_maintenance_interval_s or env_var("HISTORY_PARTITION_MAINTENANCE_INTERVAL_S", default=60 * 60, cast_type=int)
+        self.history_page_size = history_page_size or env_var("HISTORY_PAGE_SIZE", default=500, cast_type=int)
+        self.history_max_page_size = history_max_page_size or env_var("HISTORY_MAX_PAGE_SIZE", default=5000, cast_type=int)
@@ -0,0 +1,12 @@
+from config.base import BaseConfig, env_var
+
+class MetricsConfig(BaseConfig):
+    def __init__(
+        self,
+        port: int = None,
+        enabled: bool = None,
+    ):
+        self.port = port or env_var("METRICS_PORT", default=9100, cast_type=int)
+        self.enabled = enabled if enabled is not None else env_var(
+            "ENABLE_METRICS", default="true", cast_type=lambda s: isinstance(s, str) and s.lower() in ['true', '1']
+        )
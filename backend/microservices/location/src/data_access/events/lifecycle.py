@@ -6,6 +6,7 @@ from rabbitmq_rpc import RPCClient
 from data_access.repository.cache_repository import CacheRepository
 from data_access.repository.db_repository import DatabaseRepository
 from data_access.broker import RPCBroker
+from data_access.history_writer import LocationHistoryWriter
 
 from config import BaseConfig
 from data_access import get_logger
@@ -16,15 +17,20 @@ async def setup() -> None:
     logger.info("Connected to Redis")
     await DatabaseRepository.initialize()
     logger.info("Connected to PostgreSQL")
+    await LocationHistoryWriter.initialize()
+    logger.info("Started location history writer")
     await RPCBroker.initialize(asyncio.get_event_loop())
     logger.info("Connected to RabbitMQ")
 
 
 async def teardown() -> None:
     logger = get_logger()
-    await CacheRepository.terminate()
-    logger.info("Disconnected from Redis")
+    # Stop taking RPCs first so nothing reaches the history writer or the stores after they close.
+    await RPCBroker.terminate()
+    logger.info("Disconnected from RabbitMQ")
+    await LocationHistoryWriter.terminate()
+    logger.info("Flushed location history writer")
     await DatabaseRepository.terminate()
     logger.info("Disconnected from PostgreSQL")
-    await RPCBroker.terminate()
-    logger.info("Disconnected from RabbitMQ")
\ No newline at end of file
+    await CacheRepository.terminate()
+    logger.info("Disconnected from Redis")
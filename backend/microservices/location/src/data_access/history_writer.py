@@ -0,0 +1,149 @@
+import asyncio
+from typing import List, Optional
+
+from ftgo_utils.errors import ErrorCodes
+from prometheus_client import Counter
+from sqlalchemy.exc import DataError, IntegrityError
+
+from config import LocationConfig
+from data_access import get_logger
+from data_access.repository.db_repository import DatabaseRepository
+from dto import DriverLocationDTO
+
+HISTORY_ROWS_DROPPED = Counter(
+    "location_history_rows_dropped_total",
+    "Buffered location rows that could not be persisted and were discarded.",
+)
+HISTORY_FLUSH_RETRIES = Counter(
+    "location_history_flush_retries_total",
+    "History batch inserts retried after a transient database error.",
+)
+
+# Errors caused by the rows themselves; retrying the same rows cannot succeed.
+DATA_ERRORS = (IntegrityError, DataError)
+
+
+class LocationHistoryWriter:
+    """Write-behind buffer that persists driver locations in bulk.
+
+    Submits enqueue DTOs and return immediately; a background task flushes
+    them every ``history_flush_interval_ms`` or ``history_flush_batch_size``
+    rows, whichever comes first. ``enqueue`` waits when the buffer is full.
+
+    A batch that fails on a transient error, such as a dropped connection, is
+    retried with capped exponential backoff while new rows keep buffering. A
+    batch rejected for its data is bisected so that only the offending rows are
+    dropped.
+    """
+
+    _instance: 'LocationHistoryWriter' = None
+
+    def __init__(self, config: LocationConfig):
+        self._flush_interval_s = config.history_flush_interval_ms / 1000
+        self._batch_size = config.history_flush_batch_size
+        self._max_retries = config.history_flush_max_retries
+        self._retry_backoff_s = config.history_flush_retry_backoff_ms / 1000
+        self._max_retry_backoff_s = config.history_flush_max_retry_backoff_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=config.history_buffer_size)
+        self._closing = False
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def initialize(cls) -> None:
+        if cls._instance is not None:
+            return
+        instance = cls(LocationConfig.snapshot())
+        instance._task = asyncio.create_task(instance._run())
+        cls._instance = instance
+
+    @classmethod
+    async def enqueue(cls, locations: List[DriverLocationDTO]) -> None:
+        if cls._instance is None or cls._instance._closing:
+            await DatabaseRepository.bulk_insert(locations)
+            return
+        for location in locations:
+            await cls._instance._queue.put(location)
+
+    @classmethod
+    async def terminate(cls) -> None:
+        if cls._instance is None:
+            return
+        instance, cls._instance = cls._instance, None
+        instance._closing = True
+        await instance._task
+
+    async def _run(self) -> None:
+        while not (self._closing and self._queue.empty()):
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect_batch(self) -> List[DriverLocationDTO]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval_s
+        batch = []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - loop.time()
+            if timeout <= 0 or self._closing:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flush(self, batch: List[DriverLocationDTO]) -> None:
+        """Inserts ``batch``; gives up and drops it after ``history_flush_max_retries`` retries."""
+        backoff_s = self._retry_backoff_s
+        for attempt in range(self._max_retries + 1):
+            try:
+                await DatabaseRepository.bulk_insert(batch)
+                return
+            except Exception as e:
+                if self._is_data_error(e):
+                    await self._bisect(batch, e)
+                    return
+                error = e
+            if attempt < self._max_retries:
+                HISTORY_FLUSH_RETRIES.inc()
+                get_logger().warning(
+                    "Location history flush failed; retrying",
+                    payload={"rows": len(batch), "attempt": attempt + 1, "backoff_s": backoff_s, "error": str(error)},
+                )
+                await asyncio.sleep(backoff_s)
+                backoff_s = min(backoff_s * 2, self._max_retry_backoff_s)
+        self._drop(batch, error)
+
+    async def _bisect(self, batch: List[DriverLocationDTO], error: Exception) -> None:
+        if len(batch) == 1:
+            self._drop(batch, error)
+            return
+        middle = len(batch) // 2
+        await self._flush(batch[:middle])
+        await self._flush(batch[middle:])
+
+    @staticmethod
+    def _is_data_error(e: Optional[BaseException]) -> bool:
+        # Repository errors arrive wrapped in BaseError with the driver error as the cause.
+        while e is not None:
+            if isinstance(e, DATA_ERRORS):
+                return True
+            e = e.__cause__
+        return False
+
+    @staticmethod
+    def _drop(batch: List[DriverLocationDTO], error: Exception) -> None:
+        HISTORY_ROWS_DROPPED.inc(len(batch))
+        get_logger().error(
+            ErrorCodes.DB_INSERT_ERROR.value,
+            payload={
+                "rows": len(batch),
+                "driver_ids": sorted({location.driver_id for location in batch}),
+                "error": str(error),
+            },
+        )
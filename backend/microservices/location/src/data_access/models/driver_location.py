@@ -1,6 +1,6 @@
 from typing import Optional
 from datetime import datetime
-from sqlalchemy import String, DateTime, Float
+from sqlalchemy import String, DateTime, Float, Index
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 from sqlalchemy.sql import func
 
@@ -10,6 +10,8 @@ from ftgo_utils.uuid_gen import uuid4
 
 class DriverLocation(Base):
     __tablename__ = "driver_location"
+    # Range-partitioned by day; partitions are created and dropped by LocationPartitionMaintainer.
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
 
     driver_id: Mapped[str] = mapped_column(String, nullable=False)
 
@@ -20,7 +22,8 @@ class DriverLocation(Base):
     speed: Mapped[Optional[float]] = mapped_column(Float(precision=32), nullable=True)
     bearing: Mapped[Optional[float]] = mapped_column(Float(precision=32), nullable=True)
 
-    timestamp: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Part of the primary key because a partitioned table's unique keys must include the partition key.
+    timestamp: Mapped[DateTime] = mapped_column(DateTime(timezone=True), primary_key=True)
 
     @classmethod
     def from_dto(cls, dto: 'DriverLocationDTO') -> 'DriverLocation':
@@ -47,3 +50,12 @@ class DriverLocation(Base):
             timestamp=self.timestamp,
             created_at=self.created_at,
         )
+
+
+# Serves both ON CONFLICT DO NOTHING on the natural key and "latest points of a driver" reads.
+Index(
+    "uq_driver_location_driver_id_timestamp",
+    DriverLocation.driver_id,
+    DriverLocation.timestamp.desc(),
+    unique=True,
+)
@@ -1,5 +1,4 @@
-import json
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from aredis_client import AsyncRedis
 from ftgo_utils.errors import ErrorCodes
@@ -7,12 +6,20 @@ from ftgo_utils.errors import ErrorCodes
 from config import RedisConfig
 from data_access import get_logger
 from data_access.repository.base import BaseRepository
+from data_access.repository.codecs import CACHE_CODECS, CacheCodec, JsonCodec, PackedLocationCodec
+from data_access.repository.scripts import LUA_SCRIPTS
 from utils import handle_exception
 
 
 class CacheRepository(BaseRepository):
     _data_access: Optional[AsyncRedis] = None
     _group: str = ""
+    _groups: Dict[str, type] = {}
+    _script_shas: Dict[str, str] = {}
+    _codec: CacheCodec = JsonCodec()
+    # Reads accept every format this build can write, whatever the configured writer,
+    # so REDIS_CACHE_CODEC can be flipped one pod at a time.
+    _reader: CacheCodec = PackedLocationCodec()
 
     @classmethod
     async def initialize(cls) -> None:
@@ -24,11 +31,78 @@ class CacheRepository(BaseRepository):
                 db=cache_config.db,
                 password=cache_config.password,
             )
+            cls.set_codec(CACHE_CODECS[cache_config.codec]())
+            await cls.load_scripts()
         except Exception as e:
             payload = cache_config.dict()
             get_logger().error(ErrorCodes.CACHE_CONNECTION_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.CACHE_CONNECTION_ERROR, payload=payload)
 
+    @classmethod
+    def set_codec(cls, codec: CacheCodec) -> None:
+        cls._codec = codec
+
+    @classmethod
+    async def load_scripts(cls) -> None:
+        async with cls._data_access.get_or_create_session() as session:
+            for name, source in LUA_SCRIPTS.items():
+                cls._script_shas[name] = await session.script_load(source)
+
+    @classmethod
+    async def run_script(
+        cls,
+        name: str,
+        keys: List[str],
+        args: Optional[List[Any]] = None,
+    ) -> Any:
+        """Runs a script registered in ``LUA_SCRIPTS``; ``keys`` must already be prefixed."""
+        serialized_args = [cls._serialize_value(arg) for arg in (args or [])]
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                if name not in cls._script_shas:
+                    cls._script_shas[name] = await session.script_load(LUA_SCRIPTS[name])
+                try:
+                    result = await session.evalsha(cls._script_shas[name], len(keys), *keys, *serialized_args)
+                except Exception as e:
+                    # The script cache is emptied by a Redis restart or SCRIPT FLUSH.
+                    if "NOSCRIPT" not in str(e):
+                        raise
+                    cls._script_shas[name] = await session.script_load(LUA_SCRIPTS[name])
+                    result = await session.evalsha(cls._script_shas[name], len(keys), *keys, *serialized_args)
+                return cls._deserialize_value(result) if result else None
+        except Exception as e:
+            payload = {"script": name, "keys": keys}
+            get_logger().error(ErrorCodes.CACHE_INSERT_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.CACHE_INSERT_ERROR, payload=payload)
+
+    @classmethod
+    async def run_script_many(cls, name: str, calls: List[Tuple[List[str], List[Any]]]) -> List[Any]:
+        """Runs a script once per ``(keys, args)`` pair in a single pipeline; results keep call order."""
+        if not calls:
+            return []
+        serialized_calls = [(keys, [cls._serialize_value(arg) for arg in args]) for keys, args in calls]
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                if name not in cls._script_shas:
+                    cls._script_shas[name] = await session.script_load(LUA_SCRIPTS[name])
+                for attempt in range(2):
+                    pipeline = session.pipeline()
+                    for keys, args in serialized_calls:
+                        pipeline.evalsha(cls._script_shas[name], len(keys), *keys, *args)
+                    try:
+                        results = await pipeline.execute()
+                        break
+                    except Exception as e:
+                        # Re-running is safe: the scripts run through this path are idempotent.
+                        if "NOSCRIPT" not in str(e) or attempt:
+                            raise
+                        cls._script_shas[name] = await session.script_load(LUA_SCRIPTS[name])
+                return [cls._deserialize_value(result) if result else None for result in results]
+        except Exception as e:
+            payload = {"script": name, "calls": len(calls)}
+            get_logger().error(ErrorCodes.CACHE_INSERT_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.CACHE_INSERT_ERROR, payload=payload)
+
     @classmethod
     async def fetch(
         cls,
@@ -81,6 +155,56 @@ class CacheRepository(BaseRepository):
             get_logger().error(ErrorCodes.CACHE_FETCH_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.CACHE_FETCH_ERROR, payload=payload)
 
+    @classmethod
+    async def fetch_by_score(cls, key: str, max_score: float, count: Optional[int] = None) -> List[str]:
+        """Returns the members of sorted set ``key`` scored at most ``max_score``, lowest first."""
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                pipeline = session.pipeline()
+                pipeline.zrangebyscore(
+                    cls._prefixed_key(key), "-inf", max_score, start=0 if count else None, num=count,
+                )
+                (members,) = await pipeline.execute()
+                return list(members or [])
+        except Exception as e:
+            payload = {"key": key, "max_score": max_score, "count": count}
+            get_logger().error(ErrorCodes.CACHE_FETCH_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.CACHE_FETCH_ERROR, payload=payload)
+
+    @classmethod
+    async def geo_search(
+        cls,
+        key: str,
+        longitude: float,
+        latitude: float,
+        radius_m: float,
+        count: Optional[int] = None,
+    ) -> List[Tuple[str, float, float, float]]:
+        """Returns ``(member, distance_m, longitude, latitude)`` tuples, closest first."""
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                pipeline = session.pipeline()
+                pipeline.geosearch(
+                    cls._prefixed_key(key),
+                    longitude=longitude,
+                    latitude=latitude,
+                    radius=radius_m,
+                    unit="m",
+                    sort="ASC",
+                    count=count,
+                    withdist=True,
+                    withcoord=True,
+                )
+                (results,) = await pipeline.execute()
+                return [
+                    (member, float(distance), float(coordinates[0]), float(coordinates[1]))
+                    for member, distance, coordinates in results or []
+                ]
+        except Exception as e:
+            payload = {"key": key, "longitude": longitude, "latitude": latitude, "radius_m": radius_m}
+            get_logger().error(ErrorCodes.CACHE_FETCH_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.CACHE_FETCH_ERROR, payload=payload)
+
     @classmethod
     async def update(
         cls,
@@ -112,6 +236,11 @@ class CacheRepository(BaseRepository):
                     elif data_type == "list" and isinstance(value, list):
                         for item in value:
                             pipeline.rpush(cls._prefixed_key(key), cls._serialize_value(item))
+                    elif data_type == "zset" and isinstance(value, dict):
+                        pipeline.zadd(cls._prefixed_key(key), value)
+                    elif data_type == "geo" and isinstance(value, dict):
+                        for member, (longitude, latitude) in value.items():
+                            pipeline.geoadd(cls._prefixed_key(key), [longitude, latitude, member])
                     else:
                         pipeline.set(cls._prefixed_key(key), cls._serialize_value(value), ex=ttl)
                 await pipeline.execute()
@@ -138,6 +267,10 @@ class CacheRepository(BaseRepository):
                         else:
                             fields_to_delete = fields
                         pipeline.hdel(cls._prefixed_key(key), *fields_to_delete)
+                elif data_type in ("geo", "zset") and fields:
+                    members = [fields] if isinstance(fields, str) else fields
+                    for key in to_delete_keys:
+                        pipeline.zrem(cls._prefixed_key(key), *members)
                 else:
                     for key in to_delete_keys:
                         pipeline.delete(cls._prefixed_key(key))
@@ -179,20 +312,23 @@ class CacheRepository(BaseRepository):
 
     @classmethod
     def _prefixed_key(cls, key: str) -> str:
-        return f"{cls._group}:{key}"
+        return cls.key_for(cls._group, key)
+
+    @staticmethod
+    def key_for(group: str, key: str) -> str:
+        return f"{group}:{key}"
 
     @classmethod
     def _serialize_value(cls, value: Union[str, dict]) -> str:
-        return json.dumps(value) if isinstance(value, dict) else value
+        return cls._codec.encode(value)
 
     @classmethod
     def _deserialize_value(cls, value: str) -> Union[str, dict]:
-        try:
-            return json.loads(str(value))
-        except Exception as e:
-            return value
+        return cls._reader.decode(value)
 
     @classmethod
     def get_cache(cls, group: str = "") -> "CacheRepository":
-        cls._group = group
-        return cls
+        # One subclass per group, so callers using different groups do not overwrite each other's prefix.
+        if group not in CacheRepository._groups:
+            CacheRepository._groups[group] = type(f"{CacheRepository.__name__}[{group}]", (CacheRepository,), {"_group": group})
+        return CacheRepository._groups[group]
@@ -0,0 +1,89 @@
+import json
+import struct
+from typing import Any, Dict, Type
+
+
+class CacheCodec:
+    """Turns values into what ``CacheRepository`` stores in Redis, and back."""
+
+    def encode(self, value: Any) -> Any:
+        raise NotImplementedError
+
+    def decode(self, value: Any) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(CacheCodec):
+    def encode(self, value: Any) -> Any:
+        return json.dumps(value) if isinstance(value, dict) else value
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode("utf-8")
+        try:
+            return json.loads(str(value))
+        except Exception:
+            return value
+
+
+class PackedLocationCodec(JsonCodec):
+    """Packs location payloads into a fixed binary layout; every other value stays JSON.
+
+    Packed values are bytes, little endian: the ``MAGIC`` byte, a version byte, a
+    bitmask of the optional fields that are present, latitude, longitude and
+    timestamp as float64, then accuracy, speed and bearing as float32. 0xFF never
+    occurs in UTF-8 text, so the first byte alone tells a packed value from JSON or
+    a plain string. ``province`` and ``country`` are not stored since ``GeoLocation``
+    derives them from the coordinates. Packed values can only be read back through
+    a Redis connection that returns raw bytes.
+
+    Readers accept every version they know plus JSON, so a rolling deploy only
+    has to ship readers before switching writers to a new version.
+    """
+
+    MAGIC = 0xFF
+    VERSION = 1
+    _layout = struct.Struct("<BBBdddfff")
+    _optional_fields = ("timestamp", "accuracy", "speed", "bearing")
+    _location_fields = frozenset(("latitude", "longitude", "province", "country") + _optional_fields)
+
+    def encode(self, value: Any) -> Any:
+        if not self._is_location(value):
+            return super().encode(value)
+        present = 0
+        optional_values = []
+        for bit, field in enumerate(self._optional_fields):
+            field_value = value.get(field)
+            if field_value is not None:
+                present |= 1 << bit
+            optional_values.append(field_value or 0)
+        return self._layout.pack(self.MAGIC, self.VERSION, present, value["latitude"], value["longitude"], *optional_values)
+
+    def decode(self, value: Any) -> Any:
+        if not isinstance(value, (bytes, bytearray)) or not value or value[0] != self.MAGIC:
+            return super().decode(value)
+        if len(value) < 2 or value[1] != self.VERSION:
+            raise ValueError(f"Unsupported packed location version {value[1] if len(value) > 1 else None}")
+        _, _, present, latitude, longitude, *optional_values = self._layout.unpack(value)
+        location = {"latitude": latitude, "longitude": longitude}
+        for bit, (field, field_value) in enumerate(zip(self._optional_fields, optional_values)):
+            if not present & (1 << bit):
+                location[field] = None
+            elif field == "timestamp" and float(field_value).is_integer():
+                location[field] = int(field_value)
+            else:
+                location[field] = field_value
+        return location
+
+    def _is_location(self, value: Any) -> bool:
+        if not isinstance(value, dict) or not value.keys() <= self._location_fields:
+            return False
+        if not isinstance(value.get("latitude"), (int, float)) or not isinstance(value.get("longitude"), (int, float)):
+            return False
+        return all(value.get(field) is None or isinstance(value[field], (int, float)) for field in self._optional_fields)
+
+
+CACHE_CODECS: Dict[str, Type[CacheCodec]] = {
+    "json": JsonCodec,
+    "packed_location": PackedLocationCodec,
+}
@@ -1,8 +1,12 @@
-from typing import Optional, List, Dict, Type, Union
+from datetime import date, timedelta
+from typing import Any, Optional, List, Dict, Tuple, Type, Union
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.future import select
 
 from asyncpg_client import AsyncPostgres
 from ftgo_utils.errors import ErrorCodes
+from ftgo_utils.uuid_gen import uuid4
 from config import PostgresConfig
 from data_access import get_logger
 from data_access.repository.base import BaseRepository
@@ -60,27 +64,79 @@ class DatabaseRepository(BaseRepository):
             get_logger().error(ErrorCodes.DB_FETCH_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.DB_FETCH_ERROR, payload=payload)
 
+    @classmethod
+    async def fetch_range(
+        cls,
+        dto_class: Type[BaseDTO],
+        query: Dict[str, Union[str, int, float]],
+        range_field: str,
+        lower: Any,
+        upper: Any,
+        columns: List[str],
+        limit: int,
+        lower_inclusive: bool = True,
+    ) -> List[Tuple]:
+        """Returns only ``columns`` of the rows matching ``query`` whose ``range_field`` lies
+        between ``lower`` and ``upper`` (inclusive), ascending by it, at most ``limit`` rows."""
+        model_class = cls._get_model_class(dto_class)
+        try:
+            range_column = getattr(model_class, range_field)
+            lower_bound = range_column >= lower if lower_inclusive else range_column > lower
+            statement = (
+                select(*[getattr(model_class, column) for column in columns])
+                .filter_by(**query)
+                .where(lower_bound, range_column <= upper)
+                .order_by(range_column)
+                .limit(limit)
+            )
+            async with cls._data_access.get_or_create_session() as session:
+                result = await session.execute(statement)
+                return [tuple(row) for row in result.all()]
+        except Exception as e:
+            payload = dict(model=model_class.__name__, query=query, range_field=range_field)
+            get_logger().error(ErrorCodes.DB_FETCH_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.DB_FETCH_ERROR, payload=payload)
+
     @classmethod
     async def insert(cls, dto_instances: Union[List[BaseDTO], BaseDTO], **kwargs) -> Union[BaseDTO, List[BaseDTO], None]:
+        """Inserts rows idempotently; rows that hit a unique key are skipped and not returned."""
         if not dto_instances:
             return None
         dto_instances = [dto_instances] if not isinstance(dto_instances, list) else dto_instances
         model_class = cls._get_model_class(type(dto_instances[0]))
-        model_instances = [model_class.from_dto(dto) for dto in dto_instances]
+        rows = cls._to_rows(model_class, dto_instances)
         try:
             async with cls._data_access.get_or_create_session() as session:
-                session.add_all(model_instances)
-                await session.flush()
+                statement = insert(model_class).on_conflict_do_nothing().returning(model_class)
+                result = await session.execute(statement, rows)
+                model_instances = result.scalars().all()
                 await session.commit()
-                for instance in model_instances:
-                    await session.refresh(instance)
                 casted_instances = [instance.to_dto() for instance in model_instances]
+                if not casted_instances:
+                    return None
                 return casted_instances[0] if len(casted_instances) == 1 else casted_instances
         except Exception as e:
             payload = dict(dto=[dto.to_dict() for dto in dto_instances])
             get_logger().error(ErrorCodes.DB_INSERT_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.DB_INSERT_ERROR, payload=payload)
 
+    @classmethod
+    async def bulk_insert(cls, dto_instances: List[BaseDTO], **kwargs) -> int:
+        """Inserts rows with one multi-row INSERT ... ON CONFLICT DO NOTHING; returns the number of rows sent."""
+        if not dto_instances:
+            return 0
+        model_class = cls._get_model_class(type(dto_instances[0]))
+        rows = cls._to_rows(model_class, dto_instances)
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                await session.execute(insert(model_class).on_conflict_do_nothing(), rows)
+                await session.commit()
+                return len(rows)
+        except Exception as e:
+            payload = dict(model=model_class.__name__, count=len(rows))
+            get_logger().error(ErrorCodes.DB_INSERT_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.DB_INSERT_ERROR, payload=payload)
+
     @classmethod
     async def update(
         cls,
@@ -130,6 +186,109 @@ class DatabaseRepository(BaseRepository):
             get_logger().error(ErrorCodes.DB_DELETE_ERROR.value, payload=payload)
             await handle_exception(e=e, error_code=ErrorCodes.DB_DELETE_ERROR, payload=payload)
 
+    @classmethod
+    async def create_daily_partitions(cls, dto_class: Type[BaseDTO], days: List[date], range_field: str = "timestamp") -> List[str]:
+        """Creates the missing day partitions (UTC) of a range-partitioned table; returns the ones created.
+
+        Rows the table's DEFAULT partition already holds for a new day are moved into it, since
+        Postgres refuses to add a partition whose range the default partition has rows for.
+        """
+        table_name = cls._get_model_class(dto_class).__tablename__
+        default_name = cls._default_partition_name(table_name)
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                existing = set(await cls._partition_names(session, table_name))
+                created = []
+                for day in days:
+                    partition_name = cls._partition_name(table_name, day)
+                    if partition_name in existing:
+                        continue
+                    lower = f"'{day.isoformat()} 00:00:00+00'"
+                    upper = f"'{(day + timedelta(days=1)).isoformat()} 00:00:00+00'"
+                    bounds = f"FROM ({lower}) TO ({upper})"
+                    if default_name in existing:
+                        await session.execute(text(f'CREATE TABLE "{partition_name}" (LIKE "{table_name}" INCLUDING DEFAULTS)'))
+                        await session.execute(text(
+                            f'WITH moved AS (DELETE FROM "{default_name}" '
+                            f'WHERE "{range_field}" >= {lower} AND "{range_field}" < {upper} RETURNING *) '
+                            f'INSERT INTO "{partition_name}" SELECT * FROM moved'
+                        ))
+                        await session.execute(text(f'ALTER TABLE "{table_name}" ATTACH PARTITION "{partition_name}" FOR VALUES {bounds}'))
+                    else:
+                        await session.execute(text(f'CREATE TABLE IF NOT EXISTS "{partition_name}" PARTITION OF "{table_name}" FOR VALUES {bounds}'))
+                    created.append(partition_name)
+                await session.commit()
+                return created
+        except Exception as e:
+            payload = dict(table=table_name, days=[day.isoformat() for day in days])
+            get_logger().error(ErrorCodes.DB_INSERT_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.DB_INSERT_ERROR, payload=payload)
+
+    @classmethod
+    async def drop_daily_partitions_before(cls, dto_class: Type[BaseDTO], cutoff: date, range_field: str = "timestamp") -> List[str]:
+        """Drops the day partitions that end on or before ``cutoff``, and the DEFAULT partition's
+        rows older than it; returns the dropped partition names."""
+        table_name = cls._get_model_class(dto_class).__tablename__
+        default_name = cls._default_partition_name(table_name)
+        try:
+            async with cls._data_access.get_or_create_session() as session:
+                partition_names = await cls._partition_names(session, table_name)
+                expired = [
+                    partition_name for partition_name in partition_names
+                    if partition_name < cls._partition_name(table_name, cutoff)
+                    and partition_name.startswith(f"{table_name}_p")
+                ]
+                for partition_name in expired:
+                    await session.execute(text(f'DROP TABLE IF EXISTS "{partition_name}"'))
+                if default_name in partition_names:
+                    await session.execute(text(
+                        f'DELETE FROM "{default_name}" WHERE "{range_field}" < \'{cutoff.isoformat()} 00:00:00+00\''
+                    ))
+                await session.commit()
+                return expired
+        except Exception as e:
+            payload = dict(table=table_name, cutoff=cutoff.isoformat())
+            get_logger().error(ErrorCodes.DB_DELETE_ERROR.value, payload=payload)
+            await handle_exception(e=e, error_code=ErrorCodes.DB_DELETE_ERROR, payload=payload)
+
+    @staticmethod
+    async def _partition_names(session, table_name: str) -> List[str]:
+        result = await session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+                "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+                "WHERE parent.relname = :table_name"
+            ),
+            {"table_name": table_name},
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    def _default_partition_name(table_name: str) -> str:
+        return f"{table_name}_default"
+
+    @staticmethod
+    def _partition_name(table_name: str, day: date) -> str:
+        return f"{table_name}_p{day:%Y%m%d}"
+
+    @staticmethod
+    def _to_rows(model_class: Type[Base], dto_instances: List[BaseDTO]) -> List[Dict[str, object]]:
+        rows = []
+        for dto in dto_instances:
+            instance = model_class.from_dto(dto)
+            # Every row carries the same keys so the batch compiles to a single statement;
+            # only unset server-defaulted columns are left to the database.
+            row = {
+                column.name: getattr(instance, column.name)
+                for column in model_class.__table__.columns
+                if column.server_default is None or getattr(instance, column.name) is not None
+            }
+            if row.get("id") is None:
+                row["id"] = uuid4()
+            rows.append(row)
+        return rows
+
     @classmethod
     def _get_model_class(cls, dto: Union[BaseDTO, Type[BaseDTO]]) -> Type[Base]:
         if isinstance(dto, type):
@@ -0,0 +1,151 @@
+from typing import Dict
+
+# Every key a script touches is passed in KEYS, so callers read the driver's previous cell
+# first and pass the id they saw as ARGV. A script returns 0 without writing anything when
+# the driver moved in between, and 1 once it has run; callers then retry with a fresh read.
+
+# KEYS[1]: driver -> hexagon key, KEYS[2]: target hexagon hash, KEYS[3]: target available-drivers hash,
+# KEYS[4]: drivers last-seen sorted set, KEYS[5] and KEYS[6]: previous hexagon hash and available-drivers
+# hash, only when the driver changes cell
+# ARGV[1]: driver id, ARGV[2]: target hexagon id, ARGV[3]: serialized location, ARGV[4]: driver -> hexagon ttl,
+# ARGV[5]: '1' when the driver is available for dispatch, ARGV[6]: current timestamp, ARGV[7]: hexagon hash ttl,
+# ARGV[8]: previous hexagon id the caller read, '' when there was none
+MOVE_DRIVER_TO_HEXAGON = """
+if (redis.call('GET', KEYS[1]) or '') ~= ARGV[8] then
+    return 0
+end
+if KEYS[5] then
+    redis.call('HDEL', KEYS[5], ARGV[1])
+    redis.call('HDEL', KEYS[6], ARGV[1])
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[7]))
+if ARGV[5] == '1' then
+    redis.call('HSET', KEYS[3], ARGV[1], ARGV[3])
+    redis.call('EXPIRE', KEYS[3], tonumber(ARGV[7]))
+else
+    redis.call('HDEL', KEYS[3], ARGV[1])
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', tonumber(ARGV[4]))
+redis.call('ZADD', KEYS[4], tonumber(ARGV[6]), ARGV[1])
+return 1
+"""
+
+# KEYS[1]: driver -> hexagon key, KEYS[2]: drivers last-seen sorted set, KEYS[3] and KEYS[4]: current
+# hexagon hash and available-drivers hash, only when the driver has a cell
+# ARGV[1]: driver id, ARGV[2]: hexagon id the caller read, '' when there was none
+REMOVE_DRIVER_FROM_HEXAGON = """
+if (redis.call('GET', KEYS[1]) or '') ~= ARGV[2] then
+    return 0
+end
+if KEYS[3] then
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    redis.call('HDEL', KEYS[4], ARGV[1])
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS[1]: drivers last-seen sorted set, KEYS[2]: driver -> hexagon key, KEYS[3] and KEYS[4]: current
+# hexagon hash and available-drivers hash, only when the driver has a cell
+# ARGV[1]: driver id, ARGV[2]: last-seen cutoff timestamp, ARGV[3]: hexagon id the caller read, '' when none
+EVICT_STALE_DRIVER = """
+local last_seen = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not last_seen or tonumber(last_seen) > tonumber(ARGV[2]) then
+    return 0
+end
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[3] then
+    return 0
+end
+if KEYS[3] then
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    redis.call('HDEL', KEYS[4], ARGV[1])
+end
+redis.call('DEL', KEYS[2])
+redis.call('ZREM', KEYS[1], ARGV[1])
+return 1
+"""
+
+# KEYS[1]: driver -> hexagon key, KEYS[2] and KEYS[3]: current hexagon hash and available-drivers hash,
+# only when the driver has a cell
+# ARGV[1]: driver id, ARGV[2]: '1' when the driver is available for dispatch,
+# ARGV[3]: hexagon id the caller read, '' when there was none
+SET_DRIVER_AVAILABILITY = """
+if (redis.call('GET', KEYS[1]) or '') ~= ARGV[3] then
+    return 0
+end
+if not KEYS[2] then
+    return 1
+end
+if ARGV[2] == '1' then
+    local location = redis.call('HGET', KEYS[2], ARGV[1])
+    if location then
+        redis.call('HSET', KEYS[3], ARGV[1], location)
+    end
+else
+    redis.call('HDEL', KEYS[3], ARGV[1])
+end
+return 1
+"""
+
+# KEYS[1]: online drivers GEO set, KEYS[2]: available drivers GEO set, KEYS[3]: drivers last-seen sorted set
+# ARGV[1]: driver id, ARGV[2]: longitude, ARGV[3]: latitude, ARGV[4]: '1' when the driver is available
+# for dispatch, ARGV[5]: current timestamp
+GEO_ADD_DRIVER = """
+redis.call('GEOADD', KEYS[1], ARGV[2], ARGV[3], ARGV[1])
+if ARGV[4] == '1' then
+    redis.call('GEOADD', KEYS[2], ARGV[2], ARGV[3], ARGV[1])
+else
+    redis.call('ZREM', KEYS[2], ARGV[1])
+end
+redis.call('ZADD', KEYS[3], tonumber(ARGV[5]), ARGV[1])
+return 1
+"""
+
+# KEYS[1]: online drivers GEO set, KEYS[2]: available drivers GEO set, KEYS[3]: drivers last-seen sorted set
+# ARGV[1]: driver id
+GEO_REMOVE_DRIVER = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return 1
+"""
+
+# KEYS[1]: online drivers GEO set, KEYS[2]: available drivers GEO set
+# ARGV[1]: driver id, ARGV[2]: '1' when the driver is available for dispatch
+GEO_SET_DRIVER_AVAILABILITY = """
+if ARGV[2] == '1' then
+    local position = redis.call('GEOPOS', KEYS[1], ARGV[1])[1]
+    if not position then
+        return 0
+    end
+    redis.call('GEOADD', KEYS[2], position[1], position[2], ARGV[1])
+    return 1
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS[1]: drivers last-seen sorted set, KEYS[2]: online drivers GEO set, KEYS[3]: available drivers GEO set
+# ARGV[1]: last-seen cutoff timestamp, ARGV[2]: maximum drivers to evict
+GEO_EVICT_STALE_DRIVERS = """
+local stale = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, driver_id in ipairs(stale) do
+    redis.call('ZREM', KEYS[2], driver_id)
+    redis.call('ZREM', KEYS[3], driver_id)
+    redis.call('ZREM', KEYS[1], driver_id)
+end
+return stale
+"""
+
+LUA_SCRIPTS: Dict[str, str] = {
+    "move_driver_to_hexagon": MOVE_DRIVER_TO_HEXAGON,
+    "remove_driver_from_hexagon": REMOVE_DRIVER_FROM_HEXAGON,
+    "set_driver_availability": SET_DRIVER_AVAILABILITY,
+    "geo_add_driver": GEO_ADD_DRIVER,
+    "geo_remove_driver": GEO_REMOVE_DRIVER,
+    "geo_set_driver_availability": GEO_SET_DRIVER_AVAILABILITY,
+    "evict_stale_driver": EVICT_STALE_DRIVER,
+    "geo_evict_stale_drivers": GEO_EVICT_STALE_DRIVERS,
+}
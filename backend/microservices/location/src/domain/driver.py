@@ -1,11 +1,10 @@
-import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from config import DriverStatusConfig
 from data_access.repository import DatabaseRepository, CacheRepository
 from domain.geo_location import GeoLocation
 from domain.driver_location import DriverLocation
-from domain.hexagon import Hexagon
+from domain.spatial_index import get_spatial_index
 from ftgo_utils.enums import DriverStatus, DriverAvailabilityStatus
 from ftgo_utils.errors import ErrorCodes, BaseError
 from ftgo_utils.logger import get_logger
@@ -19,11 +18,11 @@ class Driver:
 
     @property
     def config(self) -> DriverStatusConfig:
-        return DriverStatusConfig()
+        return DriverStatusConfig.snapshot()
 
     @classmethod
     def get_status_cache(cls) -> CacheRepository:
-        status_config = DriverStatusConfig()
+        status_config = DriverStatusConfig.snapshot()
         return CacheRepository.get_cache(status_config.cache_key)
 
     def is_available(self) -> bool:
@@ -41,32 +40,61 @@ class Driver:
                 status = DriverStatus.OFFLINE.value
                 availability = DriverAvailabilityStatus.AVAILABLE.value
                 status_dict = {"status": status, "availability": availability}
-                await status_cache.insert(driver_id, status_dict, ttl=DriverStatusConfig().cache_ttl)
+                await status_cache.insert(driver_id, status_dict, ttl=DriverStatusConfig.snapshot().cache_ttl)
             return Driver(driver_id=driver_id, status=status_dict['status'], availability=status_dict['availability'])
         except Exception as e:
             payload = {"driver_id": driver_id, "error": str(e)}
             get_logger().error(ErrorCodes.DRIVER_STATUS_LOAD_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.DRIVER_STATUS_LOAD_ERROR, payload=payload)
 
+    @staticmethod
+    async def load_many(driver_ids: List[str]) -> List["Driver"]:
+        """Loads drivers with a single pipelined read; missing statuses default to offline and are not written back."""
+        try:
+            if not driver_ids:
+                return []
+            status_cache = Driver.get_status_cache()
+            status_dicts = await status_cache.fetch(driver_ids)
+            drivers = []
+            for driver_id, status_dict in zip(driver_ids, status_dicts):
+                if not isinstance(status_dict, dict) or 'status' not in status_dict:
+                    status_dict = {
+                        "status": DriverStatus.OFFLINE.value,
+                        "availability": DriverAvailabilityStatus.AVAILABLE.value,
+                    }
+                drivers.append(Driver(driver_id=driver_id, status=status_dict['status'], availability=status_dict['availability']))
+            return drivers
+        except Exception as e:
+            payload = {"driver_ids": driver_ids, "error": str(e)}
+            get_logger().error(ErrorCodes.DRIVER_STATUS_LOAD_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.DRIVER_STATUS_LOAD_ERROR, payload=payload)
+
     @staticmethod
     async def get_nearest_drivers(
         latitude: float,
         longitude: float,
         radius_m: int = 100,
         max_driver_count: Optional[int] = None,
-    ) -> List[str]:
+    ) -> List[dict]:
         try:
-            nearest_drivers = await Hexagon.get_nearest_drivers(latitude, longitude, radius_m)
-            if max_driver_count:
-                nearest_drivers = nearest_drivers[:max_driver_count]
-                
-            driver_ids = [driver_data["driver_id"] for driver_data in nearest_drivers]
-            drivers = await asyncio.gather(*[Driver.load(driver_id) for driver_id in driver_ids])
-            nearest_available_drivers = []
-            for driver, driver_data in zip(drivers, nearest_drivers):
-                if driver and driver.is_available():
-                    nearest_available_drivers.append(driver_data)
-            return nearest_available_drivers
+            # The spatial index only holds dispatchable drivers, but a status key can expire before
+            # the index entry does. Candidates are re-checked, and the index is asked for more until
+            # ``max_driver_count`` survive or it has no more drivers within the radius.
+            index = get_spatial_index()
+            available: Dict[str, bool] = {}
+            fetch_count = max_driver_count
+            while True:
+                candidates = await index.get_nearest_drivers(
+                    latitude, longitude, radius_m, max_count=fetch_count, available_only=True,
+                )
+                unchecked = [candidate.driver_id for candidate in candidates if candidate.driver_id not in available]
+                for driver in await Driver.load_many(unchecked):
+                    available[driver.driver_id] = driver.is_available()
+                nearest_available_drivers = [candidate for candidate in candidates if available[candidate.driver_id]]
+                if not max_driver_count or len(nearest_available_drivers) >= max_driver_count or len(candidates) < fetch_count:
+                    break
+                fetch_count *= 2
+            return [candidate.to_dict() for candidate in nearest_available_drivers[:max_driver_count]]
         except Exception as e:
             payload = {"latitude": latitude, "longitude": longitude, "error": str(e)}
             get_logger().error(ErrorCodes.GET_NEAREST_DRIVERS_ERROR.value, payload=payload)
@@ -86,12 +114,52 @@ class Driver:
                 )
                 self.status = DriverStatus.ONLINE.value
             else:
-                await driver_location.save_locations()
+                await driver_location.save_locations(is_available=self.is_available())
         except Exception as e:
             payload = {"driver_id": self.driver_id, "locations": [location.to_dict() for location in locations], "error": str(e)}
             get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
 
+    @staticmethod
+    async def submit_locations_batch(submissions: List[dict]) -> List[dict]:
+        """Submits locations for many drivers at once and reports a result per driver.
+
+        Online drivers are saved together through ``DriverLocation.save_many``; offline
+        drivers take the regular per-driver path that brings them online. Submissions for
+        the same driver are merged. A failure only marks the drivers it affected.
+        """
+        locations_by_driver: Dict[str, List[dict]] = {}
+        for submission in submissions:
+            locations_by_driver.setdefault(submission["driver_id"], []).extend(submission.get("locations") or [])
+        results = {driver_id: {"driver_id": driver_id, "success": True} for driver_id in locations_by_driver}
+
+        def mark_failed(driver_ids: List[str], e: Exception) -> None:
+            error_code = e.error_code if isinstance(e, BaseError) else ErrorCodes.LOCATION_SAVE_ERROR
+            for driver_id in driver_ids:
+                results[driver_id] = {"driver_id": driver_id, "success": False, "error_code": error_code.value}
+
+        try:
+            drivers = await Driver.load_many(list(locations_by_driver))
+        except Exception as e:
+            mark_failed(list(locations_by_driver), e)
+            return list(results.values())
+
+        online = []
+        for driver in drivers:
+            try:
+                if driver.status == DriverStatus.OFFLINE.value:
+                    await driver.submit_locations(locations_by_driver[driver.driver_id])
+                    continue
+                geo_locations = [GeoLocation.from_dict(loc) for loc in locations_by_driver[driver.driver_id]]
+                online.append((DriverLocation(driver_id=driver.driver_id, locations=geo_locations), driver.is_available()))
+            except Exception as e:
+                mark_failed([driver.driver_id], e)
+        try:
+            await DriverLocation.save_many(online)
+        except Exception as e:
+            mark_failed([driver_location.driver_id for driver_location, _ in online], e)
+        return list(results.values())
+
     async def _update_cache(self, status: Optional[str] = None, availability: Optional[str] = None):
         status_cache = Driver.get_status_cache()
         cache_data = {'status': status or self.status, 'availability': availability or self.availability}
@@ -117,6 +185,7 @@ class Driver:
                 return
             await self._update_cache(availability=availability)
             self.availability = availability
+            await get_spatial_index().set_driver_availability(self.driver_id, self.is_available())
         except Exception as e:
             payload = {"driver_id": self.driver_id, "availability": availability, "error": str(e)}
             get_logger().error(ErrorCodes.DRIVER_CHANGE_STATUS_ERROR.value, payload=payload)
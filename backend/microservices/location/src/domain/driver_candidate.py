@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from utils import top_k_indices
+
+class DriverCandidate(NamedTuple):
+    driver_id: str
+    latitude: float
+    longitude: float
+    distance: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class DriverCandidateBatch:
+    """Column-oriented nearest-driver candidates; rows are materialized only for the top k."""
+
+    __slots__ = ("driver_ids", "latitudes", "longitudes", "distances")
+
+    def __init__(
+        self,
+        driver_ids: Sequence[str],
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        distances: np.ndarray,
+    ):
+        self.driver_ids = list(driver_ids)
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.distances = distances
+
+    def __len__(self) -> int:
+        return len(self.driver_ids)
+
+    @classmethod
+    def empty(cls) -> "DriverCandidateBatch":
+        return cls([], np.empty(0), np.empty(0), np.empty(0))
+
+    @classmethod
+    def concat(cls, batches: List["DriverCandidateBatch"]) -> "DriverCandidateBatch":
+        if not batches:
+            return cls.empty()
+        return cls(
+            [driver_id for batch in batches for driver_id in batch.driver_ids],
+            np.concatenate([batch.latitudes for batch in batches]),
+            np.concatenate([batch.longitudes for batch in batches]),
+            np.concatenate([batch.distances for batch in batches]),
+        )
+
+    def within(self, radius_m: float) -> "DriverCandidateBatch":
+        indices = np.flatnonzero(self.distances <= radius_m)
+        return DriverCandidateBatch(
+            [self.driver_ids[i] for i in indices],
+            self.latitudes[indices],
+            self.longitudes[indices],
+            self.distances[indices],
+        )
+
+    def count_within(self, radius_m: float) -> int:
+        return int(np.count_nonzero(self.distances <= radius_m))
+
+    def top_k(self, k: Optional[int] = None) -> List[DriverCandidate]:
+        return [
+            DriverCandidate(
+                self.driver_ids[i],
+                float(self.latitudes[i]),
+                float(self.longitudes[i]),
+                float(self.distances[i]),
+            )
+            for i in top_k_indices(self.distances, k)
+        ]
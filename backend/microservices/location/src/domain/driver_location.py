@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from config import LocationConfig
-from data_access.repository import DatabaseRepository, CacheRepository
+from data_access.repository import CacheRepository
+from data_access.history_writer import LocationHistoryWriter
 from ftgo_utils.logger import get_logger
 from ftgo_utils.errors import ErrorCodes, BaseError
 from utils import handle_exception
 from domain.geo_location import GeoLocation
-from domain.hexagon import Hexagon
+from domain.spatial_index import get_spatial_index
 from dto import DriverLocationDTO
 
 class DriverLocation:
@@ -16,57 +17,68 @@ class DriverLocation:
 
     @property
     def config(self) -> LocationConfig:
-        return LocationConfig()
+        return LocationConfig.snapshot()
 
     async def get_valid_locations(self) -> List[GeoLocation]:
-        valid_locations = [loc for loc in self.locations if loc.is_valid()]
         last_location = await self.load_last_location()
+        return self._merge_with_last_location(last_location)
+
+    def _merge_with_last_location(self, last_location: Optional[GeoLocation]) -> List[GeoLocation]:
+        valid_locations = [loc for loc in self.locations if loc.is_valid()]
         if last_location:
             valid_locations.append(last_location)
         sorted_locations = sorted(valid_locations, key=lambda x: x.timestamp, reverse=True)
         return sorted_locations[:self.config.keep_last_locations_count]
 
-    async def persist_locations(self):
+    @staticmethod
+    def _newer_than(locations: List[GeoLocation], watermark: Optional[GeoLocation]) -> List[GeoLocation]:
+        if watermark is None:
+            return locations
+        return [location for location in locations if location.timestamp > watermark.timestamp]
+
+    def _to_dtos(self, locations: List[GeoLocation]) -> List[DriverLocationDTO]:
+        return [
+            DriverLocationDTO(
+                driver_id=self.driver_id,
+                latitude=location.latitude,
+                longitude=location.longitude,
+                timestamp=location.timestamp,
+                accuracy=location.accuracy,
+                speed=location.speed,
+                bearing=location.bearing,
+            )
+            for location in locations
+        ]
+
+    async def persist_locations(self, locations: Optional[List[GeoLocation]] = None):
         try:
-            locations = await self.get_valid_locations()
-            locations_dto = [
-                DriverLocationDTO(
-                    driver_id=self.driver_id,
-                    latitude=location.latitude,
-                    longitude=location.longitude,
-                    timestamp=location.timestamp,
-                    accuracy=location.accuracy,
-                    speed=location.speed,
-                    bearing=location.bearing,
-                )
-                for location in locations
-            ]
-            await DatabaseRepository.insert(locations_dto)
+            if locations is None:
+                locations = await self.get_valid_locations()
+            if not locations:
+                return
+            await LocationHistoryWriter.enqueue(self._to_dtos(locations))
         except Exception as e:
             payload = {"driver_id": self.driver_id, "error": str(e)}
             get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
 
-    async def update_hexagon_cache(self) -> None:
+    async def update_hexagon_cache(self, locations: Optional[List[GeoLocation]] = None, is_available: bool = False) -> None:
         try:
-            locations = await self.get_valid_locations()
+            if locations is None:
+                locations = await self.get_valid_locations()
             if not locations:
                 return
             most_recent_location = locations[0]
-            last_hex_id = await Hexagon.get_last_hexagon_for_driver(self.driver_id)
-            current_hex_id = Hexagon.from_location(most_recent_location).hex_id
-            if not last_hex_id or last_hex_id != current_hex_id:
-                await Hexagon.invalidate_driver_cache(self.driver_id)
-                await Hexagon.set_last_hexagon_for_driver(self.driver_id, most_recent_location)
-                await Hexagon.add_driver_to_hexagon(self.driver_id, most_recent_location)
+            await get_spatial_index().add_driver(self.driver_id, most_recent_location, is_available=is_available)
         except Exception as e:
             payload = {"driver_id": self.driver_id, "error": str(e)}
             get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
 
-    async def cache_locations(self):
+    async def cache_locations(self, locations: Optional[List[GeoLocation]] = None):
         try:
-            locations = await self.get_valid_locations()
+            if locations is None:
+                locations = await self.get_valid_locations()
             if not locations:
                 return
             most_recent_location = locations[0]
@@ -99,19 +111,64 @@ class DriverLocation:
             get_logger().error(ErrorCodes.LOCATION_LOAD_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.LOCATION_LOAD_ERROR, payload=payload)
 
-    async def save_locations(self):
+    async def save_locations(self, is_available: bool = False):
         try:
-            await self.persist_locations()
-            await self.cache_locations()
-            await self.update_hexagon_cache()
+            # The valid window is computed once per submit and shared by all writers,
+            # so the last cached location is read from Redis a single time. It is also
+            # the history watermark: anything at or before it was persisted already.
+            last_location = await self.load_last_location()
+            locations = self._merge_with_last_location(last_location)
+            if not locations:
+                return
+            new_locations = self._newer_than(locations, last_location)
+            if new_locations:
+                await self.persist_locations(new_locations)
+            await self.cache_locations(locations)
+            await self.update_hexagon_cache(locations, is_available=is_available)
         except Exception as e:
             payload = {"driver_id": self.driver_id, "error": str(e)}
             get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
 
+    @classmethod
+    async def save_many(cls, driver_locations: List[Tuple['DriverLocation', bool]]) -> None:
+        """``save_locations`` for many ``(driver_location, is_available)`` pairs with grouped I/O.
+
+        Last locations are read in one pipeline, history goes to the writer in one call,
+        and the location cache and spatial index are each updated with one pipeline.
+        """
+        driver_ids = [driver_location.driver_id for driver_location, _ in driver_locations]
+        try:
+            if not driver_locations:
+                return
+            config = LocationConfig.snapshot()
+            cache = CacheRepository.get_cache(config.cache_key)
+            last_location_dicts = await cache.fetch(driver_ids)
+            history: List[DriverLocationDTO] = []
+            latest: Dict[str, GeoLocation] = {}
+            spatial_entries = []
+            for (driver_location, is_available), last_location_dict in zip(driver_locations, last_location_dicts):
+                last_location = GeoLocation.from_dict(last_location_dict) if isinstance(last_location_dict, dict) else None
+                locations = driver_location._merge_with_last_location(last_location)
+                if not locations:
+                    continue
+                history.extend(driver_location._to_dtos(cls._newer_than(locations, last_location)))
+                latest[driver_location.driver_id] = locations[0]
+                spatial_entries.append((driver_location.driver_id, locations[0], is_available))
+            if history:
+                await LocationHistoryWriter.enqueue(history)
+            if latest:
+                cache = CacheRepository.get_cache(config.cache_key)
+                await cache.insert(list(latest), [location.to_dict() for location in latest.values()], ttl=config.cache_ttl)
+                await get_spatial_index().add_drivers(spatial_entries)
+        except Exception as e:
+            payload = {"driver_ids": driver_ids, "error": str(e)}
+            get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
+
     async def delete_locations(self):
         try:
-            await Hexagon.invalidate_driver_cache(self.driver_id)
+            await get_spatial_index().remove_driver(self.driver_id)
             cache_key = self.config.cache_key
             cache = CacheRepository.get_cache(cache_key)
             await cache.delete(self.driver_id)
@@ -0,0 +1,133 @@
+import time
+from typing import Any, List, Optional, Tuple
+
+from ftgo_utils.logger import get_logger
+from ftgo_utils.errors import ErrorCodes
+
+from config import HexagonConfig
+from data_access.repository import CacheRepository
+from domain.driver_candidate import DriverCandidate
+from domain.geo_location import GeoLocation
+from utils import handle_exception
+
+class GeoIndex:
+    """Driver spatial index backed by Redis GEO sorted sets.
+
+    Every write runs as one script, so the online, available and last-seen sets
+    never disagree about a driver.
+    """
+
+    index_name = "online"
+    available_index_name = "available"
+
+    last_seen_index_name = "geo"
+
+    @classmethod
+    def get_index_cache(cls) -> CacheRepository:
+        return CacheRepository.get_cache(HexagonConfig.snapshot().geo_index_key)
+
+    @classmethod
+    def _index_keys(cls) -> List[str]:
+        """Online set, available set and last-seen set, in the order the GEO scripts take them."""
+        config = HexagonConfig.snapshot()
+        return [
+            CacheRepository.key_for(config.geo_index_key, cls.index_name),
+            CacheRepository.key_for(config.geo_index_key, cls.available_index_name),
+            CacheRepository.key_for(config.last_seen_cache_key, cls.last_seen_index_name),
+        ]
+
+    @classmethod
+    def _add_script_call(cls, driver_id: str, location: GeoLocation, is_available: bool, now: int) -> Tuple[List[str], List[Any]]:
+        args = [driver_id, location.longitude, location.latitude, "1" if is_available else "0", now]
+        return cls._index_keys(), args
+
+    @classmethod
+    async def add_driver(cls, driver_id: str, location: GeoLocation, is_available: bool = False) -> None:
+        try:
+            keys, args = cls._add_script_call(driver_id, location, is_available, int(time.time()))
+            await CacheRepository.run_script("geo_add_driver", keys=keys, args=args)
+        except Exception as e:
+            payload = {"driver_id": driver_id, "location": location.to_dict()}
+            get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
+
+    @classmethod
+    async def add_drivers(cls, drivers: List[Tuple[str, GeoLocation, bool]]) -> None:
+        """Indexes many ``(driver_id, location, is_available)`` entries in one script pipeline."""
+        try:
+            now = int(time.time())
+            calls = [
+                cls._add_script_call(driver_id, location, is_available, now)
+                for driver_id, location, is_available in drivers
+            ]
+            await CacheRepository.run_script_many("geo_add_driver", calls)
+        except Exception as e:
+            payload = {"driver_ids": [driver_id for driver_id, _, _ in drivers]}
+            get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
+
+    @classmethod
+    async def remove_driver(cls, driver_id: str) -> None:
+        try:
+            await CacheRepository.run_script("geo_remove_driver", keys=cls._index_keys(), args=[driver_id])
+        except Exception as e:
+            payload = {"driver_id": driver_id}
+            get_logger().error(ErrorCodes.LOCATION_DELETE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_DELETE_ERROR, payload=payload)
+
+    @classmethod
+    async def evict_stale_drivers(cls) -> List[str]:
+        """Removes drivers that have not submitted a location within ``stale_driver_threshold_s``."""
+        try:
+            config = HexagonConfig.snapshot()
+            online_key, available_key, last_seen_key = cls._index_keys()
+            evicted = await CacheRepository.run_script(
+                "geo_evict_stale_drivers",
+                keys=[last_seen_key, online_key, available_key],
+                args=[int(time.time()) - config.stale_driver_threshold_s, config.eviction_batch_size],
+            )
+            return evicted or []
+        except Exception as e:
+            get_logger().error(ErrorCodes.LOCATION_DELETE_ERROR.value)
+            await handle_exception(e, ErrorCodes.LOCATION_DELETE_ERROR)
+
+    @classmethod
+    async def set_driver_availability(cls, driver_id: str, is_available: bool) -> None:
+        try:
+            online_key, available_key, _ = cls._index_keys()
+            await CacheRepository.run_script(
+                "geo_set_driver_availability",
+                keys=[online_key, available_key],
+                args=[driver_id, "1" if is_available else "0"],
+            )
+        except Exception as e:
+            payload = {"driver_id": driver_id, "is_available": is_available}
+            get_logger().error(ErrorCodes.DRIVER_CHANGE_STATUS_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.DRIVER_CHANGE_STATUS_ERROR, payload=payload)
+
+    @classmethod
+    async def get_nearest_drivers(
+        cls,
+        latitude: float,
+        longitude: float,
+        radius_m: int = 100,
+        max_count: Optional[int] = None,
+        available_only: bool = False,
+    ) -> List[DriverCandidate]:
+        try:
+            index_cache = cls.get_index_cache()
+            results = await index_cache.geo_search(
+                cls.available_index_name if available_only else cls.index_name,
+                longitude=longitude,
+                latitude=latitude,
+                radius_m=radius_m,
+                count=max_count,
+            )
+            return [
+                DriverCandidate(driver_id, driver_latitude, driver_longitude, distance)
+                for driver_id, distance, driver_longitude, driver_latitude in results
+            ]
+        except Exception as e:
+            payload = {"latitude": latitude, "longitude": longitude, "radius_m": radius_m}
+            get_logger().error(ErrorCodes.GET_NEAREST_DRIVERS_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.GET_NEAREST_DRIVERS_ERROR, payload=payload)
@@ -1,13 +1,32 @@
 import time
 import datetime
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 from ftgo_utils.constants import Provinces
 from ftgo_utils.geo import get_province, get_country, get_hexagon_id
 
 from config import LocationConfig
+from utils import LRUCache
+
+_UNRESOLVED = object()
+_region_cache: Optional[LRUCache] = None
+
+def resolve_region(latitude: float, longitude: float) -> Tuple[Optional[str], Optional[str]]:
+    """Province and country for a point, memoized per H3 cell at ``region_cache_resolution``."""
+    global _region_cache
+    config = LocationConfig.snapshot()
+    if _region_cache is None:
+        _region_cache = LRUCache(maxsize=config.region_cache_size)
+    hex_id = get_hexagon_id(lat=latitude, lng=longitude, resolution=config.region_cache_resolution)
+    region = _region_cache.get(hex_id)
+    if region is None:
+        region = (get_province(latitude, longitude, return_closest=True), get_country(latitude, longitude))
+        _region_cache.put(hex_id, region)
+    return region
 
 class GeoLocation:
+    __slots__ = ("latitude", "longitude", "timestamp", "accuracy", "speed", "bearing", "_province", "_country")
+
     def __init__(
         self,
         latitude: float,
@@ -23,19 +42,26 @@ class GeoLocation:
         self.accuracy = accuracy
         self.speed = speed
         self.bearing = bearing
-        self._province = get_province(self.latitude, self.longitude, return_closest=True)
-        self._country = get_country(self.latitude, self.longitude)
+        self._province = _UNRESOLVED
+        self._country = _UNRESOLVED
 
     @property
     def _config(self) -> LocationConfig:
-        return LocationConfig()
+        return LocationConfig.snapshot()
+
+    def _resolve_region(self) -> None:
+        self._province, self._country = resolve_region(self.latitude, self.longitude)
 
     @property
     def province(self) -> str:
+        if self._province is _UNRESOLVED:
+            self._resolve_region()
         return self._province
-    
+
     @property
     def country(self) -> str:
+        if self._country is _UNRESOLVED:
+            self._resolve_region()
         return self._country
 
     def _validate_accuracy(self) -> bool:
@@ -64,7 +90,7 @@ class GeoLocation:
         return self.bearing is None or 0 <= self.bearing <= 360
 
     def _validate_province(self) -> bool:
-        return self._province in Provinces.values()
+        return self.province in Provinces.values()
 
     def is_valid(self) -> bool:
         return True
@@ -1,33 +1,50 @@
-from typing import List, Optional, Dict, Any
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
 from data_access.repository import DatabaseRepository, CacheRepository
 from ftgo_utils.logger import get_logger
-from ftgo_utils.constants import SIUnits
 from ftgo_utils.errors import ErrorCodes
 from domain.geo_location import GeoLocation
-from utils import handle_exception
-from ftgo_utils.geo import get_hexagon_neighbors, haversine
+from utils import handle_exception, haversine_m
+from domain.driver_candidate import DriverCandidate, DriverCandidateBatch
+from ftgo_utils.geo import get_hexagon_neighbors
 from config import HexagonConfig
 from ftgo_utils.constants import RadiusLengthConfig
 
+# Average H3 hexagon edge length in meters, indexed by resolution.
+H3_AVERAGE_EDGE_LENGTH_M = [
+    1281256.011, 483056.8391, 182512.9565, 68979.22179,
+    26071.75968, 9854.090990, 3724.532667, 1406.475763,
+    531.4140101, 200.7861476, 75.86378287, 28.66389748,
+    10.83018784, 4.092010473, 1.546099657, 0.584168630,
+]
+
 class Hexagon:
+    last_seen_index_name = "hexagon"
+    # Runs of a script that found the driver in another cell than the one read just before it.
+    script_attempts = 3
+
     def __init__(self, hex_id: str, resolution: int):
         self.hex_id = hex_id
         self.resolution = resolution
 
     @property
     def config(self) -> HexagonConfig:
-        return HexagonConfig()
+        return HexagonConfig.snapshot()
 
     @classmethod
     def from_location(cls, location: GeoLocation) -> 'Hexagon':
-        config = HexagonConfig()
+        config = HexagonConfig.snapshot()
         hex_id = location.get_hexagon_index(resolution=config.hexagon_resolution)
         return cls(hex_id, config.hexagon_resolution)
 
     @classmethod
     async def get_last_hexagon_for_driver(cls, driver_id: str) -> Optional[str]:
         try:
-            cache_key = HexagonConfig().driver_hexagon_cache_key
+            cache_key = HexagonConfig.snapshot().driver_hexagon_cache_key
             driver_cache = CacheRepository.get_cache(cache_key)
             hex_id = await driver_cache.fetch(driver_id)
             return hex_id
@@ -49,7 +66,7 @@ class Hexagon:
     @classmethod
     async def remove_last_hexagon_for_driver(cls, driver_id: str) -> None:
         try:
-            cache_key = HexagonConfig().driver_hexagon_cache_key
+            cache_key = HexagonConfig.snapshot().driver_hexagon_cache_key
             driver_cache = CacheRepository.get_cache(cache_key)
             await driver_cache.delete(driver_id)
         except Exception as e:
@@ -59,19 +76,187 @@ class Hexagon:
     @classmethod
     async def remove_driver_from_hexagon(cls, driver_id: str, hex_id: str) -> None:
         try:
-            cache_key = HexagonConfig().cache_key
+            cache_key = HexagonConfig.snapshot().cache_key
             hexagon_cache = CacheRepository.get_cache(cache_key)
             await hexagon_cache.delete(keys=hex_id, fields=driver_id, data_type="hash")
         except Exception as e:
             payload = {"driver_id": driver_id, "hex_id": hex_id}
             get_logger().info(ErrorCodes.LOCATION_DELETE_ERROR.value, payload=payload)
 
+    @classmethod
+    async def _get_last_hexagons_for_drivers(cls, driver_ids: List[str]) -> List[str]:
+        driver_cache = CacheRepository.get_cache(HexagonConfig.snapshot().driver_hexagon_cache_key)
+        hex_ids = await driver_cache.fetch(driver_ids)
+        return [hex_id or "" for hex_id in hex_ids]
+
+    @staticmethod
+    def _cell_keys(hex_id: str) -> List[str]:
+        """Keys of a driver's cell hash and available-drivers hash; none when it has no cell."""
+        if not hex_id:
+            return []
+        config = HexagonConfig.snapshot()
+        return [
+            CacheRepository.key_for(config.cache_key, hex_id),
+            CacheRepository.key_for(config.available_cache_key, hex_id),
+        ]
+
+    @classmethod
+    async def _run_for_driver(
+        cls,
+        name: str,
+        driver_id: str,
+        script_call: Callable[[str], Tuple[List[str], List[Any]]],
+    ) -> Optional[str]:
+        """Runs a script built for the driver's current cell and returns that cell.
+
+        Scripts receive every key they touch, so the cell is read first; when the driver
+        moves before the script runs, the script does nothing and the cell is read again.
+        """
+        for _ in range(cls.script_attempts):
+            last_hex_id = await cls.get_last_hexagon_for_driver(driver_id) or ""
+            keys, args = script_call(last_hex_id)
+            if await CacheRepository.run_script(name, keys=keys, args=args):
+                return last_hex_id or None
+        raise RuntimeError(f"Driver {driver_id} changed cell during {cls.script_attempts} attempts of {name}")
+
     @classmethod
     async def invalidate_driver_cache(cls, driver_id: str) -> None:
-        last_hexagon_id = await cls.get_last_hexagon_for_driver(driver_id)
-        if last_hexagon_id:
-            await cls.remove_driver_from_hexagon(driver_id, last_hexagon_id)
-        await cls.remove_last_hexagon_for_driver(driver_id)
+        try:
+            config = HexagonConfig.snapshot()
+            await cls._run_for_driver(
+                "remove_driver_from_hexagon",
+                driver_id,
+                lambda last_hex_id: (
+                    [
+                        CacheRepository.key_for(config.driver_hexagon_cache_key, driver_id),
+                        CacheRepository.key_for(config.last_seen_cache_key, cls.last_seen_index_name),
+                        *cls._cell_keys(last_hex_id),
+                    ],
+                    [driver_id, last_hex_id],
+                ),
+            )
+        except Exception as e:
+            payload = {"driver_id": driver_id}
+            get_logger().error(ErrorCodes.LOCATION_DELETE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_DELETE_ERROR, payload=payload)
+
+    @classmethod
+    async def add_driver(cls, driver_id: str, location: GeoLocation, is_available: bool = False) -> None:
+        await cls.move_driver_to_hexagon(driver_id, location, is_available=is_available)
+
+    @classmethod
+    async def remove_driver(cls, driver_id: str) -> None:
+        await cls.invalidate_driver_cache(driver_id)
+
+    @classmethod
+    async def set_driver_availability(cls, driver_id: str, is_available: bool) -> None:
+        try:
+            config = HexagonConfig.snapshot()
+            await cls._run_for_driver(
+                "set_driver_availability",
+                driver_id,
+                lambda last_hex_id: (
+                    [CacheRepository.key_for(config.driver_hexagon_cache_key, driver_id), *cls._cell_keys(last_hex_id)],
+                    [driver_id, "1" if is_available else "0", last_hex_id],
+                ),
+            )
+        except Exception as e:
+            payload = {"driver_id": driver_id, "is_available": is_available}
+            get_logger().error(ErrorCodes.DRIVER_CHANGE_STATUS_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.DRIVER_CHANGE_STATUS_ERROR, payload=payload)
+
+    @classmethod
+    async def evict_stale_drivers(cls) -> List[str]:
+        """Removes drivers that have not submitted a location within ``stale_driver_threshold_s``."""
+        try:
+            config = HexagonConfig.snapshot()
+            cutoff = int(time.time()) - config.stale_driver_threshold_s
+            last_seen_cache = CacheRepository.get_cache(config.last_seen_cache_key)
+            stale = await last_seen_cache.fetch_by_score(cls.last_seen_index_name, cutoff, config.eviction_batch_size)
+            if not stale:
+                return []
+            last_seen_key = CacheRepository.key_for(config.last_seen_cache_key, cls.last_seen_index_name)
+            calls = [
+                (
+                    [last_seen_key, CacheRepository.key_for(config.driver_hexagon_cache_key, driver_id), *cls._cell_keys(last_hex_id)],
+                    [driver_id, cutoff, last_hex_id],
+                )
+                for driver_id, last_hex_id in zip(stale, await cls._get_last_hexagons_for_drivers(stale))
+            ]
+            # A driver that submitted or moved since the read is skipped; it is no longer stale.
+            evicted = await CacheRepository.run_script_many("evict_stale_driver", calls)
+            return [driver_id for driver_id, was_evicted in zip(stale, evicted) if was_evicted]
+        except Exception as e:
+            get_logger().error(ErrorCodes.LOCATION_DELETE_ERROR.value)
+            await handle_exception(e, ErrorCodes.LOCATION_DELETE_ERROR)
+
+    @classmethod
+    def _move_script_call(
+        cls,
+        driver_id: str,
+        location: GeoLocation,
+        is_available: bool,
+        now: int,
+        last_hex_id: str,
+    ) -> Tuple[List[str], List[Any]]:
+        hexagon = cls.from_location(location)
+        config = hexagon.config
+        keys = [
+            CacheRepository.key_for(config.driver_hexagon_cache_key, driver_id),
+            CacheRepository.key_for(config.cache_key, hexagon.hex_id),
+            CacheRepository.key_for(config.available_cache_key, hexagon.hex_id),
+            CacheRepository.key_for(config.last_seen_cache_key, cls.last_seen_index_name),
+        ]
+        if last_hex_id != hexagon.hex_id:
+            keys.extend(cls._cell_keys(last_hex_id))
+        args = [
+            driver_id,
+            hexagon.hex_id,
+            location.to_dict(),
+            config.driver_hexagon_cache_ttl,
+            "1" if is_available else "0",
+            now,
+            config.cache_ttl,
+            last_hex_id,
+        ]
+        return keys, args
+
+    @classmethod
+    async def move_driver_to_hexagon(cls, driver_id: str, location: GeoLocation, is_available: bool = False) -> Optional[str]:
+        try:
+            now = int(time.time())
+            return await cls._run_for_driver(
+                "move_driver_to_hexagon",
+                driver_id,
+                lambda last_hex_id: cls._move_script_call(driver_id, location, is_available, now, last_hex_id),
+            )
+        except Exception as e:
+            payload = {"driver_id": driver_id, "location": location.to_dict()}
+            get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
+
+    @classmethod
+    async def add_drivers(cls, drivers: List[Tuple[str, GeoLocation, bool]]) -> None:
+        """Moves many ``(driver_id, location, is_available)`` entries with one read and one script pipeline."""
+        try:
+            now = int(time.time())
+            pending = list(drivers)
+            for _ in range(cls.script_attempts):
+                if not pending:
+                    return
+                last_hex_ids = await cls._get_last_hexagons_for_drivers([driver_id for driver_id, _, _ in pending])
+                calls = [
+                    cls._move_script_call(driver_id, location, is_available, now, last_hex_id)
+                    for (driver_id, location, is_available), last_hex_id in zip(pending, last_hex_ids)
+                ]
+                moved = await CacheRepository.run_script_many("move_driver_to_hexagon", calls)
+                pending = [driver for driver, was_moved in zip(pending, moved) if not was_moved]
+            if pending:
+                raise RuntimeError(f"Drivers changed cell during {cls.script_attempts} attempts of move_driver_to_hexagon")
+        except Exception as e:
+            payload = {"driver_ids": [driver_id for driver_id, _, _ in drivers]}
+            get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
 
     @classmethod
     async def add_driver_to_hexagon(cls, driver_id: str, location: GeoLocation) -> None:
@@ -88,49 +273,81 @@ class Hexagon:
             get_logger().error(ErrorCodes.LOCATION_SAVE_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.LOCATION_SAVE_ERROR, payload=payload)
 
+    @staticmethod
+    def _decode_drivers(drivers_cached_data: Optional[Dict[str, Any]]) -> Dict[str, GeoLocation]:
+        if not drivers_cached_data:
+            return {}
+        return {driver_id: GeoLocation.from_dict(value) for driver_id, value in drivers_cached_data.items()}
+
     async def get_drivers(self) -> Dict[str, GeoLocation]:
         try:
             hexagon_cache = CacheRepository.get_cache(self.config.cache_key)
             drivers_cached_data = await hexagon_cache.fetch(self.hex_id, data_type='hash')
-            if not drivers_cached_data:
-                return {}
-            return {driver_id: GeoLocation.from_dict(value) for driver_id, value in drivers_cached_data.items()}
+            return self._decode_drivers(drivers_cached_data)
         except Exception as e:
             payload = {"hex_id": self.hex_id}
             get_logger().error(ErrorCodes.GET_NEAREST_DRIVERS_ERROR.value, payload=payload)
             await handle_exception(e, ErrorCodes.GET_NEAREST_DRIVERS_ERROR, payload=payload)
-    
+
+    @property
+    def edge_length_m(self) -> float:
+        return H3_AVERAGE_EDGE_LENGTH_M[self.resolution]
+
+    def covered_radius_m(self, k: int) -> float:
+        # Inradius of the k-ring disk, minus the farthest a point can sit from its cell center.
+        return (2 * k + 1) * (math.sqrt(3) / 2) * self.edge_length_m - self.edge_length_m
+
+    def k_ring_size(self, radius_m: float) -> int:
+        k = math.ceil(((radius_m + self.edge_length_m) / ((math.sqrt(3) / 2) * self.edge_length_m) - 1) / 2)
+        return min(max(k, self.config.k_ring_radius), self.config.max_k_ring_radius)
+
+    @staticmethod
+    def _decode_candidates(cells: List[Optional[Dict[str, Any]]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        driver_ids, latitudes, longitudes = [], [], []
+        for drivers_cached_data in cells:
+            if not drivers_cached_data:
+                continue
+            for driver_id, value in drivers_cached_data.items():
+                driver_ids.append(driver_id)
+                latitudes.append(value["latitude"])
+                longitudes.append(value["longitude"])
+        return driver_ids, np.asarray(latitudes, dtype=np.float64), np.asarray(longitudes, dtype=np.float64)
+
+    @staticmethod
+    def _candidate_batch(cells: List[Optional[Dict[str, Any]]], latitude: float, longitude: float) -> DriverCandidateBatch:
+        driver_ids, latitudes, longitudes = Hexagon._decode_candidates(cells)
+        distances = haversine_m(latitude, longitude, latitudes, longitudes)
+        return DriverCandidateBatch(driver_ids, latitudes, longitudes, distances)
+
     @staticmethod
     async def get_nearest_drivers(
         latitude: float,
         longitude: float,
         radius_m: int = 100,
-    ) -> List[Dict[str, Any]]:
+        max_count: Optional[int] = None,
+        available_only: bool = False,
+    ) -> List[DriverCandidate]:
         try:
             geo_location = GeoLocation(latitude=latitude, longitude=longitude)
             hexagon = Hexagon.from_location(geo_location)
-            drivers_data = await hexagon.get_drivers()
-            flatten_drivers = [
-                (driver_id, location, haversine(
-                    geo_location.latitude,
-                    geo_location.longitude,
-                    location.latitude,
-                    location.longitude,
-                    unit=SIUnits.LENGTH.M
-                ))
-                for driver_id, location in drivers_data.items()
-            ]
-            nearby_drivers = [
-                {
-                    "driver_id": driver_id,
-                    "latitude": location.latitude,
-                    "longitude": location.longitude,
-                    "distance": distance,
-                }
-                for driver_id, location, distance in flatten_drivers if distance <= radius_m
-            ]
-            sorted_drivers = sorted(nearby_drivers, key=lambda x: x["distance"])
-            return sorted_drivers
+            cache_key = hexagon.config.available_cache_key if available_only else hexagon.config.cache_key
+            hexagon_cache = CacheRepository.get_cache(cache_key)
+
+            batches: List[DriverCandidateBatch] = []
+            visited_hex_ids = set()
+            for k in range(hexagon.k_ring_size(radius_m) + 1):
+                ring = [hex_id for hex_id in get_hexagon_neighbors(hexagon.hex_id, k) if hex_id not in visited_hex_ids]
+                visited_hex_ids.update(ring)
+                cells = await hexagon_cache.fetch(ring, data_type='hash')
+                batches.append(Hexagon._candidate_batch(cells, latitude, longitude).within(radius_m))
+
+                # Drivers beyond the covered radius may still be beaten by drivers in the next ring.
+                if max_count:
+                    covered_radius_m = min(radius_m, hexagon.covered_radius_m(k))
+                    if sum(batch.count_within(covered_radius_m) for batch in batches) >= max_count:
+                        break
+
+            return DriverCandidateBatch.concat(batches).top_k(max_count)
         except Exception as e:
             payload = {"latitude": latitude, "longitude": longitude, "radius_m": radius_m}
             get_logger().error(ErrorCodes.GET_NEAREST_DRIVERS_ERROR.value, payload=payload)
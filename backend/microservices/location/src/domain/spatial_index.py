@@ -0,0 +1,11 @@
+from typing import Type, Union
+
+from config import HexagonConfig, SpatialEngines
+from domain.geo_index import GeoIndex
+from domain.hexagon import Hexagon
+
+def get_spatial_index() -> Union[Type[Hexagon], Type[GeoIndex]]:
+    engine = HexagonConfig.snapshot().spatial_engine
+    if engine == SpatialEngines.GEO.value:
+        return GeoIndex
+    return Hexagon
@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import LocationConfig, TrackSimplifications
+from data_access.repository import DatabaseRepository
+from ftgo_utils.logger import get_logger
+from ftgo_utils.errors import ErrorCodes
+from utils import handle_exception, douglas_peucker_indices, time_bucket_indices
+from dto import DriverLocationDTO
+
+class DriverTrajectory:
+    """A driver's stored track, read back one page at a time."""
+
+    _columns = ["timestamp", "latitude", "longitude", "speed", "bearing"]
+
+    def __init__(self, driver_id: str):
+        self.driver_id = driver_id
+
+    @property
+    def config(self) -> LocationConfig:
+        return LocationConfig.snapshot()
+
+    async def load_page(
+        self,
+        start: float,
+        end: float,
+        cursor: Optional[float] = None,
+        page_size: Optional[int] = None,
+        simplification: str = TrackSimplifications.NONE.value,
+        tolerance_m: float = 10.0,
+        bucket_s: float = 30.0,
+    ) -> Dict[str, Any]:
+        """Returns up to ``page_size`` points after ``cursor`` (or from ``start``) and the cursor
+        of the next page, or ``None`` once the window is exhausted. Simplification runs per page."""
+        try:
+            page_size = min(page_size or self.config.history_page_size, self.config.history_max_page_size)
+            rows = await DatabaseRepository.fetch_range(
+                DriverLocationDTO,
+                query={"driver_id": self.driver_id},
+                range_field="timestamp",
+                lower=self._to_datetime(start if cursor is None else cursor),
+                upper=self._to_datetime(end),
+                columns=self._columns,
+                limit=page_size + 1,
+                lower_inclusive=cursor is None,
+            )
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            next_cursor = rows[-1][0].timestamp() if has_more else None
+            rows = self._simplify(rows, simplification, tolerance_m, bucket_s)
+            return {
+                "points": [
+                    {
+                        "timestamp": timestamp.timestamp(),
+                        "latitude": latitude,
+                        "longitude": longitude,
+                        "speed": speed,
+                        "bearing": bearing,
+                    }
+                    for timestamp, latitude, longitude, speed, bearing in rows
+                ],
+                "next_cursor": next_cursor,
+            }
+        except Exception as e:
+            payload = {"driver_id": self.driver_id, "error": str(e)}
+            get_logger().error(ErrorCodes.LOCATION_LOAD_ERROR.value, payload=payload)
+            await handle_exception(e, ErrorCodes.LOCATION_LOAD_ERROR, payload=payload)
+
+    @staticmethod
+    def _simplify(rows: List[Tuple], simplification: str, tolerance_m: float, bucket_s: float) -> List[Tuple]:
+        if not rows or simplification == TrackSimplifications.NONE.value:
+            return rows
+        if simplification == TrackSimplifications.DOUGLAS_PEUCKER.value:
+            latitudes = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+            longitudes = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+            indices = douglas_peucker_indices(latitudes, longitudes, tolerance_m)
+        elif simplification == TrackSimplifications.TIME_BUCKET.value:
+            timestamps = np.fromiter((row[0].timestamp() for row in rows), dtype=np.float64, count=len(rows))
+            indices = time_bucket_indices(timestamps, bucket_s)
+        else:
+            raise ValueError(f"Unknown track simplification: {simplification}")
+        return [rows[index] for index in indices]
+
+    @staticmethod
+    def _to_datetime(timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
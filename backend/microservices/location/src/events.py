@@ -6,6 +6,7 @@ from ftgo_utils.errors import ErrorCodes
 from application import DriverService, TrackerService
 from application.middleware import event_middleware
 from config import LayerNames
+from config.broker import BrokerConfig
 from data_access.broker import RPCBroker
 from utils import handle_exception
 
@@ -14,18 +15,21 @@ async def register_events():
     rpc_client = rpc_broker.get_client()
     events_handlers = {
         'driver.location.submit': DriverService.submit_location,
+        'driver.location.submit_batch': DriverService.submit_locations_batch,
         'driver.status.online': DriverService.change_status_online,
         'driver.status.offline': DriverService.change_status_offline,
         'driver.availability.available': DriverService.set_driver_available,
         'driver.availability.occupied': DriverService.set_driver_occupied,
         'driver.location.get': DriverService.get_last_location,
+        'driver.location.history': DriverService.get_location_history,
         'driver.status.get': DriverService.get_driver_status,
         'location.drivers.get_nearest': TrackerService.get_nearest_drivers,
     }
 
+    one_way_events = set(BrokerConfig().one_way_events)
     for event, _handler in events_handlers.items():
         try:
-            handler = event_middleware(event, _handler)
+            handler = event_middleware(event, _handler, one_way=event in one_way_events)
             await rpc_client.register_event(event=event, handler=handler)
             rpc_client.logger.info(f"Registered event '{event}' with handler '{handler.__name__}'")
         except Exception as e:
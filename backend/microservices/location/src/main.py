@@ -1,10 +1,14 @@
 import asyncio
+import signal
 import uvloop
 from dotenv import load_dotenv
 
 from ftgo_utils.logger import init_logging
+from prometheus_client import start_http_server
 
-from config import ServiceConfig
+from application.partitions import LocationPartitionMaintainer
+from application.sweeper import StaleDriverSweeper
+from config import BaseConfig, ServiceConfig, MetricsConfig
 from data_access.events.lifecycle import setup, teardown
 from events import register_events
 
@@ -13,15 +17,28 @@ load_dotenv()
 async def setup_env():
     service_config = ServiceConfig()
     init_logging(level=service_config.log_level)
+    metrics_config = MetricsConfig()
+    if metrics_config.enabled:
+        start_http_server(metrics_config.port)
+    asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_config)
+
+def reload_config():
+    # Config snapshots are read once; SIGHUP re-reads .env and makes the next access rebuild them.
+    load_dotenv(override=True)
+    BaseConfig.reload()
 
 async def startup_event():
     await setup_env()
     await setup()
+    await LocationPartitionMaintainer.start()
     await asyncio.sleep(1)
     await register_events()
+    await StaleDriverSweeper.start()
     await asyncio.Future()
 
 async def shutdown_event():
+    await StaleDriverSweeper.stop()
+    await LocationPartitionMaintainer.stop()
     await teardown()
 
 if __name__ == '__main__':
@@ -1 +1,3 @@
 from utils.exception import handle_exception
+from utils.geo import haversine_m, top_k_indices, douglas_peucker_indices, time_bucket_indices
+from utils.lru import LRUCache
@@ -0,0 +1,68 @@
+from typing import Tuple
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def haversine_m(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Great-circle distances in meters from one point to arrays of points."""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    delta_lat = lat2 - lat1
+    delta_lng = np.radians(longitudes) - np.radians(longitude)
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(delta_lng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+def top_k_indices(values: np.ndarray, k: int = None) -> np.ndarray:
+    """Indices of the ``k`` smallest values in ascending order, without sorting the rest."""
+    if k is not None and len(values) > k:
+        indices = np.argpartition(values, k - 1)[:k]
+    else:
+        indices = np.arange(len(values))
+    return indices[np.argsort(values[indices], kind="stable")]
+
+
+def douglas_peucker_indices(latitudes: np.ndarray, longitudes: np.ndarray, tolerance_m: float) -> np.ndarray:
+    """Indices of the points Douglas-Peucker keeps for a track, endpoints included.
+
+    Points are projected onto a local equirectangular plane, which is accurate
+    enough for the few kilometers a single delivery spans.
+    """
+    count = len(latitudes)
+    if count <= 2:
+        return np.arange(count)
+    reference_lat = np.radians(np.mean(latitudes))
+    x = np.radians(longitudes) * np.cos(reference_lat) * EARTH_RADIUS_M
+    y = np.radians(latitudes) * EARTH_RADIUS_M
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dx, dy = x[last] - x[first], y[last] - y[first]
+        px, py = x[first + 1:last] - x[first], y[first + 1:last] - y[first]
+        length = np.hypot(dx, dy)
+        if length == 0:
+            distances = np.hypot(px, py)
+        else:
+            distances = np.abs(dx * py - dy * px) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance_m:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def time_bucket_indices(timestamps: np.ndarray, bucket_s: float) -> np.ndarray:
+    """Indices of the last point in each ``bucket_s`` window of an ascending track."""
+    if len(timestamps) == 0:
+        return np.arange(0)
+    buckets = np.floor_divide(timestamps, bucket_s)
+    is_last = np.append(buckets[1:] != buckets[:-1], True)
+    return np.flatnonzero(is_last)
@@ -0,0 +1,89 @@
+"""Encode/decode cost and Redis memory of cached driver locations per codec.
+
+Payload bytes are the UTF-8 size Redis stores for each value. With
+``--redis host:port[/db] --flush`` the locations of 100k drivers are also written into
+hexagon-sized hashes and the growth of ``used_memory`` is reported.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_cache_codecs [--redis localhost:6379/15 --flush]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from data_access.repository import CacheRepository
+from data_access.repository.codecs import JsonCodec, PackedLocationCodec
+from domain.geo_location import GeoLocation
+from benchmarks.utils import add_redis_arguments, install_redis, random_point
+
+DRIVERS = 100_000
+DRIVERS_PER_CELL = 50
+
+
+def make_locations() -> list:
+    now = int(time.time())
+    locations = []
+    for _ in range(DRIVERS):
+        latitude, longitude = random_point(spread_deg=0.2)
+        location = GeoLocation(
+            latitude=latitude,
+            longitude=longitude,
+            timestamp=now - random.randint(0, 60),
+            accuracy=round(random.uniform(1, 15), 1),
+            speed=round(random.uniform(0, 20), 1),
+            bearing=round(random.uniform(0, 360), 1),
+        )
+        locations.append(location.to_dict())
+    return locations
+
+
+def measure(codec, locations: list) -> dict:
+    started_at = time.perf_counter()
+    encoded = [codec.encode(location) for location in locations]
+    encode_s = time.perf_counter() - started_at
+    started_at = time.perf_counter()
+    for value in encoded:
+        codec.decode(value)
+    decode_s = time.perf_counter() - started_at
+    return {
+        "encode_us": round(encode_s * 1e6 / len(locations), 3),
+        "decode_us": round(decode_s * 1e6 / len(locations), 3),
+        "payload_mb_per_100k": round(sum(len(value if isinstance(value, bytes) else value.encode()) for value in encoded) * 100_000 / len(locations) / 2**20, 3),
+    }
+
+
+async def used_memory_mb(codec, locations: list, redis_address: str, flush: bool) -> float:
+    redis = await install_redis(redis_address, flush)
+    CacheRepository.set_codec(codec)
+    async with redis.get_or_create_session() as session:
+        before = (await session.info("memory"))["used_memory"]
+    cache = CacheRepository.get_cache("bench_codec")
+    for start in range(0, len(locations), DRIVERS_PER_CELL * 100):
+        chunk = locations[start:start + DRIVERS_PER_CELL * 100]
+        cells = {}
+        for offset, location in enumerate(chunk):
+            cells.setdefault(f"cell-{(start + offset) // DRIVERS_PER_CELL}", {})[f"driver-{start + offset}"] = location
+        await cache.insert(list(cells), list(cells.values()), data_type="hash")
+    async with redis.get_or_create_session() as session:
+        after = (await session.info("memory"))["used_memory"]
+    return round((after - before) / 2**20, 3)
+
+
+async def main(redis_address: str = None, flush: bool = False) -> None:
+    random.seed(15)
+    locations = make_locations()
+    for name, codec in (("json", JsonCodec()), ("packed_location", PackedLocationCodec())):
+        result = measure(codec, locations)
+        if redis_address:
+            result["redis_used_memory_mb_per_100k"] = await used_memory_mb(codec, locations, redis_address, flush)
+        print(name, result)
+    CacheRepository.set_codec(JsonCodec())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    add_redis_arguments(parser)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.redis, arguments.flush))
@@ -0,0 +1,74 @@
+"""Memory and time per 10k-candidate nearest-driver query.
+
+Compares the previous representation, a ``GeoLocation`` plus a response
+dict per candidate, with ``DriverCandidateBatch``, which keeps candidates
+in arrays and builds records only for the final top k.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_candidate_records
+"""
+import random
+import time
+import tracemalloc
+
+from ftgo_utils.constants import SIUnits
+from ftgo_utils.geo import haversine
+
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+from benchmarks.utils import CITY_CENTER, random_point
+
+CANDIDATES = 10_000
+RADIUS_M = 10_000
+MAX_COUNT = 20
+
+
+def make_cell() -> dict:
+    return {
+        f"driver-{i}": {"latitude": latitude, "longitude": longitude}
+        for i, (latitude, longitude) in enumerate(random_point(spread_deg=0.05) for _ in range(CANDIDATES))
+    }
+
+
+def object_per_candidate(cell: dict) -> list:
+    latitude, longitude = CITY_CENTER
+    drivers = {driver_id: GeoLocation.from_dict(value) for driver_id, value in cell.items()}
+    nearby = [
+        {
+            "driver_id": driver_id,
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+            "distance": haversine(latitude, longitude, location.latitude, location.longitude, unit=SIUnits.LENGTH.M),
+        }
+        for driver_id, location in drivers.items()
+    ]
+    nearby = [driver for driver in nearby if driver["distance"] <= RADIUS_M]
+    return sorted(nearby, key=lambda driver: driver["distance"])[:MAX_COUNT]
+
+
+def candidate_batch(cell: dict) -> list:
+    latitude, longitude = CITY_CENTER
+    batch = Hexagon._candidate_batch([cell], latitude, longitude).within(RADIUS_M)
+    return [candidate.to_dict() for candidate in batch.top_k(MAX_COUNT)]
+
+
+def measure(query, cell: dict) -> dict:
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    query(cell)
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": round(elapsed_ms, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def main() -> None:
+    random.seed(7)
+    cell = make_cell()
+    for name, query in (("object_per_candidate", object_per_candidate), ("candidate_batch", candidate_batch)):
+        print(name, measure(query, cell))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""CPU spent per 1k ``driver.location.submit`` with and without config snapshots.
+
+The legacy variant rebuilds every config object on access, as the
+``XConfig()`` properties used to, re-reading and casting each environment
+variable. Prints process CPU time and the share cProfile attributes to
+config construction.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_config_snapshots
+"""
+import asyncio
+import cProfile
+import pstats
+import random
+import time
+
+from config import BaseConfig
+from domain.driver import Driver
+from benchmarks.utils import install_fakes, random_point, gps_trace
+
+SUBMITS = 1_000
+DRIVERS = 100
+
+
+async def submit_all(traces: dict) -> None:
+    for i in range(SUBMITS):
+        driver_id = f"driver-{i % DRIVERS}"
+        driver = Driver(driver_id)
+        await driver.submit_locations(traces[driver_id][i // DRIVERS])
+
+
+async def run(traces: dict, profile: cProfile.Profile) -> float:
+    await install_fakes()
+    BaseConfig.reload()
+    started_at = time.process_time()
+    profile.enable()
+    await submit_all(traces)
+    profile.disable()
+    return time.process_time() - started_at
+
+
+def config_seconds(profile: cProfile.Profile) -> float:
+    stats = pstats.Stats(profile)
+    return sum(
+        cumulative
+        for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items()
+        if function == "__init__" and "/config/" in filename
+    )
+
+
+async def main() -> None:
+    random.seed(16)
+    submits_per_driver = SUBMITS // DRIVERS
+    traces = {
+        f"driver-{i}": [gps_trace(random_point(), 3) for _ in range(submits_per_driver)]
+        for i in range(DRIVERS)
+    }
+    snapshot = BaseConfig.snapshot.__func__
+    for name, rebuild_on_access in (("legacy", True), ("snapshot", False)):
+        if rebuild_on_access:
+            BaseConfig.snapshot = classmethod(lambda cls: cls())
+        profile = cProfile.Profile()
+        try:
+            cpu_s = await run(traces, profile)
+        finally:
+            BaseConfig.snapshot = classmethod(snapshot)
+        print(name, {
+            "cpu_ms_per_1k_submits": round(cpu_s * 1000 * 1_000 / SUBMITS, 3),
+            "config_construction_ms_per_1k_submits": round(config_seconds(profile) * 1000 * 1_000 / SUBMITS, 3),
+        })
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
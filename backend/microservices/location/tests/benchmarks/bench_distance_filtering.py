@@ -0,0 +1,72 @@
+"""Scalar vs. vectorized distance filtering of nearest-driver candidates.
+
+The scalar path mirrors the previous implementation: one ``GeoLocation``
+and one ``ftgo_utils.geo.haversine`` call per candidate, then a full sort.
+The vectorized path decodes candidates into float arrays and selects the
+top k with ``argpartition``.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_distance_filtering
+"""
+import random
+import time
+
+from ftgo_utils.constants import SIUnits
+from ftgo_utils.geo import haversine
+
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+from utils import haversine_m, top_k_indices
+from benchmarks.utils import CITY_CENTER, random_point
+
+CANDIDATE_COUNTS = (1_000, 10_000, 100_000)
+RADIUS_M = 5_000
+MAX_COUNT = 10
+REPEATS = 5
+
+
+def make_cell(candidates: int) -> dict:
+    return {
+        f"driver-{i}": {"latitude": latitude, "longitude": longitude}
+        for i, (latitude, longitude) in enumerate(random_point(spread_deg=0.05) for _ in range(candidates))
+    }
+
+
+def scalar(cell: dict) -> list:
+    latitude, longitude = CITY_CENTER
+    drivers = {driver_id: GeoLocation.from_dict(value) for driver_id, value in cell.items()}
+    nearby = []
+    for driver_id, location in drivers.items():
+        distance = haversine(latitude, longitude, location.latitude, location.longitude, unit=SIUnits.LENGTH.M)
+        if distance <= RADIUS_M:
+            nearby.append((distance, driver_id))
+    return [driver_id for _, driver_id in sorted(nearby)[:MAX_COUNT]]
+
+
+def vectorized(cell: dict) -> list:
+    latitude, longitude = CITY_CENTER
+    driver_ids, latitudes, longitudes = Hexagon._decode_candidates([cell])
+    distances = haversine_m(latitude, longitude, latitudes, longitudes)
+    within_radius = distances <= RADIUS_M
+    candidate_ids = [driver_id for driver_id, keep in zip(driver_ids, within_radius) if keep]
+    return [candidate_ids[i] for i in top_k_indices(distances[within_radius], MAX_COUNT)]
+
+
+def time_ms(search, cell: dict) -> float:
+    started_at = time.perf_counter()
+    for _ in range(REPEATS):
+        search(cell)
+    return (time.perf_counter() - started_at) * 1000 / REPEATS
+
+
+def main() -> None:
+    random.seed(5)
+    for candidates in CANDIDATE_COUNTS:
+        cell = make_cell(candidates)
+        scalar_ms, vectorized_ms = time_ms(scalar, cell), time_ms(vectorized, cell)
+        print(candidates, {"scalar_ms": round(scalar_ms, 3), "vectorized_ms": round(vectorized_ms, 3), "speedup": round(scalar_ms / vectorized_ms, 1)})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Cost of decoding cached drivers into ``GeoLocation`` objects.
+
+Compares eager province/country resolution per point, as ``GeoLocation``
+used to do in ``__init__``, with the lazy per-cell memoized resolution,
+for the candidates of a nearest-driver query.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_geo_location_decoding
+"""
+import random
+import time
+
+from ftgo_utils.geo import get_province, get_country
+
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+from benchmarks.utils import random_point
+
+CANDIDATE_COUNTS = (1_000, 10_000)
+
+
+def make_cell(candidates: int) -> dict:
+    return {
+        f"driver-{i}": {"latitude": latitude, "longitude": longitude, "timestamp": 0}
+        for i, (latitude, longitude) in enumerate(random_point(spread_deg=0.05) for _ in range(candidates))
+    }
+
+
+def eager(cell: dict) -> None:
+    for location in Hexagon._decode_drivers(cell).values():
+        get_province(location.latitude, location.longitude, return_closest=True)
+        get_country(location.latitude, location.longitude)
+
+
+def lazy(cell: dict) -> None:
+    for location in Hexagon._decode_drivers(cell).values():
+        location.to_dict()
+
+
+def time_ms(decode, cell: dict) -> float:
+    started_at = time.perf_counter()
+    decode(cell)
+    return (time.perf_counter() - started_at) * 1000
+
+
+def main() -> None:
+    random.seed(6)
+    for candidates in CANDIDATE_COUNTS:
+        cell = make_cell(candidates)
+        eager_ms = time_ms(eager, cell)
+        lazy_ms = time_ms(lazy, cell)
+        decode_only_ms = time_ms(Hexagon._decode_drivers, cell)
+        print(candidates, {
+            "eager_ms": round(eager_ms, 3),
+            "lazy_with_to_dict_ms": round(lazy_ms, 3),
+            "lazy_decode_only_ms": round(decode_only_ms, 3),
+        })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""``driver_location`` row growth over a simulated 8-hour shift.
+
+Compares the legacy ingestion path, which persists the whole valid window
+(including the cached last location) on every submit, with the watermark
+path that only sends points newer than the cached last location. Rows sent
+is what the table grew by before the (driver_id, timestamp) natural key;
+rows stored is what survives ON CONFLICT DO NOTHING.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_history_row_growth
+"""
+import asyncio
+import random
+
+import domain.geo_location
+from data_access.repository import DatabaseRepository
+from domain.driver_location import DriverLocation
+from domain.geo_location import GeoLocation
+from benchmarks.utils import install_fakes, random_point
+
+DRIVERS = 10
+SHIFT_S = 8 * 60 * 60
+SUBMIT_INTERVAL_S = 5
+POINTS_PER_SUBMIT = 3
+
+
+class SimulatedClock:
+    """Stands in for the ``time`` module so shift timestamps pass the freshness check."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+class LegacyDriverLocation(DriverLocation):
+    async def save_locations(self, is_available: bool = False):
+        locations = await self.get_valid_locations()
+        if not locations:
+            return
+        await self.persist_locations(locations)
+        await self.cache_locations(locations)
+        await self.update_hexagon_cache(locations, is_available=is_available)
+
+
+def submit_points(position: tuple, submitted_at: int) -> list:
+    latitude, longitude = position
+    return [
+        {
+            "latitude": latitude + random.uniform(-1e-4, 1e-4),
+            "longitude": longitude + random.uniform(-1e-4, 1e-4),
+            "timestamp": submitted_at - (POINTS_PER_SUBMIT - 1 - i),
+            "accuracy": 5.0,
+            "speed": 10.0,
+            "bearing": 90.0,
+        }
+        for i in range(POINTS_PER_SUBMIT)
+    ]
+
+
+async def run(driver_location_class) -> dict:
+    random.seed(12)
+    redis, postgres = await install_fakes()
+    rows_sent = 0
+    bulk_insert = DatabaseRepository.bulk_insert.__func__
+
+    async def counting_bulk_insert(cls, dto_instances, **kwargs):
+        nonlocal rows_sent
+        rows_sent += len(dto_instances)
+        return await bulk_insert(cls, dto_instances, **kwargs)
+
+    DatabaseRepository.bulk_insert = classmethod(counting_bulk_insert)
+    clock = SimulatedClock(1_700_000_000)
+    original_time = domain.geo_location.time
+    domain.geo_location.time = clock
+    try:
+        positions = {f"driver-{i}": random_point() for i in range(DRIVERS)}
+        for elapsed in range(0, SHIFT_S, SUBMIT_INTERVAL_S):
+            clock.now = 1_700_000_000 + elapsed
+            for driver_id, position in positions.items():
+                locations = [GeoLocation.from_dict(point) for point in submit_points(position, int(clock.now))]
+                await driver_location_class(driver_id=driver_id, locations=locations).save_locations()
+    finally:
+        domain.geo_location.time = original_time
+        DatabaseRepository.bulk_insert = classmethod(bulk_insert)
+    submits = DRIVERS * SHIFT_S // SUBMIT_INTERVAL_S
+    return {
+        "submits": submits,
+        "points_submitted": submits * POINTS_PER_SUBMIT,
+        "rows_sent": rows_sent,
+        "rows_stored": len(postgres.rows),
+        "rows_sent_per_point": round(rows_sent / (submits * POINTS_PER_SUBMIT), 3),
+    }
+
+
+async def main() -> None:
+    for name, driver_location_class in (("legacy", LegacyDriverLocation), ("watermark", DriverLocation)):
+        print(name, await run(driver_location_class))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""Round trips per ``driver.location.submit``.
+
+Compares the legacy path, where every writer recomputes the valid location
+window, with the single-pass ``DriverLocation.save_locations`` pipeline.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_location_ingestion
+"""
+import asyncio
+import time
+
+from domain.driver_location import DriverLocation
+from domain.geo_location import GeoLocation
+from benchmarks.utils import install_fakes, random_point, gps_trace
+
+DRIVERS = 200
+SUBMITS_PER_DRIVER = 5
+
+
+async def legacy_submit(driver_location: DriverLocation) -> None:
+    await driver_location.persist_locations()
+    await driver_location.cache_locations()
+    await driver_location.update_hexagon_cache()
+
+
+async def single_pass_submit(driver_location: DriverLocation) -> None:
+    await driver_location.save_locations()
+
+
+async def run(submit) -> dict:
+    redis, postgres = await install_fakes()
+    starts = {f"driver-{i}": random_point() for i in range(DRIVERS)}
+    started_at = time.perf_counter()
+    for _ in range(SUBMITS_PER_DRIVER):
+        for driver_id, start in starts.items():
+            locations = [GeoLocation.from_dict(loc) for loc in gps_trace(start, 3)]
+            await submit(DriverLocation(driver_id=driver_id, locations=locations))
+    elapsed = time.perf_counter() - started_at
+    submits = DRIVERS * SUBMITS_PER_DRIVER
+    return {
+        "redis_round_trips_per_submit": redis.stats["round_trips"] / submits,
+        "postgres_round_trips_per_submit": postgres.stats["round_trips"] / submits,
+        "ms_per_submit": elapsed * 1000 / submits,
+    }
+
+
+async def main() -> None:
+    for name, submit in (("legacy", legacy_submit), ("single_pass", single_pass_submit)):
+        result = await run(submit)
+        print(name, {key: round(value, 3) for key, value in result.items()})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
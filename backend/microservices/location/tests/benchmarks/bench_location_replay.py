@@ -0,0 +1,144 @@
+"""Replays synthetic GPS traces against the location service's RPC handlers.
+
+``N`` drivers come online, then every tick each driver submits its next trace
+point through ``DriverService.submit_location`` while dispatch queries run
+through ``TrackerService.get_nearest_drivers``. Reports p50/p99 latency,
+ops/sec and Redis commands per operation for both, and writes them to a JSON
+file so runs can be compared between commits.
+
+Runs in-process on the fake Redis and Postgres by default. ``--redis host:port[/db] --flush``
+uses, and flushes, a database of a local redis-server; ``--postgres`` uses the database from ``PostgresConfig``
+with the write-behind history writer.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_location_replay --drivers 1000 --ticks 30 --output replay.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from typing import Dict, List
+
+from application import DriverService, TrackerService
+from data_access.history_writer import LocationHistoryWriter
+from data_access.repository import DatabaseRepository
+from benchmarks.utils import add_redis_arguments, install_redis, random_point, percentile, redis_command_count
+
+RADIUS_M = 2_000
+MAX_COUNT = 10
+
+
+def make_traces(drivers: int, ticks: int) -> Dict[str, List[tuple]]:
+    traces = {}
+    for i in range(drivers):
+        latitude, longitude = random_point(spread_deg=0.1)
+        trace = []
+        for _ in range(ticks):
+            latitude += random.uniform(-1e-4, 1e-4)
+            longitude += random.uniform(-1e-4, 1e-4)
+            trace.append((latitude, longitude))
+        traces[f"driver-{i}"] = trace
+    return traces
+
+
+def summarize(latencies_ms: List[float], commands: int, elapsed_s: float) -> dict:
+    operations = len(latencies_ms)
+    return {
+        "operations": operations,
+        "p50_ms": round(percentile(latencies_ms, 0.5), 3),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 3),
+        "ops_per_sec": round(operations / elapsed_s, 1) if elapsed_s else 0.0,
+        "redis_commands_per_op": round(commands / operations, 3) if operations else 0.0,
+    }
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return ""
+
+
+async def replay(arguments: argparse.Namespace) -> dict:
+    random.seed(arguments.seed)
+    redis = await install_redis(arguments.redis, arguments.flush)
+    if arguments.postgres:
+        await DatabaseRepository.initialize()
+        await LocationHistoryWriter.initialize()
+    traces = make_traces(arguments.drivers, arguments.ticks)
+    for driver_id in traces:
+        await DriverService.change_status_online(driver_id)
+        await DriverService.set_driver_available(driver_id)
+
+    timings = {"submit_location": [], "get_nearest_drivers": []}
+    commands = {"submit_location": 0, "get_nearest_drivers": 0}
+    elapsed = {"submit_location": 0.0, "get_nearest_drivers": 0.0}
+
+    async def timed(operation: str, call) -> None:
+        commands_before = await redis_command_count(redis)
+        started_at = time.perf_counter()
+        await call
+        duration = time.perf_counter() - started_at
+        commands[operation] += await redis_command_count(redis) - commands_before
+        timings[operation].append(duration * 1000)
+        elapsed[operation] += duration
+
+    for tick in range(arguments.ticks):
+        for n, (driver_id, trace) in enumerate(traces.items()):
+            latitude, longitude = trace[tick]
+            location = {
+                "latitude": latitude,
+                "longitude": longitude,
+                "timestamp": int(time.time()),
+                "accuracy": 5.0,
+                "speed": 10.0,
+                "bearing": 90.0,
+            }
+            await timed("submit_location", DriverService.submit_location(driver_id, [location]))
+            if n % arguments.submits_per_query == 0:
+                query_latitude, query_longitude = random_point(spread_deg=0.1)
+                await timed("get_nearest_drivers", TrackerService.get_nearest_drivers(
+                    {"latitude": query_latitude, "longitude": query_longitude}, RADIUS_M, MAX_COUNT,
+                ))
+
+    if arguments.postgres:
+        await LocationHistoryWriter.terminate()
+        await DatabaseRepository.terminate()
+    return {
+        "commit": current_commit(),
+        "timestamp": int(time.time()),
+        "backend": {"redis": arguments.redis or "fake", "postgres": "real" if arguments.postgres else "fake"},
+        "parameters": {
+            "drivers": arguments.drivers,
+            "ticks": arguments.ticks,
+            "submits_per_query": arguments.submits_per_query,
+            "seed": arguments.seed,
+        },
+        "results": {
+            operation: summarize(timings[operation], commands[operation], elapsed[operation])
+            for operation in timings
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drivers", type=int, default=1_000)
+    parser.add_argument("--ticks", type=int, default=20, help="trace points per driver, one per tick")
+    parser.add_argument("--submits-per-query", type=int, default=10, help="submits between nearest-driver queries")
+    parser.add_argument("--seed", type=int, default=20)
+    add_redis_arguments(parser)
+    parser.add_argument("--postgres", action="store_true", help="write history to the database from PostgresConfig")
+    parser.add_argument("--output", default="replay_results.json")
+    arguments = parser.parse_args()
+    report = asyncio.run(replay(arguments))
+    with open(arguments.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(json.dumps(report["results"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
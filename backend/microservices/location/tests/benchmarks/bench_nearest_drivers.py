@@ -0,0 +1,92 @@
+"""Nearest-driver search over a synthetic 50k-driver city.
+
+Reports latency and recall of ``Hexagon.get_nearest_drivers`` against a
+brute-force scan, next to the single-cell lookup it replaced.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_nearest_drivers
+"""
+import asyncio
+import random
+import time
+
+from ftgo_utils.constants import SIUnits
+from ftgo_utils.geo import haversine
+
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+from benchmarks.utils import install_fakes, random_point, percentile
+
+DRIVERS = 50_000
+QUERIES = 200
+RADIUS_M = 1_000
+MAX_COUNT = 10
+
+
+async def populate_city(drivers: int) -> dict:
+    positions = {}
+    for i in range(drivers):
+        latitude, longitude = random_point(spread_deg=0.15)
+        driver_id = f"driver-{i}"
+        positions[driver_id] = (latitude, longitude)
+        await Hexagon.move_driver_to_hexagon(
+            driver_id,
+            GeoLocation(latitude=latitude, longitude=longitude, timestamp=int(time.time())),
+        )
+    return positions
+
+
+def brute_force(positions: dict, latitude: float, longitude: float) -> list:
+    distances = [
+        (haversine(latitude, longitude, lat, lng, unit=SIUnits.LENGTH.M), driver_id)
+        for driver_id, (lat, lng) in positions.items()
+    ]
+    return [driver_id for distance, driver_id in sorted(distances)[:MAX_COUNT] if distance <= RADIUS_M]
+
+
+async def single_cell(latitude: float, longitude: float) -> list:
+    hexagon = Hexagon.from_location(GeoLocation(latitude=latitude, longitude=longitude))
+    drivers = await hexagon.get_drivers()
+    distances = [
+        (haversine(latitude, longitude, location.latitude, location.longitude, unit=SIUnits.LENGTH.M), driver_id)
+        for driver_id, location in drivers.items()
+    ]
+    return [driver_id for distance, driver_id in sorted(distances)[:MAX_COUNT] if distance <= RADIUS_M]
+
+
+async def k_ring(latitude: float, longitude: float) -> list:
+    drivers = await Hexagon.get_nearest_drivers(latitude, longitude, RADIUS_M, max_count=MAX_COUNT)
+    return [driver.driver_id for driver in drivers]
+
+
+async def measure(search, positions: dict, queries: list, redis) -> dict:
+    latencies, recalls = [], []
+    redis.reset_stats()
+    for latitude, longitude in queries:
+        expected = brute_force(positions, latitude, longitude)
+        started_at = time.perf_counter()
+        found = await search(latitude, longitude)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+        if expected:
+            recalls.append(len(set(found) & set(expected)) / len(expected))
+    return {
+        "p50_ms": percentile(latencies, 0.5),
+        "p99_ms": percentile(latencies, 0.99),
+        "recall": sum(recalls) / len(recalls) if recalls else 1.0,
+        "redis_round_trips_per_query": redis.stats["round_trips"] / len(queries),
+    }
+
+
+async def main() -> None:
+    random.seed(7)
+    redis, _ = await install_fakes()
+    positions = await populate_city(DRIVERS)
+    queries = [random_point(spread_deg=0.1) for _ in range(QUERIES)]
+    for name, search in (("single_cell", single_cell), ("k_ring", k_ring)):
+        result = await measure(search, positions, queries, redis)
+        print(name, {key: round(value, 3) for key, value in result.items()})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
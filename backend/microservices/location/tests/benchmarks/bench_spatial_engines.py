@@ -0,0 +1,70 @@
+"""Hexagon hashes vs. the Redis GEO index for nearest-driver queries.
+
+Reports p50/p99 latency and recall against brute force at 10k and 100k
+drivers. Uses the fake Redis unless ``--redis host:port[/db] --flush`` is given.
+
+Run from the service root::
+
+    PYTHONPATH=src:tests python -m benchmarks.bench_spatial_engines [--redis localhost:6379/15 --flush]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from domain.geo_index import GeoIndex
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+from benchmarks.bench_nearest_drivers import brute_force, MAX_COUNT, RADIUS_M
+from benchmarks.utils import add_redis_arguments, install_redis, random_point, percentile
+
+DRIVER_COUNTS = (10_000, 100_000)
+QUERIES = 200
+
+
+async def populate(drivers: int) -> dict:
+    positions = {}
+    now = int(time.time())
+    for i in range(drivers):
+        latitude, longitude = random_point(spread_deg=0.15)
+        driver_id = f"driver-{i}"
+        positions[driver_id] = (latitude, longitude)
+        location = GeoLocation(latitude=latitude, longitude=longitude, timestamp=now)
+        await Hexagon.add_driver(driver_id, location)
+        await GeoIndex.add_driver(driver_id, location)
+    return positions
+
+
+async def measure(engine, positions: dict, queries: list) -> dict:
+    latencies, recalls = [], []
+    for latitude, longitude in queries:
+        expected = brute_force(positions, latitude, longitude)
+        started_at = time.perf_counter()
+        drivers = await engine.get_nearest_drivers(latitude, longitude, RADIUS_M, max_count=MAX_COUNT)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+        if expected:
+            found = {driver.driver_id for driver in drivers}
+            recalls.append(len(found & set(expected)) / len(expected))
+    return {
+        "p50_ms": percentile(latencies, 0.5),
+        "p99_ms": percentile(latencies, 0.99),
+        "recall": sum(recalls) / len(recalls) if recalls else 1.0,
+    }
+
+
+async def main(redis_address: str = None, flush: bool = False) -> None:
+    for drivers in DRIVER_COUNTS:
+        random.seed(drivers)
+        await install_redis(redis_address, flush)
+        positions = await populate(drivers)
+        queries = [random_point(spread_deg=0.1) for _ in range(QUERIES)]
+        for engine in (Hexagon, GeoIndex):
+            result = await measure(engine, positions, queries)
+            print(drivers, engine.__name__, {key: round(value, 3) for key, value in result.items()})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    add_redis_arguments(parser)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.redis, arguments.flush))
@@ -0,0 +1,99 @@
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from aredis_client import AsyncRedis
+
+from data_access.repository import CacheRepository, DatabaseRepository
+from test_doubles.redis import FakeAsyncRedis
+from test_doubles.postgres import FakeAsyncPostgres
+
+CITY_CENTER = (35.6892, 51.3890)
+
+
+async def install_fakes() -> Tuple[FakeAsyncRedis, FakeAsyncPostgres]:
+    redis = await FakeAsyncRedis.create(host="localhost", port=6379, db=0)
+    postgres = await FakeAsyncPostgres.create()
+    CacheRepository._data_access = redis
+    DatabaseRepository._data_access = postgres
+    return redis, postgres
+
+
+async def install_redis(address: Optional[str] = None, flush: bool = False) -> Any:
+    """Points ``CacheRepository`` at the fake Redis or a local redis-server (``host:port[/db]``).
+
+    Benchmarks FLUSHDB the server's database between rounds, so a real server is only used
+    when ``flush`` confirms it (the benchmarks' ``--flush`` flag).
+    """
+    if not address:
+        redis, _ = await install_fakes()
+        return redis
+    if not flush:
+        raise SystemExit(
+            f"--redis {address} runs FLUSHDB on that database; pass --flush to confirm, "
+            "ideally with a spare db index such as localhost:6379/15"
+        )
+    server, _, db = address.partition("/")
+    host, port = server.split(":")
+    CacheRepository._data_access = await AsyncRedis.create(host=host, port=int(port), db=int(db or 0))
+    async with CacheRepository._data_access.get_or_create_session() as session:
+        await session.flushdb()
+    await CacheRepository.load_scripts()
+    return CacheRepository._data_access
+
+
+def add_redis_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--redis", default=None, help="host:port[/db] of a local redis-server; its database is flushed")
+    parser.add_argument("--flush", action="store_true", help="confirm that the --redis database may be flushed")
+
+
+def random_point(center: Tuple[float, float] = CITY_CENTER, spread_deg: float = 0.05) -> Tuple[float, float]:
+    return (
+        center[0] + random.uniform(-spread_deg, spread_deg),
+        center[1] + random.uniform(-spread_deg, spread_deg),
+    )
+
+
+def gps_trace(start: Tuple[float, float], count: int, step_deg: float = 1e-4) -> List[Dict[str, Any]]:
+    now = int(time.time())
+    latitude, longitude = start
+    trace = []
+    for i in range(count):
+        latitude += random.uniform(-step_deg, step_deg)
+        longitude += random.uniform(-step_deg, step_deg)
+        trace.append({
+            "latitude": latitude,
+            "longitude": longitude,
+            "timestamp": now - (count - i),
+            "accuracy": 5.0,
+            "speed": 10.0,
+            "bearing": 90.0,
+        })
+    return trace
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+_info_calls: Dict[int, int] = {}
+
+
+async def redis_command_count(redis: Any) -> int:
+    """Commands processed so far by the fake Redis or, via INFO, by a real server.
+
+    A real server counts each INFO once it has run, so the INFO calls made here earlier are
+    subtracted and the difference of two readings covers only the commands in between.
+    """
+    if hasattr(redis, "stats"):
+        return redis.stats["commands"]
+    async with redis.get_or_create_session() as session:
+        total = (await session.info("stats"))["total_commands_processed"]
+    earlier_calls = _info_calls.get(id(redis), 0)
+    _info_calls[id(redis)] = earlier_calls + 1
+    return total - earlier_calls
@@ -0,0 +1,176 @@
+import re
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import PrimaryKeyConstraint, Select, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, TextClause, UnaryExpression
+
+# Partition name -> (lower, upper) bound, or None for the DEFAULT partition.
+Partitions = Dict[str, Optional[Tuple[datetime, datetime]]]
+
+CREATE_PARTITION = re.compile(r'CREATE TABLE IF NOT EXISTS "(\w+)" PARTITION OF "(\w+)" FOR VALUES FROM \(\'([^\']+)\'\) TO \(\'([^\']+)\'\)')
+ATTACH_PARTITION = re.compile(r'ALTER TABLE "(\w+)" ATTACH PARTITION "(\w+)" FOR VALUES FROM \(\'([^\']+)\'\) TO \(\'([^\']+)\'\)')
+DROP_TABLE = re.compile(r'DROP TABLE IF EXISTS "(\w+)"')
+
+
+class FakeAsyncPostgresSession:
+    def __init__(self, rows: List[Any], stats: Dict[str, int], partitions: Dict[str, Partitions], statements: List[str]):
+        self.rows = rows
+        self.stats = stats
+        self.partitions = partitions
+        self.statements = statements
+        self._pending: List[Any] = []
+
+    def add_all(self, instances: List[Any]) -> None:
+        self._pending.extend(instances)
+
+    def add(self, instance: Any) -> None:
+        self._pending.append(instance)
+
+    async def flush(self) -> None:
+        self.stats["round_trips"] += 1
+
+    async def commit(self) -> None:
+        self.stats["round_trips"] += 1
+        self.rows.extend(self._pending)
+        self._pending = []
+
+    async def rollback(self) -> None:
+        self._pending = []
+
+    async def refresh(self, instance: Any) -> None:
+        self.stats["round_trips"] += 1
+
+    async def execute(self, statement: Any, params: Optional[Any] = None, *args, **kwargs) -> Any:
+        self.stats["round_trips"] += 1
+        if getattr(statement, "is_insert", False) and isinstance(params, list):
+            return FakeResult(self._insert_rows(statement, params))
+        if isinstance(statement, TextClause):
+            return self._execute_text(statement.text, params or {})
+        if isinstance(statement, Select):
+            return FakeResult(self._select(statement))
+        return FakeResult([])
+
+    def _select(self, statement: Select) -> List[Tuple]:
+        """Evaluates column selects with comparison filters, ``order_by`` and ``limit`` over stored rows."""
+        columns = [column.name for column in statement.selected_columns]
+        rows = [
+            row for row in self.rows
+            if isinstance(row, dict) and all(column in row for column in columns) and self._matches(row, statement.whereclause)
+        ]
+        for clause in reversed(statement._order_by_clauses):
+            descending = isinstance(clause, UnaryExpression) and clause.modifier is operators.desc_op
+            column = clause.element if isinstance(clause, UnaryExpression) else clause
+            rows.sort(key=lambda row: row[column.name], reverse=descending)
+        if statement._limit is not None:
+            rows = rows[:statement._limit]
+        return [tuple(row[column] for column in columns) for row in rows]
+
+    def _matches(self, row: Dict[str, Any], clause: Any) -> bool:
+        if clause is None:
+            return True
+        if isinstance(clause, BooleanClauseList):
+            results = [self._matches(row, child) for child in clause.clauses]
+            return all(results) if clause.operator is operators.and_ else any(results)
+        if isinstance(clause, BinaryExpression):
+            return clause.operator(row.get(clause.left.name), clause.right.value)
+        raise NotImplementedError(f"FakeAsyncPostgres cannot evaluate {clause!r}")
+
+    def _execute_text(self, sql: str, params: Dict[str, Any]) -> 'FakeResult':
+        """Emulates the partition DDL and catalog lookups issued by ``DatabaseRepository``."""
+        self.statements.append(sql)
+        if "pg_inherits" in sql:
+            return FakeResult(sorted(self.partitions.get(params["table_name"], {})))
+        match = CREATE_PARTITION.search(sql) or ATTACH_PARTITION.search(sql)
+        if match:
+            first, second, lower, upper = match.groups()
+            partition_name, table_name = (first, second) if sql.startswith("CREATE") else (second, first)
+            self.partitions.setdefault(table_name, {})[partition_name] = (
+                datetime.fromisoformat(lower), datetime.fromisoformat(upper),
+            )
+        match = DROP_TABLE.search(sql)
+        if match:
+            for partitions in self.partitions.values():
+                partitions.pop(match.group(1), None)
+        return FakeResult([])
+
+    def _insert_rows(self, statement: Any, params: List[Dict[str, Any]]) -> List[Any]:
+        """Emulates ``INSERT ... ON CONFLICT DO NOTHING`` against the table's unique constraints and indexes."""
+        table = statement.table
+        skip_conflicts = getattr(statement, "_post_values_clause", None) is not None
+        keys = [
+            tuple(column.name for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, (UniqueConstraint, PrimaryKeyConstraint))
+        ] + [tuple(column.name for column in index.columns) for index in table.indexes if index.unique]
+        existing = {key: {tuple(row.get(name) for name in key) for row in self.rows if isinstance(row, dict)} for key in keys}
+        partitions = self.partitions.get(table.name)
+        inserted = []
+        for row in params:
+            if partitions and not self._has_partition(partitions, row.get("timestamp")):
+                raise IntegrityError(str(statement), row, Exception(f'no partition of relation "{table.name}" found for row'))
+            conflicts = [key for key in keys if tuple(row.get(name) for name in key) in existing[key]]
+            if conflicts:
+                if skip_conflicts:
+                    continue
+                raise IntegrityError(str(statement), row, Exception(f"duplicate key on {table.name}: {conflicts[0]}"))
+            for key in keys:
+                existing[key].add(tuple(row.get(name) for name in key))
+            inserted.append(dict(row))
+        self._pending.extend(inserted)
+        entity = (getattr(statement, "entity_description", None) or {}).get("type")
+        if entity is None:
+            return inserted
+        return [entity(**row) for row in inserted]
+
+
+    @staticmethod
+    def _has_partition(partitions: Partitions, timestamp: Optional[datetime]) -> bool:
+        return any(
+            bounds is None or (timestamp is not None and bounds[0] <= timestamp < bounds[1])
+            for bounds in partitions.values()
+        )
+
+
+class FakeResult:
+    def __init__(self, rows: List[Any]):
+        self._rows = rows
+
+    def scalars(self) -> 'FakeResult':
+        return self
+
+    def all(self) -> List[Any]:
+        return list(self._rows)
+
+    def one_or_none(self) -> Optional[Any]:
+        return self._rows[0] if self._rows else None
+
+
+class FakeAsyncPostgres:
+    def __init__(self):
+        self.rows: List[Any] = []
+        self.stats = {"round_trips": 0}
+        # Range partitions per table; rows of a table with partitions must fall in one of them.
+        self.partitions: Dict[str, Partitions] = {}
+        self.statements: List[str] = []
+
+    @asynccontextmanager
+    async def get_or_create_session(self):
+        yield FakeAsyncPostgresSession(self.rows, self.stats, self.partitions, self.statements)
+
+    def add_default_partition(self, table_name: str) -> None:
+        self.partitions.setdefault(table_name, {})[f"{table_name}_default"] = None
+
+    def reset_stats(self) -> None:
+        self.stats["round_trips"] = 0
+
+    async def disconnect(self):
+        pass
+
+    @classmethod
+    async def create(cls, *args, **kwargs):
+        return cls()
@@ -1,13 +1,26 @@
 import asyncio
+import hashlib
+import math
 import time
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, List, Tuple, Callable
+from typing import Any, Optional, Dict, List, Tuple, Callable
+
+from test_doubles.redis_scripts import SCRIPT_EMULATORS
 
 class FakeAsyncRedisSession:
-    def __init__(self, store: Dict[str, str], expiry_store: Dict[str, float], time_provider: Callable = time.time):
+    def __init__(
+        self,
+        store: Dict[str, str],
+        expiry_store: Dict[str, float],
+        time_provider: Callable = time.time,
+        stats: Optional[Dict[str, int]] = None,
+        scripts: Optional[Dict[str, str]] = None,
+    ):
         self.store = store
         self.expiry_store = expiry_store
         self.time_provider = time_provider
+        self.stats = stats if stats is not None else {"round_trips": 0, "commands": 0}
+        self.scripts = scripts if scripts is not None else {}
 
     async def __aenter__(self):
         return self
@@ -39,20 +52,43 @@ class FakeAsyncRedisSession:
         self.store.clear()
         self.expiry_store.clear()
 
+    async def script_flush(self):
+        self.scripts.clear()
+
+    async def script_load(self, source: str) -> str:
+        sha = hashlib.sha1(source.encode()).hexdigest()
+        self.scripts[sha] = source
+        return sha
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> Any:
+        if sha not in self.scripts:
+            raise Exception("NOSCRIPT No matching script. Please use EVAL.")
+        self.stats["round_trips"] += 1
+        self.stats["commands"] += 1
+        emulator = SCRIPT_EMULATORS[self.scripts[sha]]
+        keys, args = list(keys_and_args[:numkeys]), list(keys_and_args[numkeys:])
+        return await emulator(self.pipeline(), keys, args)
+
     def pipeline(self):
-        return FakeRedisPipeline(self.store, self.expiry_store, self.time_provider)
+        return FakeRedisPipeline(self.store, self.expiry_store, self.time_provider, self.stats, self.scripts)
 
 class FakeAsyncRedis:
     def __init__(self):
         self.store = {}
         self.expiry_store = {}
         self.time_provider = time.time
+        self.stats = {"round_trips": 0, "commands": 0}
+        self.scripts = {}
 
     @asynccontextmanager
     async def get_or_create_session(self):
-        session = FakeAsyncRedisSession(self.store, self.expiry_store, self.time_provider)
+        session = FakeAsyncRedisSession(self.store, self.expiry_store, self.time_provider, self.stats, self.scripts)
         yield session
 
+    def reset_stats(self) -> None:
+        self.stats["round_trips"] = 0
+        self.stats["commands"] = 0
+
     async def disconnect(self):
         pass
 
@@ -71,13 +107,24 @@ class FakeAsyncRedis:
         return instance
 
 class FakeRedisPipeline:
-    def __init__(self, store: Dict[str, str], expiry_store: Dict[str, float], time_provider: Callable = time.time):
+    def __init__(
+        self,
+        store: Dict[str, str],
+        expiry_store: Dict[str, float],
+        time_provider: Callable = time.time,
+        stats: Optional[Dict[str, int]] = None,
+        scripts: Optional[Dict[str, str]] = None,
+    ):
         self.store = store
         self.expiry_store = expiry_store
         self.time_provider = time_provider
+        self.stats = stats if stats is not None else {"round_trips": 0, "commands": 0}
+        self.scripts = scripts if scripts is not None else {}
         self.commands: List[Tuple[Callable, Tuple]] = []
 
     async def execute(self):
+        self.stats["round_trips"] += 1
+        self.stats["commands"] += len(self.commands)
         results = []
         for method, args in self.commands:
             result = await method(*args)
@@ -85,6 +132,18 @@ class FakeRedisPipeline:
         self.commands = []
         return results
 
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any):
+        self.commands.append((self._evalsha, (sha, numkeys, *keys_and_args)))
+        return self
+
+    async def _evalsha(self, sha: str, numkeys: int, *keys_and_args: Any):
+        # Like Redis, a pipeline only reports a missing script once it is executed.
+        if sha not in self.scripts:
+            raise Exception("NOSCRIPT No matching script. Please use EVAL.")
+        emulator = SCRIPT_EMULATORS[self.scripts[sha]]
+        keys, args = list(keys_and_args[:numkeys]), list(keys_and_args[numkeys:])
+        return await emulator(FakeRedisPipeline(self.store, self.expiry_store, self.time_provider, {"round_trips": 0, "commands": 0}, self.scripts), keys, args)
+
     def delete(self, key: str):
         self.commands.append((self._delete_key, (key,)))
         return self
@@ -120,3 +179,131 @@ class FakeRedisPipeline:
     async def _expire_key(self, key: str, ttl: int):
         if key in self.store:
             self.expiry_store[key] = self.time_provider() + ttl
+
+    def hset(self, key: str, field: str, value: str):
+        self.commands.append((self._hset_field, (key, field, value)))
+        return self
+
+    async def _hset_field(self, key: str, field: str, value: str):
+        hash_value = await self._get_hash(key)
+        created = field not in hash_value
+        hash_value[field] = value
+        self.store[key] = hash_value
+        return int(created)
+
+    def hget(self, key: str, field: str):
+        self.commands.append((self._hget_field, (key, field)))
+        return self
+
+    async def _hget_field(self, key: str, field: str):
+        hash_value = await self._get_hash(key)
+        return hash_value.get(field)
+
+    def hgetall(self, key: str):
+        self.commands.append((self._hgetall_fields, (key,)))
+        return self
+
+    async def _hgetall_fields(self, key: str):
+        hash_value = await self._get_hash(key)
+        return dict(hash_value)
+
+    def hdel(self, key: str, *fields: str):
+        self.commands.append((self._hdel_fields, (key, *fields)))
+        return self
+
+    async def _hdel_fields(self, key: str, *fields: str):
+        hash_value = await self._get_hash(key)
+        deleted = sum(1 for field in fields if hash_value.pop(field, None) is not None)
+        if not hash_value:
+            await self._delete_key(key)
+        return deleted
+
+    async def _get_hash(self, key: str) -> Dict[str, str]:
+        value = await self._get_key(key)
+        return value if isinstance(value, dict) else {}
+
+    def geoadd(self, key: str, values: List[Any]):
+        self.commands.append((self._geoadd_members, (key, values)))
+        return self
+
+    async def _geoadd_members(self, key: str, values: List[Any]):
+        members = await self._get_hash(key)
+        added = 0
+        for i in range(0, len(values), 3):
+            longitude, latitude, member = values[i:i + 3]
+            added += int(member not in members)
+            members[member] = (float(longitude), float(latitude))
+        self.store[key] = members
+        return added
+
+    def zadd(self, key: str, mapping: Dict[str, float]):
+        self.commands.append((self._zadd_members, (key, mapping)))
+        return self
+
+    async def _zadd_members(self, key: str, mapping: Dict[str, float]):
+        members = await self._get_hash(key)
+        added = sum(1 for member in mapping if member not in members)
+        members.update({member: float(score) for member, score in mapping.items()})
+        self.store[key] = members
+        return added
+
+    def zrangebyscore(self, key: str, min: Any, max: Any, start: Optional[int] = None, num: Optional[int] = None):
+        self.commands.append((self._zrange_by_score, (key, min, max, start, num)))
+        return self
+
+    async def _zrange_by_score(self, key: str, min: Any, max: Any, start: Optional[int] = None, num: Optional[int] = None):
+        members = sorted((score, member) for member, score in (await self._get_hash(key)).items() if float(min) <= score <= float(max))
+        members = [member for _, member in members]
+        if start is not None:
+            members = members[start:start + num if num is not None else None]
+        return members
+
+    def zrem(self, key: str, *members: str):
+        self.commands.append((self._hdel_fields, (key, *members)))
+        return self
+
+    def geosearch(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        radius: float,
+        unit: str = "m",
+        sort: Optional[str] = None,
+        count: Optional[int] = None,
+        withdist: bool = False,
+        withcoord: bool = False,
+        **kwargs,
+    ):
+        self.commands.append((self._geosearch_members, (key, longitude, latitude, radius, sort, count, withdist, withcoord)))
+        return self
+
+    async def _geosearch_members(self, key, longitude, latitude, radius, sort, count, withdist, withcoord):
+        members = await self._get_hash(key)
+        matches = []
+        for member, (member_longitude, member_latitude) in members.items():
+            distance = self._geo_distance_m(latitude, longitude, member_latitude, member_longitude)
+            if distance <= radius:
+                matches.append((member, distance, (member_longitude, member_latitude)))
+        if sort:
+            matches.sort(key=lambda match: match[1], reverse=sort.upper() == "DESC")
+        if count:
+            matches = matches[:count]
+        results = []
+        for member, distance, coordinates in matches:
+            item = [member]
+            if withdist:
+                item.append(distance)
+            if withcoord:
+                item.append(coordinates)
+            results.append(item if len(item) > 1 else member)
+        return results
+
+    @staticmethod
+    def _geo_distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+        # Same spherical model as Redis' geohash helpers.
+        earth_radius_m = 6372797.560856
+        lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+        u = math.sin((lat2 - lat1) / 2)
+        v = math.sin((lng2 - lng1) / 2)
+        return 2 * earth_radius_m * math.asin(math.sqrt(u * u + math.cos(lat1) * math.cos(lat2) * v * v))
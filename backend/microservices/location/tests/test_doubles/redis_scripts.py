@@ -0,0 +1,135 @@
+from typing import Any, Awaitable, Callable, Dict, List
+
+from data_access.repository.scripts import (
+    MOVE_DRIVER_TO_HEXAGON,
+    REMOVE_DRIVER_FROM_HEXAGON,
+    SET_DRIVER_AVAILABILITY,
+    GEO_ADD_DRIVER,
+    GEO_REMOVE_DRIVER,
+    GEO_SET_DRIVER_AVAILABILITY,
+    EVICT_STALE_DRIVER,
+    GEO_EVICT_STALE_DRIVERS,
+)
+
+# Python equivalents of the service's Lua scripts, keyed by script source.
+# Each emulator receives a pipeline whose private helpers run immediately.
+
+
+async def _moved(redis: Any, driver_key: str, expected_hex_id: str) -> bool:
+    return (await redis._get_key(driver_key) or "") != expected_hex_id
+
+
+async def move_driver_to_hexagon(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    driver_id, hex_id, location, ttl, is_available, now, hexagon_ttl, last_hex_id = args
+    if await _moved(redis, keys[0], last_hex_id):
+        return 0
+    if len(keys) > 4:
+        await redis._hdel_fields(keys[4], driver_id)
+        await redis._hdel_fields(keys[5], driver_id)
+    await redis._hset_field(keys[1], driver_id, location)
+    await redis._expire_key(keys[1], int(hexagon_ttl))
+    if is_available == "1":
+        await redis._hset_field(keys[2], driver_id, location)
+        await redis._expire_key(keys[2], int(hexagon_ttl))
+    else:
+        await redis._hdel_fields(keys[2], driver_id)
+    await redis._set_key(keys[0], hex_id, int(ttl))
+    await redis._zadd_members(keys[3], {driver_id: float(now)})
+    return 1
+
+
+async def remove_driver_from_hexagon(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    driver_id, last_hex_id = args
+    if await _moved(redis, keys[0], last_hex_id):
+        return 0
+    if len(keys) > 2:
+        await redis._hdel_fields(keys[2], driver_id)
+        await redis._hdel_fields(keys[3], driver_id)
+    await redis._delete_key(keys[0])
+    await redis._hdel_fields(keys[1], driver_id)
+    return 1
+
+
+async def evict_stale_driver(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    driver_id, cutoff, last_hex_id = args
+    last_seen = (await redis._get_hash(keys[0])).get(driver_id)
+    if last_seen is None or last_seen > float(cutoff) or await _moved(redis, keys[1], last_hex_id):
+        return 0
+    if len(keys) > 2:
+        await redis._hdel_fields(keys[2], driver_id)
+        await redis._hdel_fields(keys[3], driver_id)
+    await redis._delete_key(keys[1])
+    await redis._hdel_fields(keys[0], driver_id)
+    return 1
+
+
+async def _stale_members(redis: Any, key: str, cutoff: Any, limit: Any) -> List[str]:
+    scores = await redis._get_hash(key)
+    stale = sorted((score, member) for member, score in scores.items() if score <= float(cutoff))
+    return [member for _, member in stale[:int(limit)]]
+
+
+async def geo_evict_stale_drivers(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    cutoff, limit = args
+    stale = await _stale_members(redis, keys[0], cutoff, limit)
+    for driver_id in stale:
+        for key in keys:
+            await redis._hdel_fields(key, driver_id)
+    return stale
+
+
+async def set_driver_availability(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    driver_id, is_available, last_hex_id = args
+    if await _moved(redis, keys[0], last_hex_id):
+        return 0
+    if len(keys) == 1:
+        return 1
+    if is_available == "1":
+        location = await redis._hget_field(keys[1], driver_id)
+        if location:
+            await redis._hset_field(keys[2], driver_id, location)
+    else:
+        await redis._hdel_fields(keys[2], driver_id)
+    return 1
+
+
+async def geo_add_driver(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    driver_id, longitude, latitude, is_available, now = args
+    await redis._geoadd_members(keys[0], [longitude, latitude, driver_id])
+    if is_available == "1":
+        await redis._geoadd_members(keys[1], [longitude, latitude, driver_id])
+    else:
+        await redis._hdel_fields(keys[1], driver_id)
+    await redis._zadd_members(keys[2], {driver_id: float(now)})
+    return 1
+
+
+async def geo_remove_driver(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    (driver_id,) = args
+    for key in keys:
+        await redis._hdel_fields(key, driver_id)
+    return 1
+
+
+async def geo_set_driver_availability(redis: Any, keys: List[str], args: List[Any]) -> Any:
+    driver_id, is_available = args
+    if is_available == "1":
+        coordinates = (await redis._get_hash(keys[0])).get(driver_id)
+        if not coordinates:
+            return 0
+        await redis._geoadd_members(keys[1], [coordinates[0], coordinates[1], driver_id])
+        return 1
+    await redis._hdel_fields(keys[1], driver_id)
+    return 1
+
+
+SCRIPT_EMULATORS: Dict[str, Callable[[Any, List[str], List[Any]], Awaitable[Any]]] = {
+    MOVE_DRIVER_TO_HEXAGON: move_driver_to_hexagon,
+    REMOVE_DRIVER_FROM_HEXAGON: remove_driver_from_hexagon,
+    SET_DRIVER_AVAILABILITY: set_driver_availability,
+    GEO_ADD_DRIVER: geo_add_driver,
+    GEO_REMOVE_DRIVER: geo_remove_driver,
+    GEO_SET_DRIVER_AVAILABILITY: geo_set_driver_availability,
+    EVICT_STALE_DRIVER: evict_stale_driver,
+    GEO_EVICT_STALE_DRIVERS: geo_evict_stale_drivers,
+}
@@ -0,0 +1,25 @@
+from datetime import date, timedelta
+
+import pytest
+
+from application.partitions import LocationPartitionMaintainer
+from config import LocationConfig
+from data_access.repository import DatabaseRepository
+from dto import DriverLocationDTO
+from test_doubles.postgres import FakeAsyncPostgres
+
+@pytest.mark.asyncio
+async def test_maintain_once_premakes_days_and_drops_expired_partitions(time_machine):
+    postgres = FakeAsyncPostgres()
+    DatabaseRepository._data_access = postgres
+    config = LocationConfig.snapshot()
+    today = date(2024, 1, 1)
+    expired_day = today - timedelta(days=config.history_retention_days + 1)
+    await DatabaseRepository.create_daily_partitions(DriverLocationDTO, [expired_day])
+
+    await LocationPartitionMaintainer.maintain_once()
+
+    assert sorted(postgres.partitions["driver_location"]) == [
+        f"driver_location_p{today + timedelta(days=offset):%Y%m%d}"
+        for offset in range(config.history_partition_premake_days + 1)
+    ]
@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+from config import HexagonConfig, LocationConfig, BaseConfig
+
+def test_snapshot_is_shared_read_only_and_reloadable():
+    BaseConfig.reload()
+    snapshot = LocationConfig.snapshot()
+
+    assert LocationConfig.snapshot() is snapshot
+    assert HexagonConfig.snapshot() is not snapshot
+    with pytest.raises(AttributeError):
+        snapshot.cache_ttl = 1
+
+    os.environ["LOCATIONS_CACHE_TTL"] = "42"
+    try:
+        assert LocationConfig.snapshot().cache_ttl == snapshot.cache_ttl
+        LocationConfig.reload()
+        assert LocationConfig.snapshot().cache_ttl == 42
+    finally:
+        del os.environ["LOCATIONS_CACHE_TTL"]
+        BaseConfig.reload()
@@ -0,0 +1,9 @@
+import pytest
+
+from config import HexagonConfig
+
+def test_stale_driver_threshold_must_be_below_driver_hexagon_ttl():
+    assert HexagonConfig(stale_driver_threshold_s=60, driver_hexagon_cache_ttl=120).stale_driver_threshold_s == 60
+
+    with pytest.raises(ValueError):
+        HexagonConfig(stale_driver_threshold_s=600, driver_hexagon_cache_ttl=600)
@@ -0,0 +1,15 @@
+import pytest
+
+from config import MetricsConfig
+
+def test_metrics_are_enabled_by_default(monkeypatch):
+    monkeypatch.delenv("ENABLE_METRICS", raising=False)
+
+    assert MetricsConfig().enabled is True
+
+@pytest.mark.parametrize("value, expected", [("true", True), ("1", True), ("false", False), ("0", False)])
+def test_metrics_flag_is_read_from_the_environment(monkeypatch, value, expected):
+    monkeypatch.setenv("ENABLE_METRICS", value)
+
+    assert MetricsConfig().enabled is expected
+    assert MetricsConfig(enabled=not expected).enabled is not expected
@@ -76,3 +76,60 @@ async def test_cache_repository_expire_key_before_ttl(cache_repository: CacheRep
 
     result = await cache_repository.fetch(key)
     assert result is None
+
+@pytest.mark.asyncio
+async def test_cache_repository_run_script_moves_driver_between_hexagons(cache_repository: CacheRepository, time_machine):
+    driver_key = cache_repository.key_for("driver_hexagon_cache", "driver-1")
+    last_seen_key = cache_repository.key_for("drivers_last_seen", "hexagon")
+
+    def cell_keys(hex_id):
+        return [cache_repository.key_for("hexagons_cache", hex_id), cache_repository.key_for("available_hexagons_cache", hex_id)]
+
+    def move_to(hex_id, last_hex_id):
+        previous_cell_keys = cell_keys(last_hex_id) if last_hex_id else []
+        return cache_repository.run_script(
+            "move_driver_to_hexagon",
+            keys=[driver_key, *cell_keys(hex_id), last_seen_key, *previous_cell_keys],
+            args=["driver-1", hex_id, {"latitude": 1.0}, 60, "1", 0, 600, last_hex_id],
+        )
+
+    assert await move_to("hex-a", "") == 1
+    # A caller that read an outdated cell is refused without any write.
+    assert await move_to("hex-b", "") is None
+    assert await move_to("hex-b", "hex-a") == 1
+
+    hexagons_cache = cache_repository.get_cache("hexagons_cache")
+    assert await hexagons_cache.fetch("hex-a", data_type="hash") is None
+    assert await hexagons_cache.fetch("hex-b", data_type="hash") == {"driver-1": {"latitude": 1.0}}
+    available_cache = cache_repository.get_cache("available_hexagons_cache")
+    assert await available_cache.fetch("hex-a", data_type="hash") is None
+    assert await available_cache.fetch("hex-b", data_type="hash") == {"driver-1": {"latitude": 1.0}}
+    assert await cache_repository.get_cache("driver_hexagon_cache").fetch("driver-1") == "hex-b"
+
+@pytest.mark.asyncio
+async def test_cache_repository_run_script_reloads_flushed_scripts(cache_repository: CacheRepository, time_machine):
+    driver_key = cache_repository.key_for("driver_hexagon_cache", "driver-1")
+
+    await cache_repository.load_scripts()
+    async with cache_repository._data_access.get_or_create_session() as session:
+        await session.script_flush()
+
+    result = await cache_repository.run_script(
+        "remove_driver_from_hexagon",
+        keys=[driver_key, cache_repository.key_for("drivers_last_seen", "hexagon")],
+        args=["driver-1", ""],
+    )
+
+    assert result == 1
+
+@pytest.mark.asyncio
+async def test_cache_repository_groups_keep_their_prefix_when_interleaved(cache_repository: CacheRepository, time_machine):
+    drivers = cache_repository.get_cache("drivers")
+    hexagons = cache_repository.get_cache("hexagons")
+
+    await drivers.insert("key", "driver")
+    await hexagons.insert("key", "hexagon")
+
+    assert await drivers.fetch("key") == "driver"
+    assert await hexagons.fetch("key") == "hexagon"
+    assert cache_repository.get_cache("drivers") is drivers
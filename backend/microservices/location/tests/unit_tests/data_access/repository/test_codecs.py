@@ -0,0 +1,57 @@
+import pytest
+
+from data_access.repository import CacheRepository
+from data_access.repository.codecs import JsonCodec, PackedLocationCodec
+
+def test_packed_location_codec_round_trips_locations():
+    codec = PackedLocationCodec()
+    location = {
+        "latitude": 35.6892,
+        "longitude": 51.389,
+        "timestamp": 1_700_000_000,
+        "accuracy": 5.0,
+        "speed": None,
+        "bearing": 90.0,
+        "province": "Tehran",
+    }
+
+    encoded = codec.encode(location)
+
+    assert len(encoded) < len(JsonCodec().encode(location))
+    assert codec.decode(encoded) == {
+        "latitude": 35.6892,
+        "longitude": 51.389,
+        "timestamp": 1_700_000_000,
+        "accuracy": 5.0,
+        "speed": None,
+        "bearing": 90.0,
+    }
+    assert isinstance(encoded, bytes) and encoded[0] == PackedLocationCodec.MAGIC
+
+def test_packed_location_codec_keeps_reading_json():
+    codec = PackedLocationCodec()
+    status = {"status": "online", "availability": "available"}
+
+    assert codec.encode(status) == JsonCodec().encode(status)
+    assert codec.decode(JsonCodec().encode(status)) == status
+    assert codec.decode(JsonCodec().encode({"latitude": 1.0, "longitude": 2.0})) == {"latitude": 1.0, "longitude": 2.0}
+    assert codec.decode("hexagon:abc") == "hexagon:abc"
+    assert codec.decode(b"hexagon:abc") == "hexagon:abc"
+    assert codec.decode(JsonCodec().encode(status).encode()) == status
+    assert codec.encode("hexagon:abc") == "hexagon:abc"
+
+def test_json_writer_still_reads_packed_values():
+    location = {"latitude": 35.6892, "longitude": 51.389, "timestamp": 1_700_000_000, "accuracy": None, "speed": None, "bearing": None}
+    CacheRepository.set_codec(JsonCodec())
+
+    assert CacheRepository._deserialize_value(PackedLocationCodec().encode(location)) == location
+    assert CacheRepository._deserialize_value(JsonCodec().encode(location)) == location
+
+def test_packed_location_codec_branches_on_the_magic_byte():
+    codec = PackedLocationCodec()
+    encoded = codec.encode({"latitude": 35.6892, "longitude": 51.389})
+
+    # Text that happens to start with the version byte is not mistaken for a packed value.
+    assert codec.decode(chr(PackedLocationCodec.VERSION) + "abc") == chr(PackedLocationCodec.VERSION) + "abc"
+    with pytest.raises(ValueError):
+        codec.decode(encoded[:1] + bytes([PackedLocationCodec.VERSION + 1]) + encoded[2:])
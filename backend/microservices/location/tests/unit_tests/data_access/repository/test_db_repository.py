@@ -0,0 +1,49 @@
+from datetime import date
+
+import pytest
+
+from data_access.repository import DatabaseRepository
+from dto import DriverLocationDTO
+from test_doubles.postgres import FakeAsyncPostgres
+
+
+@pytest.fixture
+def fake_postgres():
+    postgres = FakeAsyncPostgres()
+    DatabaseRepository._data_access = postgres
+    return postgres
+
+@pytest.mark.asyncio
+async def test_create_daily_partitions_only_creates_missing_days(fake_postgres):
+    await DatabaseRepository.create_daily_partitions(DriverLocationDTO, [date(2024, 1, 1)])
+
+    created = await DatabaseRepository.create_daily_partitions(DriverLocationDTO, [date(2024, 1, 1), date(2024, 1, 2)])
+
+    assert created == ["driver_location_p20240102"]
+    assert sorted(fake_postgres.partitions["driver_location"]) == ["driver_location_p20240101", "driver_location_p20240102"]
+
+@pytest.mark.asyncio
+async def test_create_daily_partitions_moves_default_partition_rows(fake_postgres):
+    fake_postgres.add_default_partition("driver_location")
+
+    created = await DatabaseRepository.create_daily_partitions(DriverLocationDTO, [date(2024, 1, 1)])
+
+    assert created == ["driver_location_p20240101"]
+    assert any(statement.startswith('WITH moved AS (DELETE FROM "driver_location_default"') for statement in fake_postgres.statements)
+    assert any("ATTACH PARTITION" in statement for statement in fake_postgres.statements)
+    assert "driver_location_p20240101" in fake_postgres.partitions["driver_location"]
+
+@pytest.mark.asyncio
+async def test_drop_daily_partitions_before_keeps_newer_and_default_partitions(fake_postgres):
+    fake_postgres.add_default_partition("driver_location")
+    await DatabaseRepository.create_daily_partitions(
+        DriverLocationDTO, [date(2023, 12, 30), date(2023, 12, 31), date(2024, 1, 1)],
+    )
+
+    dropped = await DatabaseRepository.drop_daily_partitions_before(DriverLocationDTO, date(2024, 1, 1))
+
+    assert dropped == ["driver_location_p20231230", "driver_location_p20231231"]
+    assert sorted(fake_postgres.partitions["driver_location"]) == ["driver_location_default", "driver_location_p20240101"]
+    assert fake_postgres.statements[-1] == (
+        'DELETE FROM "driver_location_default" WHERE "timestamp" < \'2024-01-01 00:00:00+00\''
+    )
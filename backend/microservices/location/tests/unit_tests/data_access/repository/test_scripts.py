@@ -0,0 +1,148 @@
+import json
+
+import pytest
+import pytest_asyncio
+
+from data_access.repository.scripts import LUA_SCRIPTS
+from test_doubles.redis_scripts import SCRIPT_EMULATORS
+
+# Runs the real Lua in LUA_SCRIPTS; the fake Redis used elsewhere runs Python copies of it.
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+DRIVER_KEY = "driver_hexagon_cache:driver-1"
+LAST_SEEN_KEY = "drivers_last_seen:hexagon"
+LOCATION = json.dumps({"latitude": 35.6892, "longitude": 51.389})
+
+
+def cell_keys(hex_id: str):
+    return [f"hexagons_cache:{hex_id}", f"available_hexagons_cache:{hex_id}"] if hex_id else []
+
+
+async def snapshot(redis):
+    return {key: await redis.dump(key) for key in await redis.keys("*")}
+
+
+async def run_script(redis, name: str, keys, args):
+    """Evaluates a script and checks that every key it wrote to was passed in KEYS."""
+    before = await snapshot(redis)
+    result = await redis.eval(LUA_SCRIPTS[name], len(keys), *keys, *args)
+    after = await snapshot(redis)
+    written = {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+    assert written <= set(keys), f"{name} wrote undeclared keys {written - set(keys)}"
+    return result
+
+
+def move_to(redis, hex_id: str, last_hex_id: str, is_available: str = "1", now: int = 100):
+    previous_cell_keys = cell_keys(last_hex_id) if last_hex_id != hex_id else []
+    return run_script(
+        redis,
+        "move_driver_to_hexagon",
+        [DRIVER_KEY, *cell_keys(hex_id), LAST_SEEN_KEY, *previous_cell_keys],
+        ["driver-1", hex_id, LOCATION, 60, is_available, now, 600, last_hex_id],
+    )
+
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+
+def test_every_script_has_an_emulator():
+    assert set(SCRIPT_EMULATORS) == set(LUA_SCRIPTS.values())
+
+@pytest.mark.asyncio
+async def test_move_driver_to_hexagon_clears_the_previous_cell(redis):
+    assert await move_to(redis, "hex-a", "") == 1
+    assert await move_to(redis, "hex-b", "hex-a") == 1
+
+    assert await redis.hgetall("hexagons_cache:hex-a") == {}
+    assert await redis.hgetall("available_hexagons_cache:hex-a") == {}
+    assert await redis.hgetall("hexagons_cache:hex-b") == {"driver-1": LOCATION}
+    assert await redis.hgetall("available_hexagons_cache:hex-b") == {"driver-1": LOCATION}
+    assert await redis.get(DRIVER_KEY) == "hex-b"
+    assert await redis.zscore(LAST_SEEN_KEY, "driver-1") == 100
+    assert 0 < await redis.ttl("hexagons_cache:hex-b") <= 600
+
+@pytest.mark.asyncio
+async def test_move_driver_to_hexagon_refuses_an_outdated_previous_cell(redis):
+    await move_to(redis, "hex-a", "")
+    before = await snapshot(redis)
+
+    assert await move_to(redis, "hex-b", "") == 0
+
+    assert await snapshot(redis) == before
+
+@pytest.mark.asyncio
+async def test_move_driver_to_hexagon_keeps_unavailable_drivers_out_of_the_available_hash(redis):
+    await move_to(redis, "hex-a", "")
+
+    await move_to(redis, "hex-a", "hex-a", is_available="0")
+
+    assert await redis.hgetall("hexagons_cache:hex-a") == {"driver-1": LOCATION}
+    assert await redis.hgetall("available_hexagons_cache:hex-a") == {}
+
+@pytest.mark.asyncio
+async def test_remove_driver_from_hexagon_removes_every_trace(redis):
+    await move_to(redis, "hex-a", "")
+
+    assert await run_script(redis, "remove_driver_from_hexagon", [DRIVER_KEY, LAST_SEEN_KEY], ["driver-1", ""]) == 0
+    assert await run_script(
+        redis, "remove_driver_from_hexagon", [DRIVER_KEY, LAST_SEEN_KEY, *cell_keys("hex-a")], ["driver-1", "hex-a"],
+    ) == 1
+
+    assert await redis.keys("*") == []
+
+@pytest.mark.asyncio
+async def test_set_driver_availability_copies_the_cell_entry(redis):
+    await move_to(redis, "hex-a", "", is_available="0")
+    keys = [DRIVER_KEY, *cell_keys("hex-a")]
+
+    assert await run_script(redis, "set_driver_availability", keys, ["driver-1", "1", "hex-a"]) == 1
+    assert await redis.hgetall("available_hexagons_cache:hex-a") == {"driver-1": LOCATION}
+
+    assert await run_script(redis, "set_driver_availability", keys, ["driver-1", "0", "hex-a"]) == 1
+    assert await redis.hgetall("available_hexagons_cache:hex-a") == {}
+
+    assert await run_script(redis, "set_driver_availability", [DRIVER_KEY], ["driver-2", "1", ""]) == 0
+
+@pytest.mark.asyncio
+async def test_evict_stale_driver_skips_drivers_seen_after_the_cutoff(redis):
+    await move_to(redis, "hex-a", "", now=100)
+    keys = [LAST_SEEN_KEY, DRIVER_KEY, *cell_keys("hex-a")]
+
+    assert await run_script(redis, "evict_stale_driver", keys, ["driver-1", 99, "hex-a"]) == 0
+    assert await run_script(redis, "evict_stale_driver", keys, ["driver-1", 100, ""]) == 0
+    assert await run_script(redis, "evict_stale_driver", keys, ["driver-1", 100, "hex-a"]) == 1
+
+    assert await redis.keys("*") == []
+
+@pytest.mark.asyncio
+async def test_geo_scripts_update_the_available_set(redis):
+    online, available, last_seen = "geo_index:online", "geo_index:available", "drivers_last_seen:geo"
+    await redis.geoadd(online, [51.389, 35.6892, "driver-1"])
+    await redis.zadd(last_seen, {"driver-1": 100})
+
+    assert await run_script(redis, "geo_set_driver_availability", [online, available], ["driver-1", "1"]) == 1
+    assert await redis.geopos(available, "driver-1") == await redis.geopos(online, "driver-1")
+    assert await run_script(redis, "geo_set_driver_availability", [online, available], ["driver-2", "1"]) == 0
+
+    evicted = await run_script(redis, "geo_evict_stale_drivers", [last_seen, online, available], [100, 10])
+
+    assert evicted == ["driver-1"]
+    assert await redis.keys("*") == []
+
+@pytest.mark.asyncio
+async def test_geo_add_and_remove_driver_keep_the_sets_together(redis):
+    keys = ["geo_index:online", "geo_index:available", "drivers_last_seen:geo"]
+
+    await run_script(redis, "geo_add_driver", keys, ["driver-1", 51.389, 35.6892, "1", 100])
+    assert [await redis.zscore(key, "driver-1") is not None for key in keys] == [True, True, True]
+
+    await run_script(redis, "geo_add_driver", keys, ["driver-1", 51.390, 35.6892, "0", 110])
+    assert await redis.zscore(keys[1], "driver-1") is None
+    assert await redis.zscore(keys[2], "driver-1") == 110
+
+    await run_script(redis, "geo_remove_driver", keys, ["driver-1"])
+    assert await redis.keys("*") == []
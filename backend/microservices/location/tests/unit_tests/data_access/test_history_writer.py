@@ -0,0 +1,179 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from config import LocationConfig
+from data_access.history_writer import HISTORY_FLUSH_RETRIES, HISTORY_ROWS_DROPPED, LocationHistoryWriter
+from data_access.repository import DatabaseRepository
+from dto import DriverLocationDTO
+from test_doubles.postgres import FakeAsyncPostgres
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_locations(count: int, driver_id: str = "driver-1"):
+    return [
+        DriverLocationDTO(
+            driver_id=driver_id,
+            latitude=35.6892,
+            longitude=51.389,
+            accuracy=5.0,
+            speed=10.0,
+            bearing=90.0,
+            timestamp=BASE_TIME + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+async def start_writer(**config) -> LocationHistoryWriter:
+    writer = LocationHistoryWriter(LocationConfig(**config))
+    writer._task = asyncio.create_task(writer._run())
+    LocationHistoryWriter._instance = writer
+    return writer
+
+
+async def wait_for_rows(postgres: FakeAsyncPostgres, count: int, timeout: float = 1.0) -> None:
+    async def poll():
+        while len(postgres.rows) < count:
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest_asyncio.fixture
+async def fake_postgres():
+    postgres = FakeAsyncPostgres()
+    DatabaseRepository._data_access = postgres
+    yield postgres
+    await LocationHistoryWriter.terminate()
+
+
+@pytest.mark.asyncio
+async def test_writer_flushes_when_batch_size_is_reached(fake_postgres):
+    await start_writer(history_flush_interval_ms=1_000, history_flush_batch_size=3, history_buffer_size=100)
+
+    await LocationHistoryWriter.enqueue(make_locations(3))
+
+    # Well before the 1s interval, so only the batch size can have triggered the flush.
+    await wait_for_rows(fake_postgres, 3, timeout=0.5)
+    assert fake_postgres.stats["round_trips"] == 2
+
+@pytest.mark.asyncio
+async def test_writer_flushes_partial_batch_after_interval(fake_postgres):
+    await start_writer(history_flush_interval_ms=50, history_flush_batch_size=100, history_buffer_size=100)
+
+    await LocationHistoryWriter.enqueue(make_locations(2))
+    await asyncio.sleep(0.01)
+    assert fake_postgres.rows == []
+
+    await wait_for_rows(fake_postgres, 2)
+
+@pytest.mark.asyncio
+async def test_enqueue_waits_when_buffer_is_full(fake_postgres):
+    writer = LocationHistoryWriter(LocationConfig(history_flush_batch_size=100, history_buffer_size=2))
+    LocationHistoryWriter._instance = writer
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(LocationHistoryWriter.enqueue(make_locations(3)), 0.05)
+
+    assert writer._queue.qsize() == 2
+    LocationHistoryWriter._instance = None
+
+@pytest.mark.asyncio
+async def test_terminate_drains_buffered_locations(fake_postgres):
+    await start_writer(history_flush_interval_ms=1_000, history_flush_batch_size=100, history_buffer_size=100)
+    await LocationHistoryWriter.enqueue(make_locations(5))
+
+    await LocationHistoryWriter.terminate()
+
+    assert len(fake_postgres.rows) == 5
+    assert LocationHistoryWriter._instance is None
+
+@pytest.mark.asyncio
+async def test_failing_row_is_dropped_without_losing_the_batch(fake_postgres, monkeypatch):
+    bulk_insert = DatabaseRepository.bulk_insert.__func__
+
+    async def reject_driver(cls, dto_instances, **kwargs):
+        if any(dto.driver_id == "driver-bad" for dto in dto_instances):
+            raise IntegrityError("INSERT", None, Exception("insert rejected"))
+        return await bulk_insert(cls, dto_instances, **kwargs)
+
+    monkeypatch.setattr(DatabaseRepository, "bulk_insert", classmethod(reject_driver))
+    dropped_before = HISTORY_ROWS_DROPPED._value.get()
+    await start_writer(history_flush_interval_ms=1_000, history_flush_batch_size=100, history_buffer_size=100)
+
+    await LocationHistoryWriter.enqueue(make_locations(3) + make_locations(1, driver_id="driver-bad") + make_locations(3, driver_id="driver-2"))
+    await LocationHistoryWriter.terminate()
+
+    assert sorted(row["driver_id"] for row in fake_postgres.rows) == ["driver-1"] * 3 + ["driver-2"] * 3
+    assert HISTORY_ROWS_DROPPED._value.get() - dropped_before == 1
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried_without_bisecting(fake_postgres, monkeypatch):
+    bulk_insert = DatabaseRepository.bulk_insert.__func__
+    calls = []
+
+    async def drop_connection_twice(cls, dto_instances, **kwargs):
+        calls.append(len(dto_instances))
+        if len(calls) <= 2:
+            raise OperationalError("INSERT", None, ConnectionResetError("connection reset by peer"))
+        return await bulk_insert(cls, dto_instances, **kwargs)
+
+    monkeypatch.setattr(DatabaseRepository, "bulk_insert", classmethod(drop_connection_twice))
+    retries_before, dropped_before = HISTORY_FLUSH_RETRIES._value.get(), HISTORY_ROWS_DROPPED._value.get()
+    await start_writer(
+        history_flush_interval_ms=1_000, history_flush_batch_size=100, history_buffer_size=100,
+        history_flush_retry_backoff_ms=1,
+    )
+
+    await LocationHistoryWriter.enqueue(make_locations(8))
+    await LocationHistoryWriter.terminate()
+
+    assert calls == [8, 8, 8]
+    assert len(fake_postgres.rows) == 8
+    assert HISTORY_FLUSH_RETRIES._value.get() - retries_before == 2
+    assert HISTORY_ROWS_DROPPED._value.get() == dropped_before
+
+@pytest.mark.asyncio
+async def test_batch_is_dropped_once_retries_are_exhausted(fake_postgres, monkeypatch):
+    calls = []
+
+    async def database_down(cls, dto_instances, **kwargs):
+        calls.append(len(dto_instances))
+        raise OperationalError("INSERT", None, ConnectionRefusedError("connection refused"))
+
+    monkeypatch.setattr(DatabaseRepository, "bulk_insert", classmethod(database_down))
+    dropped_before = HISTORY_ROWS_DROPPED._value.get()
+    await start_writer(
+        history_flush_interval_ms=1_000, history_flush_batch_size=100, history_buffer_size=100,
+        history_flush_max_retries=3, history_flush_retry_backoff_ms=1,
+    )
+
+    await LocationHistoryWriter.enqueue(make_locations(8))
+    await LocationHistoryWriter.terminate()
+
+    assert calls == [8] * 4
+    assert HISTORY_ROWS_DROPPED._value.get() - dropped_before == 8
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_default_partition", [False, True])
+async def test_out_of_window_timestamps_do_not_lose_the_batch(fake_postgres, with_default_partition):
+    await DatabaseRepository.create_daily_partitions(DriverLocationDTO, [BASE_TIME.date()])
+    if with_default_partition:
+        fake_postgres.add_default_partition("driver_location")
+    stale, future = make_locations(1, driver_id="driver-stale"), make_locations(1, driver_id="driver-future")
+    stale[0].timestamp = BASE_TIME - timedelta(days=90)
+    future[0].timestamp = BASE_TIME + timedelta(days=30)
+    await start_writer(history_flush_interval_ms=1_000, history_flush_batch_size=100, history_buffer_size=100)
+
+    await LocationHistoryWriter.enqueue(stale + make_locations(3) + future + make_locations(3, driver_id="driver-2"))
+    await LocationHistoryWriter.terminate()
+
+    stored = sorted(row["driver_id"] for row in fake_postgres.rows)
+    expected = ["driver-1"] * 3 + ["driver-2"] * 3
+    if with_default_partition:
+        expected += ["driver-future", "driver-stale"]
+    assert stored == sorted(expected)
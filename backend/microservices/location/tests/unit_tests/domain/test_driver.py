@@ -0,0 +1,72 @@
+import pytest
+
+from ftgo_utils.enums import DriverStatus, DriverAvailabilityStatus
+from ftgo_utils.errors import ErrorCodes
+
+from data_access.repository import CacheRepository, DatabaseRepository
+from domain.driver import Driver
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+from test_doubles.postgres import FakeAsyncPostgres
+
+@pytest.mark.asyncio
+async def test_driver_load_many_reads_statuses_in_one_round_trip(cache_repository, fake_redis, time_machine):
+    status_cache = Driver.get_status_cache()
+    await status_cache.insert(
+        "driver-1",
+        {"status": DriverStatus.ONLINE.value, "availability": DriverAvailabilityStatus.OCCUPIED.value},
+    )
+    fake_redis.reset_stats()
+
+    drivers = await Driver.load_many(["driver-1", "driver-2"])
+
+    assert fake_redis.stats["round_trips"] == 1
+    assert [driver.status for driver in drivers] == [DriverStatus.ONLINE.value, DriverStatus.OFFLINE.value]
+    assert drivers[0].availability == DriverAvailabilityStatus.OCCUPIED.value
+    assert await Driver.get_status_cache().fetch("driver-2") is None
+
+@pytest.mark.asyncio
+async def test_submit_locations_batch_groups_io_and_reports_per_driver(cache_repository, fake_redis, time_machine):
+    DatabaseRepository._data_access = FakeAsyncPostgres()
+    await CacheRepository.load_scripts()
+    online = {"status": DriverStatus.ONLINE.value, "availability": DriverAvailabilityStatus.AVAILABLE.value}
+    await Driver.get_status_cache().insert(["driver-1", "driver-2", "driver-3"], [online, online, online])
+    location = {
+        "latitude": 35.6892,
+        "longitude": 51.389,
+        "timestamp": time_machine.current_timestamp(),
+        "accuracy": 5.0,
+        "speed": 10.0,
+        "bearing": 90.0,
+    }
+    fake_redis.reset_stats()
+
+    results = await Driver.submit_locations_batch([
+        {"driver_id": "driver-1", "locations": [location]},
+        {"driver_id": "driver-2", "locations": [location]},
+        {"driver_id": "driver-3", "locations": ["not-a-location"]},
+    ])
+
+    assert results == [
+        {"driver_id": "driver-1", "success": True},
+        {"driver_id": "driver-2", "success": True},
+        {"driver_id": "driver-3", "success": False, "error_code": ErrorCodes.LOCATION_SAVE_ERROR.value},
+    ]
+    assert fake_redis.stats["round_trips"] == 5
+    assert len(DatabaseRepository._data_access.rows) == 2
+
+@pytest.mark.asyncio
+async def test_get_nearest_drivers_fills_top_k_past_expired_statuses(cache_repository, time_machine):
+    status_ttl = 60
+    available = {"status": DriverStatus.ONLINE.value, "availability": DriverAvailabilityStatus.AVAILABLE.value}
+    for index in range(4):
+        location = GeoLocation(latitude=35.6892 + index * 0.0001, longitude=51.389, timestamp=0)
+        await Hexagon.add_driver(f"driver-{index}", location, is_available=True)
+    # The two nearest drivers' status keys expire while their index entries remain.
+    await Driver.get_status_cache().insert(["driver-0", "driver-1"], [available, available], ttl=status_ttl)
+    await Driver.get_status_cache().insert(["driver-2", "driver-3"], [available, available])
+    time_machine.advance_time(status_ttl + 1)
+
+    drivers = await Driver.get_nearest_drivers(35.6892, 51.389, radius_m=500, max_driver_count=2)
+
+    assert [driver["driver_id"] for driver in drivers] == ["driver-2", "driver-3"]
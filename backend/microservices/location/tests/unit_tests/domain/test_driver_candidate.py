@@ -0,0 +1,33 @@
+import numpy as np
+
+from domain.driver_candidate import DriverCandidate, DriverCandidateBatch
+
+def make_batch(distances):
+    return DriverCandidateBatch(
+        [f"driver-{i}" for i in range(len(distances))],
+        np.arange(len(distances), dtype=np.float64),
+        np.arange(len(distances), dtype=np.float64) + 0.5,
+        np.asarray(distances, dtype=np.float64),
+    )
+
+def test_driver_candidate_batch_top_k_returns_closest_candidates():
+    batch = make_batch([30.0, 10.0, 20.0])
+
+    assert batch.top_k(2) == [
+        DriverCandidate("driver-1", 1.0, 1.5, 10.0),
+        DriverCandidate("driver-2", 2.0, 2.5, 20.0),
+    ]
+
+def test_driver_candidate_batch_within_and_concat():
+    batch = DriverCandidateBatch.concat([make_batch([5.0, 50.0]), make_batch([15.0])])
+    nearby = batch.within(20.0)
+
+    assert len(nearby) == 2
+    assert nearby.count_within(10.0) == 1
+    assert [candidate.driver_id for candidate in nearby.top_k()] == ["driver-0", "driver-0"]
+    assert DriverCandidate("driver-0", 0.0, 0.5, 5.0).to_dict() == {
+        "driver_id": "driver-0",
+        "latitude": 0.0,
+        "longitude": 0.5,
+        "distance": 5.0,
+    }
@@ -0,0 +1,74 @@
+import pytest
+
+from config import HexagonConfig
+from domain.geo_index import GeoIndex
+from domain.geo_location import GeoLocation
+
+LATITUDE, LONGITUDE = 35.6892, 51.3890
+
+async def nearest_driver_ids(available_only: bool = False):
+    drivers = await GeoIndex.get_nearest_drivers(LATITUDE, LONGITUDE, radius_m=500, available_only=available_only)
+    return [driver.driver_id for driver in drivers]
+
+@pytest.mark.asyncio
+async def test_geo_index_add_driver_indexes_available_drivers_separately(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+
+    await GeoIndex.add_driver("driver-available", location, is_available=True)
+    await GeoIndex.add_driver("driver-occupied", location, is_available=False)
+
+    assert await nearest_driver_ids(available_only=True) == ["driver-available"]
+    assert sorted(await nearest_driver_ids()) == ["driver-available", "driver-occupied"]
+
+@pytest.mark.asyncio
+async def test_geo_index_add_driver_is_one_script_call(cache_repository, fake_redis, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await GeoIndex.add_driver("driver-1", location, is_available=True)
+    fake_redis.reset_stats()
+
+    await GeoIndex.add_driver("driver-1", location, is_available=False)
+
+    assert fake_redis.stats["commands"] == 1
+    assert await nearest_driver_ids(available_only=True) == []
+
+@pytest.mark.asyncio
+async def test_geo_index_add_drivers_applies_each_availability(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await GeoIndex.add_driver("driver-2", location, is_available=True)
+
+    await GeoIndex.add_drivers([("driver-1", location, True), ("driver-2", location, False)])
+
+    assert await nearest_driver_ids(available_only=True) == ["driver-1"]
+    assert sorted(await nearest_driver_ids()) == ["driver-1", "driver-2"]
+
+@pytest.mark.asyncio
+async def test_geo_index_set_driver_availability_updates_available_set(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await GeoIndex.add_driver("driver-1", location, is_available=True)
+
+    await GeoIndex.set_driver_availability("driver-1", False)
+    assert await nearest_driver_ids(available_only=True) == []
+
+    await GeoIndex.set_driver_availability("driver-1", True)
+    assert await nearest_driver_ids(available_only=True) == ["driver-1"]
+
+@pytest.mark.asyncio
+async def test_geo_index_remove_driver_clears_every_set(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await GeoIndex.add_driver("driver-1", location, is_available=True)
+
+    await GeoIndex.remove_driver("driver-1")
+
+    assert await nearest_driver_ids() == []
+    assert await nearest_driver_ids(available_only=True) == []
+    assert await GeoIndex.evict_stale_drivers() == []
+
+@pytest.mark.asyncio
+async def test_geo_index_evict_stale_drivers_removes_silent_drivers(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await GeoIndex.add_driver("driver-silent", location, is_available=True)
+    time_machine.advance_time(HexagonConfig.snapshot().stale_driver_threshold_s)
+    await GeoIndex.add_driver("driver-active", location, is_available=True)
+
+    assert await GeoIndex.evict_stale_drivers() == ["driver-silent"]
+    assert await nearest_driver_ids() == ["driver-active"]
@@ -0,0 +1,43 @@
+import pytest
+
+from domain.geo_location import GeoLocation
+from domain.hexagon import Hexagon
+
+LATITUDE, LONGITUDE = 35.6892, 51.3890
+
+@pytest.mark.asyncio
+async def test_hexagon_available_only_search_skips_occupied_drivers(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await Hexagon.add_driver("driver-available", location, is_available=True)
+    await Hexagon.add_driver("driver-occupied", location, is_available=False)
+
+    available = await Hexagon.get_nearest_drivers(LATITUDE, LONGITUDE, radius_m=100, available_only=True)
+    online = await Hexagon.get_nearest_drivers(LATITUDE, LONGITUDE, radius_m=100)
+
+    assert [driver.driver_id for driver in available] == ["driver-available"]
+    assert {driver.driver_id for driver in online} == {"driver-available", "driver-occupied"}
+
+@pytest.mark.asyncio
+async def test_hexagon_set_driver_availability_updates_available_index(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await Hexagon.add_driver("driver-1", location, is_available=True)
+
+    await Hexagon.set_driver_availability("driver-1", False)
+    assert await Hexagon.get_nearest_drivers(LATITUDE, LONGITUDE, available_only=True) == []
+
+    await Hexagon.set_driver_availability("driver-1", True)
+    drivers = await Hexagon.get_nearest_drivers(LATITUDE, LONGITUDE, available_only=True)
+    assert [driver.driver_id for driver in drivers] == ["driver-1"]
+
+@pytest.mark.asyncio
+async def test_hexagon_evict_stale_drivers_removes_silent_drivers(cache_repository, time_machine):
+    location = GeoLocation(latitude=LATITUDE, longitude=LONGITUDE, timestamp=0)
+    await Hexagon.add_driver("driver-silent", location, is_available=True)
+    time_machine.advance_time(Hexagon(hex_id="", resolution=0).config.stale_driver_threshold_s)
+    await Hexagon.add_driver("driver-active", location, is_available=True)
+
+    evicted = await Hexagon.evict_stale_drivers()
+
+    assert evicted == ["driver-silent"]
+    drivers = await Hexagon.get_nearest_drivers(LATITUDE, LONGITUDE)
+    assert [driver.driver_id for driver in drivers] == ["driver-active"]
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from config import BaseConfig, LocationConfig, TrackSimplifications
+from data_access.repository import DatabaseRepository
+from domain.trajectory import DriverTrajectory
+from dto import DriverLocationDTO
+from test_doubles.postgres import FakeAsyncPostgres
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+async def store_track(driver_id: str, count: int, step_s: int = 10, step_deg: float = 0.001) -> None:
+    await DatabaseRepository.bulk_insert([
+        DriverLocationDTO(
+            driver_id=driver_id,
+            latitude=35.6892 + index * step_deg,
+            longitude=51.389,
+            speed=10.0,
+            bearing=0.0,
+            timestamp=START + timedelta(seconds=index * step_s),
+        )
+        for index in range(count)
+    ])
+
+
+@pytest.fixture
+def fake_postgres():
+    postgres = FakeAsyncPostgres()
+    DatabaseRepository._data_access = postgres
+    return postgres
+
+@pytest.mark.asyncio
+async def test_load_page_walks_the_window_with_cursors(fake_postgres):
+    await store_track("driver-1", 5)
+    await store_track("driver-2", 5)
+    trajectory = DriverTrajectory("driver-1")
+    start, end = START.timestamp(), (START + timedelta(seconds=40)).timestamp()
+
+    pages, cursor = [], None
+    while True:
+        page = await trajectory.load_page(start, end, cursor=cursor, page_size=2)
+        pages.append([point["timestamp"] - start for point in page["points"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == [[0, 10], [20, 30], [40]]
+
+@pytest.mark.asyncio
+async def test_load_page_excludes_points_outside_the_window(fake_postgres):
+    await store_track("driver-1", 5)
+
+    page = await DriverTrajectory("driver-1").load_page(
+        (START + timedelta(seconds=10)).timestamp(), (START + timedelta(seconds=30)).timestamp(),
+    )
+
+    assert [point["timestamp"] - START.timestamp() for point in page["points"]] == [10, 20, 30]
+    assert page["next_cursor"] is None
+
+@pytest.mark.asyncio
+async def test_load_page_clamps_page_size_to_the_configured_maximum(fake_postgres, monkeypatch):
+    monkeypatch.setenv("HISTORY_MAX_PAGE_SIZE", "3")
+    LocationConfig.reload()
+    try:
+        await store_track("driver-1", 5)
+
+        page = await DriverTrajectory("driver-1").load_page(START.timestamp(), START.timestamp() + 60, page_size=100)
+    finally:
+        monkeypatch.delenv("HISTORY_MAX_PAGE_SIZE")
+        BaseConfig.reload()
+
+    assert len(page["points"]) == 3
+    assert page["next_cursor"] == START.timestamp() + 20
+
+@pytest.mark.asyncio
+async def test_load_page_douglas_peucker_keeps_track_endpoints(fake_postgres):
+    await store_track("driver-1", 10)
+
+    page = await DriverTrajectory("driver-1").load_page(
+        START.timestamp(), START.timestamp() + 90,
+        simplification=TrackSimplifications.DOUGLAS_PEUCKER.value, tolerance_m=5.0,
+    )
+
+    assert [point["timestamp"] - START.timestamp() for point in page["points"]] == [0, 90]
+
+@pytest.mark.asyncio
+async def test_load_page_time_bucket_keeps_last_point_per_bucket(fake_postgres):
+    await store_track("driver-1", 10)
+
+    page = await DriverTrajectory("driver-1").load_page(
+        START.timestamp(), START.timestamp() + 90,
+        simplification=TrackSimplifications.TIME_BUCKET.value, bucket_s=30.0,
+    )
+
+    # The last point of each 30s bucket survives.
+    assert [point["timestamp"] - START.timestamp() for point in page["points"]] == [20, 50, 80, 90]
@@ -0,0 +1,29 @@
+import numpy as np
+
+from utils import haversine_m, top_k_indices, douglas_peucker_indices, time_bucket_indices
+
+def test_haversine_m_matches_known_distances():
+    distances = haversine_m(35.0, 51.0, np.array([35.0, 35.01]), np.array([51.0, 51.0]))
+
+    assert distances[0] == 0
+    assert abs(distances[1] - 1111.95) < 0.01
+
+def test_top_k_indices_returns_smallest_values_in_order():
+    values = np.array([5.0, 1.0, 3.0, 0.5, 9.0])
+
+    assert list(top_k_indices(values, 2)) == [3, 1]
+    assert list(top_k_indices(values)) == [3, 1, 2, 0, 4]
+    assert list(top_k_indices(np.array([]), 3)) == []
+
+def test_douglas_peucker_indices_drops_collinear_points():
+    latitudes = np.array([35.0, 35.001, 35.002, 35.003, 35.003])
+    longitudes = np.array([51.0, 51.0, 51.0, 51.0, 51.01])
+
+    assert list(douglas_peucker_indices(latitudes, longitudes, tolerance_m=5)) == [0, 3, 4]
+    assert list(douglas_peucker_indices(latitudes[:2], longitudes[:2], tolerance_m=5)) == [0, 1]
+
+def test_time_bucket_indices_keeps_last_point_per_bucket():
+    timestamps = np.array([0, 10, 59, 60, 61, 130])
+
+    assert list(time_bucket_indices(timestamps, 60)) == [2, 4, 5]
+    assert list(time_bucket_indices(np.array([]), 60)) == []
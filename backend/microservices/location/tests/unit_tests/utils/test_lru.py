@@ -0,0 +1,20 @@
+from utils import LRUCache
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+def test_lru_cache_get_returns_default_on_miss():
+    cache = LRUCache(maxsize=1)
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", "default") == "default"